@@ -0,0 +1,83 @@
+"""
+Async client layer for the Factle generator.
+
+Both upstreams — GitHub Models (through AsyncOpenAI) and Tavily (through a
+small adapter over its REST API) — share one httpx keep-alive connection
+pool with explicit connect/read timeouts, so TLS handshakes are paid once
+per host per run instead of once per call.
+
+Usage:
+    async with AsyncClients(github_token, tavily_key, endpoint) as (llm, search):
+        response = await llm.chat.completions.create(...)
+        results = await search.search(query="...", max_results=5)
+"""
+
+import httpx
+from openai import AsyncOpenAI
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+
+def build_http_client(connect_timeout, read_timeout, max_connections):
+    """Create the shared keep-alive pool used by every async upstream."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
+class AsyncTavilySearch:
+    """Awaitable stand-in for TavilyClient.search() on a shared httpx pool.
+
+    Returns the same {"results": [...]} payload as the sync SDK so the
+    pipeline's result handling works unchanged.
+    """
+
+    def __init__(self, api_key, http_client, url=TAVILY_SEARCH_URL):
+        self.api_key = api_key
+        self.http = http_client
+        self.url = url
+
+    async def search(self, query, max_results=5, timeout=None, **kwargs):
+        """Search Tavily; timeout (seconds) overrides the pool's read timeout."""
+        extra = {} if timeout is None else {"timeout": httpx.Timeout(timeout)}
+        response = await self.http.post(
+            self.url,
+            json={"query": query, "max_results": max_results, **kwargs},
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            **extra,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncClients:
+    """Async context manager yielding (llm, search) over one connection pool."""
+
+    def __init__(self, github_token, tavily_key, endpoint,
+                 connect_timeout=10, read_timeout=120, max_connections=10):
+        self.github_token = github_token
+        self.tavily_key = tavily_key
+        self.endpoint = endpoint
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_connections = max_connections
+        self.http = None
+
+    async def __aenter__(self):
+        self.http = build_http_client(
+            self.connect_timeout, self.read_timeout, self.max_connections
+        )
+        llm = AsyncOpenAI(
+            base_url=self.endpoint,
+            api_key=self.github_token,
+            http_client=self.http,
+        )
+        search = AsyncTavilySearch(self.tavily_key, self.http)
+        return llm, search
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.http.aclose()
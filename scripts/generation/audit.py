@@ -0,0 +1,131 @@
+"""
+Worker-pool machinery for re-auditing the published question archive.
+
+Kept free of any pipeline logic: generate_question.py supplies the function
+that audits one question; this module provides the rate limiting, the
+resumable per-question result cache and the bounded-time worker pool.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls evenly at calls_per_minute."""
+
+    def __init__(self, calls_per_minute):
+        self.interval = 60.0 / calls_per_minute if calls_per_minute else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may make its next call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def question_cache_key(question):
+    """Key an archived question by id plus a hash of what it asserts.
+
+    Editing the question text or answers invalidates its cached result.
+    """
+    payload = json.dumps([question.get("question"), question.get("answers")], ensure_ascii=False)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+    return f"{question.get('id')}:{digest}"
+
+
+class AuditCache:
+    """Per-question audit results persisted after every write, for resume."""
+
+    def __init__(self, path, ttl_days):
+        self.path = path
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+        self.results = {}
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                self.results = json.load(f).get("results", {})
+
+    def get(self, key):
+        """Return a cached result that is still within its TTL, else None."""
+        result = self.results.get(key)
+        if not result:
+            return None
+        audited = datetime.fromisoformat(result["audited_at"])
+        age_days = (datetime.now(timezone.utc) - audited).total_seconds() / 86400
+        return result if age_days <= self.ttl_days else None
+
+    def put(self, key, result):
+        result["audited_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock:
+            self.results[key] = result
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"results": self.results}, f, indent=2, ensure_ascii=False)
+
+
+def run_audit(questions, audit_fn, cache, workers=4, deadline_seconds=None, max_new=None):
+    """Audit questions on a thread pool, reusing fresh cached results.
+
+    Args:
+        questions:        archived question entries to audit
+        audit_fn:         callable(question) -> result dict
+        cache:            AuditCache (results are stored as they finish)
+        workers:          pool size
+        deadline_seconds: stop starting new audits after this long
+        max_new:          cap on uncached audits this run (quota guard)
+
+    Returns:
+        (results, stats) where results maps cache key -> result for every
+        question that has one, and stats counts cached/audited/skipped.
+    """
+    started = time.monotonic()
+    results = {}
+    pending = []
+    for q in questions:
+        key = question_cache_key(q)
+        cached = cache.get(key)
+        if cached:
+            results[key] = cached
+        else:
+            pending.append((key, q))
+
+    stats = {"cached": len(results), "audited": 0, "skipped": 0, "errors": 0}
+    if max_new is not None and len(pending) > max_new:
+        stats["skipped"] += len(pending) - max_new
+        pending = pending[:max_new]
+
+    lock = threading.Lock()
+
+    def work(key, q):
+        if deadline_seconds is not None and time.monotonic() - started > deadline_seconds:
+            with lock:
+                stats["skipped"] += 1
+            return
+        try:
+            result = audit_fn(q)
+        except Exception as exc:
+            result = {"id": q.get("id"), "verdict": "error", "reason": f"{type(exc).__name__}: {exc}"}
+            with lock:
+                stats["errors"] += 1
+        else:
+            cache.put(key, result)
+        with lock:
+            results[key] = result
+            stats["audited"] += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for key, q in pending:
+            pool.submit(work, key, q)
+
+    return results, stats
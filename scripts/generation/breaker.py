@@ -0,0 +1,201 @@
+"""
+Circuit breakers for the pipeline's upstreams (Tavily, each model).
+
+When an upstream is down, every call to it otherwise waits out its own
+timeouts and retry sleeps before failing.  A CircuitBreaker counts
+consecutive failures; at failure_threshold it opens and calls fail fast with
+CircuitOpenError, so the caller can switch to its fallback at once.  After
+reset_seconds one probe call is let through (half-open): success closes the
+circuit, failure re-opens it for another reset_seconds.
+
+A BreakerBoard holds one breaker per upstream name, shared by every call
+site in the run, and can save/load their state so the next run (or a
+manual re-run minutes later) starts out knowing what was down.
+
+Usage:
+    BREAKERS = BreakerBoard(failure_threshold=3, reset_seconds=60)
+    response = BREAKERS.get("llm:gpt-4o").call(llm.chat.completions.create, **kwargs)
+    search = Guarded(TavilyClient(api_key=...), BREAKERS.get("search"))
+"""
+
+import json
+import threading
+import time
+from functools import partial
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, name, retry_in):
+        super().__init__(f"circuit for {name} is open (next probe in {retry_in:.0f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed → open after failure_threshold consecutive failures → half-open
+    (one probe) after reset_seconds.
+
+    is_failure(exc) decides which exceptions count against the upstream
+    (e.g. not a 400 caused by our own request).
+    """
+
+    def __init__(self, name, failure_threshold=3, reset_seconds=60, is_failure=None, clock=time.time):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.is_failure = is_failure or (lambda exc: True)
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.stats = {"opened": 0, "fast_fails": 0, "probes": 0}
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        return self.state == OPEN
+
+    def retry_in(self):
+        if self.state != OPEN:
+            return 0.0
+        return max(self.opened_at + self.reset_seconds - self.clock(), 0.0)
+
+    def allow(self):
+        """Whether a call may go out now (claims the probe when half-opening)."""
+        with self._lock:
+            if self.state == OPEN and self.clock() - self.opened_at >= self.reset_seconds:
+                self.state = HALF_OPEN
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                self.stats["probes"] += 1
+                return True
+            self.stats["fast_fails"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.stats["opened"] += 1
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+    def check(self):
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def _settle(self, exc):
+        if exc is None:
+            self.record_success()
+        elif self.is_failure(exc):
+            self.record_failure()
+        else:
+            # The upstream answered; the request itself was at fault
+            self.record_success()
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) through the breaker."""
+        self.check()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:
+            self._settle(exc)
+            raise
+        self._settle(None)
+        return result
+
+    async def call_async(self, fn, *args, **kwargs):
+        """await fn(*args, **kwargs) through the breaker."""
+        self.check()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as exc:
+            self._settle(exc)
+            raise
+        self._settle(None)
+        return result
+
+
+class BreakerBoard:
+    """One CircuitBreaker per upstream name, created on first use."""
+
+    def __init__(self, failure_threshold=3, reset_seconds=60, is_failure=None, clock=time.time):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.is_failure = is_failure
+        self.clock = clock
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(
+                    name, self.failure_threshold, self.reset_seconds, self.is_failure, self.clock
+                )
+            return self.breakers[name]
+
+    def summary(self):
+        """{name: state, failures and stats} for breakers that saw trouble."""
+        return {
+            name: {"state": b.state, "failures": b.failures, **b.stats}
+            for name, b in self.breakers.items()
+            if b.state != CLOSED or any(b.stats.values())
+        }
+
+    def save(self, path):
+        """Persist open/half-open circuits (closed ones need no memory)."""
+        state = {
+            name: {"state": OPEN, "failures": b.failures, "opened_at": b.opened_at}
+            for name, b in self.breakers.items()
+            if b.state != CLOSED
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+
+    def load(self, path):
+        """Restore circuits saved by an earlier run; returns how many are open."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        for name, saved in state.items():
+            breaker = self.get(name)
+            breaker.state = OPEN
+            breaker.failures = saved.get("failures", 0)
+            breaker.opened_at = saved.get("opened_at") or self.clock()
+        return len(state)
+
+
+class Guarded:
+    """Proxy that routes a client's method calls through a breaker.
+
+    With is_async the methods are awaited (breaker.call_async).
+    """
+
+    def __init__(self, client, breaker, is_async=False):
+        self.client = client
+        self.breaker = breaker
+        self.is_async = is_async
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+        return partial(self.breaker.call_async if self.is_async else self.breaker.call, attr)
@@ -0,0 +1,190 @@
+"""
+Deterministic consistency checks for a ranked answer list and its values.
+
+The cross-check model reports a numeric value per answer (medal counts,
+lengths, revenue...).  check_consistency() verifies, without any model or
+network call, that:
+
+    - the values run in the question's direction (largest first unless the
+      question asks for the fewest/smallest/earliest...)
+    - each value matches a number printed next to that answer in the
+      verification sources, within a relative tolerance.  Only value
+      columns count: a table row's rank cell, the answer's own cell and
+      year-like numbers are skipped, and a number is read in another unit
+      only when a unit word follows it ("6.4 billion" backs 6.4 or 6.4e9,
+      a bare "2" backs only 2)
+    - no adjacent pair has a suspicious gap (an order-of-magnitude jump
+      usually means a unit slip), and which answers are tied
+
+It returns a report saying whether the list is consistent, plus the adjacent
+pair most in dispute, so a follow-up search can target exactly that pair.
+"""
+
+import re
+
+NUMBER_RE = re.compile(
+    r"(?<![\w.])(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*"
+    r"(thousand|million|billion|trillion|bn|mn|[kmb])?\b",
+    re.IGNORECASE,
+)
+SCALES = {
+    "thousand": 1e3, "k": 1e3,
+    "million": 1e6, "mn": 1e6, "m": 1e6,
+    "billion": 1e9, "bn": 1e9, "b": 1e9,
+    "trillion": 1e12,
+}
+ASCENDING_CUES = re.compile(
+    r"\b(fewest|least|smallest|lowest|shortest|earliest|oldest first|cheapest|slowest|"
+    r"ascending|from (the )?(lowest|smallest|fewest|earliest))\b",
+    re.IGNORECASE,
+)
+RANK_CELL_RE = re.compile(r"(?:#|no\.?\s*|t-?|=)?\d{1,3}(?:st|nd|rd|th|\.|=)?", re.IGNORECASE)
+YEARS = (1800, 2100)      # bare integers in this range date a row rather than measure it
+NAME_WINDOW_CHARS = 120   # how far after an answer's mention to look for its number
+GAP_RATIO = 10.0          # adjacent values further apart than this are suspicious
+
+
+def is_year(digits):
+    return len(digits) == 4 and digits.isdigit() and YEARS[0] <= int(digits) <= YEARS[1]
+
+
+def parse_numbers(text):
+    """Each number in text, as the list of values it can back.
+
+    A number with a unit word after it can be quoted in full or in that
+    unit ("6.4 billion" -> [6.4e9, 6.4]); a bare number only as itself.
+    Bare year-like integers are skipped.
+    """
+    numbers = []
+    for digits, scale in NUMBER_RE.findall(text or ""):
+        try:
+            value = float(digits.replace(",", ""))
+        except ValueError:
+            continue
+        if scale:
+            numbers.append([value * SCALES[scale.lower()], value])
+        elif not is_year(digits):
+            numbers.append([value])
+    return numbers
+
+
+def expected_direction(question_text):
+    """'asc' if the question ranks from the smallest/earliest, else 'desc'."""
+    return "asc" if ASCENDING_CUES.search(question_text or "") else "desc"
+
+
+def row_numbers(line, needle):
+    """Numbers in a table row's value cells: not its leading rank cell, nor
+    the cell naming the answer."""
+    numbers = []
+    for i, cell in enumerate(c.strip() for c in line.split("|")):
+        if needle in cell.lower() or (i == 0 and RANK_CELL_RE.fullmatch(cell)):
+            continue
+        numbers.extend(parse_numbers(cell))
+    return numbers
+
+
+def numbers_near(name, sources):
+    """Numbers in the value cells of each table row mentioning name, or the
+    first number after a mention in prose (see parse_numbers)."""
+    found = []
+    needle = (name or "").strip().lower()
+    if not needle:
+        return found
+    for source in sources:
+        text = source.get("content", "")
+        lowered = text.lower()
+        start = lowered.find(needle)
+        while start != -1:
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            line = text[line_start:line_end if line_end != -1 else len(text)]
+            if "|" in line:
+                # Table row (as rendered by page_fetcher): its numbers belong to this answer
+                found.extend(row_numbers(line, needle))
+            else:
+                # Prose: only the first number after the mention
+                window = text[start + len(needle):start + len(needle) + NAME_WINDOW_CHARS]
+                found.extend(parse_numbers(window)[:1])
+            start = lowered.find(needle, start + len(needle))
+    return found
+
+
+def matches(value, candidates, tolerance):
+    """Whether value equals one of a candidate number's readings within
+    relative tolerance."""
+    for readings in candidates:
+        for target in readings:
+            if target and abs(value - target) <= tolerance * abs(target):
+                return True
+            if not target and value == 0:
+                return True
+    return False
+
+
+def _as_float(v):
+    if isinstance(v, bool):
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def check_consistency(question_text, answers, values, sources, tolerance=0.02, min_backed=4):
+    """Check a ranked list's values for order, source support, gaps and ties.
+
+    Returns a dict:
+        consistent: all values known, in order, no suspicious gap, and at
+                    least min_backed of them found in the sources
+        direction, order_violations, ties, gaps, backed (per answer),
+        disputed:   the adjacent (upper, lower) answer pair to re-check
+                    first, or None
+    """
+    vals = [_as_float(v) for v in (values or [])]
+    report = {
+        "direction": expected_direction(question_text),
+        "order_violations": [],
+        "ties": [],
+        "gaps": [],
+        "backed": [],
+        "disputed": None,
+        "consistent": False,
+    }
+    if len(vals) != len(answers) or any(v is None for v in vals):
+        report["reason"] = "values missing"
+        return report
+
+    sign = 1 if report["direction"] == "desc" else -1
+    for i in range(len(vals) - 1):
+        a, b = vals[i], vals[i + 1]
+        if sign * (a - b) < 0:
+            report["order_violations"].append([answers[i], answers[i + 1]])
+        elif a == b:
+            if report["ties"] and report["ties"][-1][-1] == answers[i]:
+                report["ties"][-1].append(answers[i + 1])
+            else:
+                report["ties"].append([answers[i], answers[i + 1]])
+        low, high = sorted((abs(a), abs(b)))
+        if low and high / low > GAP_RATIO:
+            report["gaps"].append([answers[i], answers[i + 1]])
+
+    report["backed"] = [matches(v, numbers_near(name, sources), tolerance) for name, v in zip(answers, vals)]
+
+    # The pair to re-check: an order violation, else a gap, else the first
+    # adjacent pair with an unbacked member
+    for pair in report["order_violations"] + report["gaps"]:
+        report["disputed"] = pair
+        break
+    else:
+        for i in range(len(answers) - 1):
+            if not (report["backed"][i] and report["backed"][i + 1]):
+                report["disputed"] = [answers[i], answers[i + 1]]
+                break
+
+    report["consistent"] = (
+        not report["order_violations"]
+        and not report["gaps"]
+        and sum(report["backed"]) >= min_backed
+    )
+    return report
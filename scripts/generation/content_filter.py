@@ -0,0 +1,119 @@
+"""
+Compiled content filter for Factle topics, questions and options.
+
+Blocked phrases are matched on whole words (so "race" never fires on
+"embrace" or "grace"), with light plural/possessive folding so "shootings"
+still hits "shooting"; verb forms are not folded, so each inflection that
+should block is its own rule.  All phrases — blocked and allowlisted — are compiled
+into a single Aho-Corasick automaton over word tokens, so each text is
+scanned in one pass regardless of how many rules there are.
+
+Allowlisted phrases (e.g. "space race", "horse race") suppress any blocked
+match that lies entirely inside them.
+"""
+
+import re
+from collections import deque
+
+TOKEN_RE = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+
+def stem(token):
+    """Fold possessives and plurals so 'shootings' and 'shooting' match.
+
+    Deliberately conservative: verb and agent endings (-ing, -ed, -er) are
+    kept, otherwise 'racing' and 'racer' would fold onto the blocked word
+    'race'.  A blocked word's inflected forms are listed as rules of their
+    own instead ('murder', 'murdered', 'murderer').
+    """
+    if token.endswith("'s"):
+        token = token[:-2]
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 4 and token.endswith(("sses", "xes", "ches", "shes")):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Split text into lowercase, stemmed word tokens."""
+    return [stem(t) for t in TOKEN_RE.findall((text or "").lower())]
+
+
+class ContentFilter:
+    """Single-pass multi-phrase matcher with word boundaries and an allowlist.
+
+    Args:
+        blocked: iterable of phrases that make a text inappropriate
+        allowed: iterable of phrases that are fine even though they contain
+                 a blocked phrase (e.g. "space race")
+    """
+
+    def __init__(self, blocked, allowed=()):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for phrase in blocked:
+            self._add(phrase, "block")
+        for phrase in allowed:
+            self._add(phrase, "allow")
+        self._build()
+
+    def _add(self, phrase, kind):
+        tokens = tokenize(phrase)
+        if not tokens:
+            return
+        state = 0
+        for tok in tokens:
+            nxt = self._goto[state].get(tok)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][tok] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((kind, phrase, len(tokens)))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and tok not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(tok, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text):
+        """Return every blocked match in text that is not allowlisted.
+
+        Each match is a dict with the rule that fired and the text it
+        matched, ready to be dropped into the run log.
+        """
+        tokens = tokenize(text)
+        blocks, allows = [], []
+        state = 0
+        for end, tok in enumerate(tokens):
+            while state and tok not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(tok, 0)
+            for kind, phrase, length in self._out[state]:
+                span = (end - length + 1, end + 1)
+                (blocks if kind == "block" else allows).append((phrase, span))
+
+        hits = []
+        for phrase, (start, stop) in blocks:
+            if any(a_start <= start and stop <= a_stop for _, (a_start, a_stop) in allows):
+                continue
+            hits.append({"rule": phrase, "match": " ".join(tokens[start:stop])})
+        return hits
+
+    def check(self, text):
+        """Return the first blocked match in text, or None if it is clean."""
+        hits = self.scan(text)
+        return hits[0] if hits else None
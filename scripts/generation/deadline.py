@@ -0,0 +1,90 @@
+"""
+Wall-clock budget for one generator run.
+
+The run gets a fixed deadline.  Before starting another topic attempt,
+verification iteration or search retry, the pipeline asks the budget whether
+that step is still affordable, estimating its cost from how long the same
+step has actually taken so far this run (the tracer's finished spans), or
+from a conservative prior if it has not run yet.  Per-call HTTP timeouts are
+clipped to the time that is left, so a single hung request cannot overrun
+the deadline either.
+
+A slice of the budget (margin_seconds) is held back for the reserve-bank
+failover and for saving, so a run that gives up on live attempts still ends
+cleanly inside its deadline.
+
+An unstarted budget is unlimited, so offline commands and the reserve
+filler are unaffected.
+"""
+
+import time
+
+
+class RunBudget:
+    """Deadline plus latency-based affordability checks.
+
+    Args:
+        tracer: Tracer whose finished spans supply measured step latencies
+        priors: {span name: seconds} used until a step has been measured
+    """
+
+    def __init__(self, tracer, priors):
+        self.tracer = tracer
+        self.priors = priors
+        self.started = None
+        self.total_seconds = None
+        self.margin_seconds = 0
+        self.decisions = []
+
+    def start(self, total_seconds, margin_seconds=0):
+        self.started = time.monotonic()
+        self.total_seconds = total_seconds
+        self.margin_seconds = margin_seconds
+        self.decisions = []
+
+    def elapsed(self):
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def remaining(self):
+        """Seconds left for live work (excluding the failover margin)."""
+        if self.started is None:
+            return float("inf")
+        return self.total_seconds - self.margin_seconds - self.elapsed()
+
+    def estimate(self, name):
+        """Expected seconds for one span called name: the 90th percentile of
+        this run's measurements, or the prior if none yet."""
+        durations = sorted(self.tracer.durations(name))
+        if not durations:
+            return self.priors.get(name, 0)
+        return durations[min(len(durations) - 1, int(len(durations) * 0.9))]
+
+    def can_afford(self, *names, extra_seconds=0):
+        return sum(self.estimate(n) for n in names) + extra_seconds <= self.remaining()
+
+    def check(self, what, *names, extra_seconds=0):
+        """can_afford that records a refusal, for the run log."""
+        needed = sum(self.estimate(n) for n in names) + extra_seconds
+        left = self.remaining()
+        if needed <= left:
+            return True
+        self.decisions.append({
+            "skipped": what,
+            "at_s": round(self.elapsed(), 1),
+            "needed_s": round(needed, 1),
+            "left_s": round(max(left, 0), 1),
+        })
+        return False
+
+    def timeout_for(self, cap, floor=5):
+        """Per-call timeout: cap, clipped to the remaining budget (None if unstarted)."""
+        if self.started is None:
+            return None
+        return max(floor, min(cap, self.remaining()))
+
+    def summary(self):
+        return {
+            "deadline_s": self.total_seconds,
+            "elapsed_s": round(self.elapsed(), 1),
+            "skipped": self.decisions,
+        }
@@ -0,0 +1,123 @@
+"""
+Content-addressed store for the search evidence recorded in run logs.
+
+Every run log lists the sources it saw: discovery search results and the
+sources found by each verification and re-verification search.  The same
+pages (Wikipedia lists, worldometers, governing bodies...) come up run after
+run, so the log stores each source once, in an append-only JSONL file keyed
+by a hash of the source (URL, title and content), and refers to it by that
+hash:
+
+    "sources_found": ["3f9a0c1d2e4b5a69", "b07e4d1c9a2f3e58"]
+
+compact() swaps sources for references (storing any new ones), hydrate()
+swaps them back.  Only new sources are ever written, so committing a run
+appends a few lines instead of rewriting every snippet it saw.
+
+Usage:
+    store = EvidenceStore(path)
+    record = compact(run_log, store)
+    store.flush()                   # before the log that references them
+    run = hydrate(record, store)
+"""
+
+import hashlib
+import json
+
+SOURCE_LIST_KEYS = ("results", "sources_found")   # run-log lists whose items are sources
+REF_CHARS = 16
+
+
+def source_ref(source):
+    """The content hash a source is stored under."""
+    canonical = json.dumps(source, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:REF_CHARS]
+
+
+class EvidenceStore:
+    """Append-only {ref: source} store in a JSONL file, one source per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._sources = None
+        self._pending = {}
+
+    def _index(self):
+        if self._sources is None:
+            self._sources = {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            self._sources[record.pop("ref")] = record
+            except FileNotFoundError:
+                pass
+        return self._sources
+
+    def __len__(self):
+        return len(self._index()) + len(self._pending)
+
+    def put(self, source):
+        """Store a source (if new) and return its reference."""
+        ref = source_ref(source)
+        if ref not in self._index():
+            self._pending[ref] = dict(source)
+        return ref
+
+    def get(self, ref):
+        """The source stored under ref, or None."""
+        return self._pending.get(ref) or self._index().get(ref)
+
+    def flush(self):
+        """Append the sources put since the last flush; returns how many.
+
+        Each line goes out in a single append, so concurrent writers never
+        interleave; a source two writers both add is stored twice, harmlessly.
+        """
+        if not self._pending:
+            return 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for ref, source in self._pending.items():
+                f.write(json.dumps({"ref": ref, **source}, ensure_ascii=False) + "\n")
+        written = len(self._pending)
+        self._index().update(self._pending)
+        self._pending = {}
+        return written
+
+
+def compact(record, store):
+    """A copy of record with every source in SOURCE_LIST_KEYS lists replaced
+    by its reference (sources are put into store)."""
+    if isinstance(record, dict):
+        return {
+            key: (
+                [store.put(v) if isinstance(v, dict) and "url" in v else compact(v, store) for v in value]
+                if key in SOURCE_LIST_KEYS and isinstance(value, list)
+                else compact(value, store)
+            )
+            for key, value in record.items()
+        }
+    if isinstance(record, list):
+        return [compact(v, store) for v in record]
+    return record
+
+
+def hydrate(record, store):
+    """A copy of record with source references resolved from store.
+
+    References missing from the store are left as they are.
+    """
+    if isinstance(record, dict):
+        return {
+            key: (
+                [(store.get(v) or v) if isinstance(v, str) else hydrate(v, store) for v in value]
+                if key in SOURCE_LIST_KEYS and isinstance(value, list)
+                else hydrate(value, store)
+            )
+            for key, value in record.items()
+        }
+    if isinstance(record, list):
+        return [hydrate(v, store) for v in record]
+    return record
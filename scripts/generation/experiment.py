@@ -0,0 +1,272 @@
+"""
+Prompt-variant experiments over recorded pipeline inputs.
+
+A variant is a set of edits to the prompts of individual pipeline steps:
+
+    {
+        "terse-cross-check": {
+            "cross_check": {"system": "You are a meticulous fact-checker. ..."},
+            "generate_question": {"user_append": "Prefer rankings with a single official source."}
+        }
+    }
+
+Edits are "system" (replace the system prompt), "system_append" and
+"user_append".  run_experiment() replays every recorded case under every
+variant in a process pool; the caller's evaluate function runs the real
+pipeline code on a MeteredLLM, which applies the variant's edits, counts
+round-trips and prompt tokens, and forwards to a local OpenAI-compatible
+endpoint (or, in FakeLLM, answers deterministically offline).  summarize()
+aggregates success rate, verify iterations, prompt tokens and latency per
+variant and lists regressions against the baseline.
+
+Usage:
+    variants = load_variants(path)
+    rows = run_experiment(evaluate_case, cases, variants, options, workers=4)
+    report = summarize(rows)
+"""
+
+import hashlib
+import json
+import re
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+BASELINE = "baseline"
+EDIT_KINDS = ("system", "system_append", "user_append")
+STEP_PREFIX_CHARS = 60      # system-prompt prefix that identifies a step
+TOKEN_REGRESSION = 0.05     # prompt tokens this much above baseline count as a regression
+
+
+def load_variants(path):
+    """Read a variants file; a no-edit baseline is always included first.
+
+    Raises ValueError on edits other than EDIT_KINDS.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        variants = json.load(f)
+    for name, steps in variants.items():
+        for step, edits in steps.items():
+            unknown = set(edits) - set(EDIT_KINDS)
+            if unknown:
+                raise ValueError(f"variant {name!r}, step {step!r}: unknown edit(s) {sorted(unknown)}")
+    return {BASELINE: {}, **variants}
+
+
+def step_key(messages):
+    return messages[0]["content"][:STEP_PREFIX_CHARS] if messages else ""
+
+
+def apply_variant(messages, edits):
+    """Return a copy of messages with one step's edits applied."""
+    messages = [dict(m) for m in messages]
+    if not edits:
+        return messages
+    if "system" in edits:
+        messages[0]["content"] = edits["system"]
+    if "system_append" in edits:
+        messages[0]["content"] += "\n\n" + edits["system_append"]
+    if "user_append" in edits:
+        messages[-1]["content"] += "\n\n" + edits["user_append"]
+    return messages
+
+
+def estimate_tokens(messages):
+    """Rough prompt size (~4 characters per token) for endpoints without usage."""
+    return sum(len(m.get("content") or "") // 4 + 4 for m in messages)
+
+
+def completion(content, prompt_tokens):
+    """An OpenAI-style chat completion object carrying content."""
+    message = types.SimpleNamespace(content=content)
+    return types.SimpleNamespace(
+        choices=[types.SimpleNamespace(message=message, finish_reason="stop")],
+        usage=types.SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=len(content) // 4),
+    )
+
+
+class MeteredLLM:
+    """Chat client wrapper that applies a variant and meters every call.
+
+    Args:
+        inner:        client with chat.completions.create, e.g. OpenAI(base_url=...)
+        prompt_steps: {system-prompt prefix: step name}, see step_key()
+        variant:      {step name: edits} for the variant under test
+        model:        optional model name sent instead of the pipeline's own
+    """
+
+    def __init__(self, inner, prompt_steps, variant, model=None):
+        self.inner = inner
+        self.prompt_steps = prompt_steps
+        self.variant = variant
+        self.model = model
+        self.stats = {"llm_calls": 0, "prompt_tokens": 0, "llm_seconds": 0.0}
+        self.chat = types.SimpleNamespace(completions=self)
+
+    def create(self, model, messages, **kwargs):
+        step = self.prompt_steps.get(step_key(messages))
+        messages = apply_variant(messages, self.variant.get(step))
+        t0 = time.perf_counter()
+        response = self.send(step, self.model or model, messages, kwargs)
+        self.stats["llm_seconds"] += time.perf_counter() - t0
+        self.stats["llm_calls"] += 1
+        usage = getattr(response, "usage", None)
+        self.stats["prompt_tokens"] += getattr(usage, "prompt_tokens", None) or estimate_tokens(messages)
+        return response
+
+    def send(self, step, model, messages, kwargs):
+        return self.inner.chat.completions.create(model=model, messages=messages, **kwargs)
+
+
+class FakeLLM(MeteredLLM):
+    """MeteredLLM that answers every step itself, for offline harness runs.
+
+    Verdicts depend only on the first line of the user message (the topic or
+    question) and the call count, so variants that only reword prompts see
+    the same outcomes and differ in tokens and round-trips.  Latency is
+    simulated at seconds_per_1k_tokens of prompt.
+    """
+
+    ANSWER_LINE = re.compile(r"^\d\. (.+)$", re.M)
+
+    def __init__(self, prompt_steps, variant, seconds_per_1k_tokens=0.01):
+        super().__init__(None, prompt_steps, variant)
+        self.seconds_per_1k_tokens = seconds_per_1k_tokens
+        self.calls = {}
+
+    def _roll(self, seed, sides):
+        return int(hashlib.sha1(seed.encode("utf-8")).hexdigest(), 16) % sides
+
+    def send(self, step, model, messages, kwargs):
+        user = messages[-1]["content"]
+        head = user.split("\n", 1)[0]
+        n = self.calls[step] = self.calls.get(step, 0) + 1
+        answers = self.ANSWER_LINE.findall(user)[:5]
+        values = list(range(len(answers) * 10, 0, -10))
+
+        if step == "generate_question":
+            subject = head.split(":", 1)[-1].strip()
+            content = {
+                "question": f"Rank the top 5 for: {subject}",
+                "search_query": f"{subject} ranking",
+                "answers": [f"{subject} #{i}" for i in range(1, 6)],
+                "source": "https://en.wikipedia.org/wiki/Main_Page",
+                "distractors": [f"{subject} decoy {i}" for i in range(1, 16)],
+            }
+        elif step == "cross_check":
+            status = ("VERIFIED", "VERIFIED", "UNVERIFIABLE")[self._roll(f"{head}|{n}", 3)]
+            content = {
+                "status": status,
+                "best_source": "https://en.wikipedia.org/wiki/Main_Page",
+                "answer_values": values,
+                "reason": "Fake verdict",
+            }
+        elif step == "re_verify":
+            content = {"status": "CONFIRMED", "reason": "Fake verdict", "answer_values": values}
+        elif step == "similarity_check":
+            content = {"too_similar": False, "reason": "Fake verdict"}
+        elif step == "topic_dedup":
+            content = {"recently_covered": False, "reason": "Fake verdict"}
+        else:
+            content = {}
+
+        prompt_tokens = estimate_tokens(messages)
+        time.sleep(prompt_tokens / 1000 * self.seconds_per_1k_tokens)
+        return completion(json.dumps(content), prompt_tokens)
+
+
+class ReplaySearch:
+    """search() that returns a case's recorded results, one search per call.
+
+    Calls past the recording repeat its last search.
+    """
+
+    def __init__(self, searches):
+        self.searches = searches
+        self.calls = 0
+
+    def search(self, query, max_results=5, **kwargs):
+        if not self.searches:
+            return {"results": [], "backend": "replay"}
+        results = self.searches[min(self.calls, len(self.searches) - 1)]
+        self.calls += 1
+        return {"results": [dict(r) for r in results[:max_results]], "backend": "replay"}
+
+
+def run_experiment(evaluate, cases, variants, options, workers=4, initializer=None):
+    """Evaluate every (variant, case) pair in a process pool.
+
+    evaluate(case, variant_edits, options) must be a module-level function
+    returning a dict with at least "success"; it runs in a worker process,
+    after initializer() (e.g. to pay import costs before the clock starts).
+    A case that raises is recorded as a failure with its error.
+
+    Returns:
+        list of row dicts with "variant" and "case" added.
+    """
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as pool:
+        futures = [
+            (name, case, pool.submit(evaluate, case, edits, options))
+            for name, edits in variants.items()
+            for case in cases
+        ]
+        for name, case, future in futures:
+            try:
+                row = future.result()
+            except Exception as exc:
+                row = {"success": False, "error": f"{type(exc).__name__}: {exc}"}
+            rows.append({"variant": name, "case": case.get("id"), **row})
+    return rows
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of values (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _mean(values):
+    return round(sum(values) / len(values), 2) if values else None
+
+
+def summarize(rows, baseline=BASELINE, token_regression=TOKEN_REGRESSION):
+    """Per-variant metrics and regressions against the baseline variant.
+
+    Returns {"variants": {name: metrics}, "regressions": [str]} where
+    metrics has cases, errors, success_rate, verify_iterations,
+    prompt_tokens and llm_calls (means per case) and latency_p50/p90_s.
+    """
+    by_variant = {}
+    for row in rows:
+        by_variant.setdefault(row["variant"], []).append(row)
+
+    variants = {}
+    for name, group in by_variant.items():
+        ok = [r for r in group if "error" not in r]
+        latencies = [r["latency_s"] for r in ok]
+        variants[name] = {
+            "cases": len(group),
+            "errors": len(group) - len(ok),
+            "success_rate": round(sum(1 for r in group if r.get("success")) / len(group), 3),
+            "verify_iterations": _mean([r["verify_iterations"] for r in ok]),
+            "prompt_tokens": _mean([r["prompt_tokens"] for r in ok]),
+            "llm_calls": _mean([r["llm_calls"] for r in ok]),
+            "latency_p50_s": round(percentile(latencies, 0.5), 3) if latencies else None,
+            "latency_p90_s": round(percentile(latencies, 0.9), 3) if latencies else None,
+        }
+
+    regressions = []
+    base = variants.get(baseline)
+    for name, m in variants.items():
+        if base is None or name == baseline:
+            continue
+        if m["success_rate"] < base["success_rate"]:
+            regressions.append(f"{name}: success rate {m['success_rate']:.0%} < {base['success_rate']:.0%}")
+        if m["prompt_tokens"] and base["prompt_tokens"] and m["prompt_tokens"] > base["prompt_tokens"] * (1 + token_regression):
+            regressions.append(f"{name}: {m['prompt_tokens']:.0f} prompt tokens/case vs {base['prompt_tokens']:.0f}")
+        if m["llm_calls"] and base["llm_calls"] and m["llm_calls"] > base["llm_calls"]:
+            regressions.append(f"{name}: {m['llm_calls']} LLM calls/case vs {base['llm_calls']}")
+    return {"variants": variants, "regressions": regressions}
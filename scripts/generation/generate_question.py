@@ -7,11 +7,23 @@ Generates a new Factle question each day by:
 3. Verifying the answer order against authoritative web sources (with retries)
 4. Re-verifying any corrections
 5. Appending to questions.json and logging the run
+6. Failing over to a pre-verified reserve bank if the live pipeline fails
 
 Usage:
-    python generate_question.py [--dry-run]
-
-Environment variables required:
+    python generate_question.py [generate] [--dry-run] [--async-io] [--stream] [--deadline-minutes M]
+                                [--tracks sports,easy] [--hedge] [--votes N]
+    python generate_question.py fill-reserve [N]   # fill the reserve bank offline
+    python generate_question.py validate           # check questions.json offline
+    python generate_question.py analyze-log [--since YYYY-MM-DD] [--json]
+    python generate_question.py predictor [QUESTION...]  # score the verifiability predictor offline
+    python generate_question.py build-corpus [QUERY...]  # backfill/query the local search corpus
+    python generate_question.py migrate [--dry-run]
+    python generate_question.py compact-log [--dry-run]
+    python generate_question.py audit [--since D] [--until D] [--workers N] [--fresh]
+    python generate_question.py bench [--runs N] [--offline-command CMD]
+    python generate_question.py experiment VARIANTS.json [--endpoint URL] [--fixtures FILE] [--limit N]
+
+Environment variables required (generate, fill-reserve and audit only):
     GITHUB_TOKEN   - GitHub PAT for GitHub Models API
     TAVILY_API_KEY - Tavily API key for web search
 """
@@ -20,12 +32,41 @@ import json
 import os
 import sys
 import argparse
+import contextlib
+import contextvars
+import io
+import threading
 import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
-from openai import OpenAI, RateLimitError
-from tavily import TavilyClient
+from breaker import BreakerBoard, CircuitOpenError, Guarded
+from consistency import check_consistency
+from content_filter import ContentFilter
+from deadline import RunBudget
+from json_stream import IncrementalObject
+from recurring_events import RecurringCalendar
+from store import JsonStore
+from llm_schema import (
+    CROSS_CHECK_SCHEMA,
+    DISCOVERY_SCHEMA,
+    GENERATED_QUESTION_SCHEMA,
+    RE_VERIFY_SCHEMA,
+    SIMILARITY_SCHEMA,
+    TOPIC_DEDUP_SCHEMA,
+    check_llm_json,
+    describe_schema,
+)
+from tracing import TRACER, traced
+
+# The HTTP clients, the optional network SDKs (openai, tavily, httpx),
+# asyncio, and the heavier pipeline modules (models, taxonomy, predictor,
+# hedging, evidence, voting, experiment, concurrent.futures, subprocess) are
+# imported lazily inside the functions that use them, so offline commands
+# (validate, analyze-log, migrate, bench) start fast and need no API keys.
+# Generation runs on the stdlib clients in http_clients.py; only --async-io
+# (and FACTLE_SDK_CLIENTS=1) need requirements.txt installed.
 
 # ---------------------------------------------------------------------------
 # Config
@@ -34,12 +75,67 @@ from tavily import TavilyClient
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 QUESTIONS_FILE = REPO_ROOT / "factle" / "questions.json"
 LOG_FILE = REPO_ROOT / "factle" / "generation_log.json"
+EVIDENCE_FILE = REPO_ROOT / "factle" / "evidence.jsonl"  # sources referenced by hash from the log
+RESERVE_FILE = REPO_ROOT / "factle" / "reserve_bank.json"
+TRACKS_FILE = REPO_ROOT / "factle" / "tracks.json"
+TOPIC_POOL_FILE = REPO_ROOT / "factle" / "topic_pool.json"  # discovered candidates carried to later runs
+AUDIT_DIR = REPO_ROOT / "factle" / "audit"
+AUDIT_CACHE_FILE = AUDIT_DIR / "cache.json"
+AUDIT_REPORT_FILE = AUDIT_DIR / "report.json"
+CORPUS_FILE = REPO_ROOT / "factle" / "cache" / "corpus.sqlite"  # persisted by the workflow's actions/cache
+PAGE_CACHE_DIR = REPO_ROOT / "factle" / "cache" / "pages"
 
 MAX_TOPIC_ATTEMPTS = 5
 MAX_VERIFY_RETRIES = 3  # inner retries per question before moving to next topic
 MAX_SEARCH_RETRIES = 3
 SEARCH_RETRY_BASE_DELAY_SECONDS = 2
+RUN_DEADLINE_SECONDS = 40 * 60  # whole-run wall-clock budget (the Actions job is killed at 50 min)
+RUN_FAILOVER_MARGIN_SECONDS = 60  # held back from live attempts for reserve failover + saving
+RESERVE_FILL_TARGET = 10        # size the offline --fill-reserve command fills up to
+RESERVE_LOW_WATERMARK = 3       # top up at the end of a run when the bank drops below this
+RESERVE_TOPUP_BATCH = 2         # max questions added per top-up (gpt-5 quota)
+TRACK_MAX_ATTEMPTS = 3          # topic attempts per extra track (generate --tracks)
+TOPIC_POOL_TTL_DAYS = 3         # a discovered candidate stays current for this many days after discovery
+TOPIC_POOL_MIN_CANDIDATES = 3   # full discovery runs when fewer fresh pooled candidates are left
+PREDICTOR_MIN_BRIER_GAIN = 0.01  # step 1c reorders only if the predictor's CV Brier beats the base rate's by this
+AUDIT_WORKERS = 4
+AUDIT_LLM_CALLS_PER_MINUTE = 10     # verify-model calls across all audit workers
+AUDIT_SEARCH_CALLS_PER_MINUTE = 30
+AUDIT_MAX_NEW = 100                 # uncached audits per invocation (1 search + 1 verify call each)
+AUDIT_DEADLINE_MINUTES = 30
+AUDIT_CACHE_TTL_DAYS = 30           # re-audit questions whose last result is older than this
+EXPERIMENT_WORKERS = 4              # processes replaying cases (generate_question.py experiment)
+EXPERIMENT_REPORT_FILE = REPO_ROOT / "factle" / "cache" / "experiment_report.json"
 CET = timezone(timedelta(hours=1))
+RECURRING_EVENTS_FILE = Path(__file__).resolve().parent / "recurring_events.json"
+CALENDAR_WINDOW_DAYS = 7         # recurring events from today on shown to topic discovery
+HTTP_CONNECT_TIMEOUT_SECONDS = 10
+HTTP_READ_TIMEOUT_SECONDS = 180  # gpt-5 completions with long prompts can be slow
+HTTP_MAX_CONNECTIONS = 10        # keep-alive pool shared by the async clients
+USE_SDK_CLIENTS = os.environ.get("FACTLE_SDK_CLIENTS") == "1"  # openai/tavily SDKs instead of http_clients
+SEARCH_TIMEOUT_SECONDS = 60      # per Tavily request, clipped to the remaining run budget
+LOCAL_CORPUS_MAX_AGE_DAYS = 180  # older indexed sources are not served locally
+LOCAL_MIN_RESULTS = 3            # local hits needed before Tavily is skipped...
+LOCAL_MIN_COVERAGE = 0.6         # ...with the best hit containing this share of the query terms
+# Wording that marks a ranking as changing over time: such questions are
+# verified against the live web, never the local corpus (see is_time_sensitive)
+TIME_SENSITIVE_TERMS = [
+    "current", "currently", "as of", "so far", "to date", "latest", "right now", "ongoing",
+    "this year", "this season", "this month", "this week", "reigning",
+]
+SOURCE_SNIPPET_CHARS = 500       # search snippet length shown to the verify model
+PAGE_FETCH_TOP_N = 3             # trusted results per search whose full page is fetched
+PAGE_FETCH_PER_HOST = 2          # concurrent page requests per host
+PAGE_FETCH_TIMEOUT_SECONDS = 15
+PAGE_REGION_MAX_CHARS = 2500     # extracted table/list shown instead of the snippet
+CROSS_CHECK_EARLY_STOP_FIELDS = ["status", "best_source", "answer_values"]  # --stream stops after these on VERIFIED
+BREAKER_FAILURE_THRESHOLD = 3    # consecutive failures that open an upstream's circuit
+BREAKER_RESET_SECONDS = 60       # an open circuit lets one probe call through after this
+BREAKER_STATE_FILE = REPO_ROOT / "factle" / "cache" / "breakers.json"  # open circuits carried to the next run
+HEDGE_PERCENTILE = 0.9           # --hedge: duplicate a verify-model call slower than this share of its site's calls
+HEDGE_MAX_PER_RUN = 6            # duplicate requests allowed per run
+VOTE_MIN_CONFIDENCE = 0.7        # --votes: pairwise agreement needed to accept the consensus order
+VOTE_TEMPERATURE = 0.7           # sampling temperature for the independent cross-check votes
 
 # GitHub Models endpoint
 GITHUB_MODELS_ENDPOINT = "https://models.inference.ai.azure.com"
@@ -47,6 +143,53 @@ LLM_MODEL_CREATIVE = "gpt-5"       # Topic discovery + question generation (12 r
 LLM_MODEL_VERIFY = "gpt-4o"        # Similarity checks, cross-checks, re-verification (high limit)
 LLM_MODEL_FALLBACK = "gpt-4o"      # Automatic fallback if creative model is rate-limited
 
+# Latency priors (seconds) for budgeting a step before it has been measured
+# in this run; afterwards the measured span durations are used instead.
+STEP_LATENCY_PRIORS = {
+    "similarity_check": 15,
+    "generate_question": 150,
+    "verify_iteration": 90,
+    "search": 15,
+    "fetch_pages": 10,
+}
+ATTEMPT_STEPS = ("similarity_check", "generate_question", "verify_iteration")  # cheapest useful attempt
+# Hedge delays (seconds) per verify-model call site until it has measured calls
+HEDGE_LATENCY_PRIORS = {
+    "topic_dedup": 10,
+    "similarity_check": 10,
+    "cross_check": 30,
+    "re_verify": 30,
+}
+
+BUDGET = RunBudget(TRACER, STEP_LATENCY_PRIORS)
+
+
+UPSTREAM_ERROR_MODULES = ("openai", "httpx", "tavily", "requests", "urllib3")
+
+
+def upstream_failure(exc):
+    """Errors that say an upstream is unhealthy, not that our request was bad."""
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status >= 500 or status in (408, 429)
+    return isinstance(exc, OSError) or type(exc).__module__.split(".")[0] in UPSTREAM_ERROR_MODULES
+
+
+# One circuit per upstream: "search" and "llm:<model>"
+BREAKERS = BreakerBoard(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS, is_failure=upstream_failure)
+
+_hedger = None
+
+
+def get_hedger():
+    """The run's Hedger (see hedging.py), created on first use."""
+    global _hedger
+    if _hedger is None:
+        from hedging import Hedger
+
+        _hedger = Hedger(HEDGE_LATENCY_PRIORS, percentile=HEDGE_PERCENTILE, max_hedges=HEDGE_MAX_PER_RUN)
+    return _hedger
+
 # ---------------------------------------------------------------------------
 # LLM call wrapper with automatic rate-limit downgrade
 # ---------------------------------------------------------------------------
@@ -56,18 +199,171 @@ def llm_create(llm, model, **kwargs):
 
     If the requested model returns a 429 RateLimitError, the call is
     automatically retried with LLM_MODEL_FALLBACK so the pipeline never
-    fails just because the premium model's daily quota is exhausted.
+    fails just because the premium model's daily quota is exhausted.  Calls
+    go through the model's circuit breaker: other upstream failures also
+    fall back, an open circuit falls back without calling the model, and
+    CircuitOpenError is raised once the fallback's circuit is open too.
+    """
+    with_call_timeout(kwargs, HTTP_READ_TIMEOUT_SECONDS)
+    with TRACER.span("llm", model=model):
+        try:
+            return BREAKERS.get(f"llm:{model}").call(llm.chat.completions.create, model=model, **kwargs)
+        except Exception as exc:
+            if model == LLM_MODEL_FALLBACK or not should_downgrade(exc):
+                raise  # already on fallback — nothing more to try
+            print(downgrade_notice(model, exc))
+            TRACER.annotate(downgraded_to=LLM_MODEL_FALLBACK)
+            TRACER.count("model_downgrades")
+            return BREAKERS.get(f"llm:{LLM_MODEL_FALLBACK}").call(
+                llm.chat.completions.create, model=LLM_MODEL_FALLBACK, **kwargs
+            )
+
+
+def should_downgrade(exc):
+    return isinstance(exc, CircuitOpenError) or upstream_failure(exc)
+
+
+def downgrade_notice(model, exc):
+    if isinstance(exc, CircuitOpenError):
+        reason = "Circuit open"
+    elif getattr(exc, "status_code", None) == 429:
+        reason = "Rate-limited"
+    else:
+        reason = type(exc).__name__
+    return f"  ⚠ {reason} on {model}, downgrading to {LLM_MODEL_FALLBACK}: {exc}"
+
+
+def verify_llm_create(llm, site, **kwargs):
+    """llm_create on LLM_MODEL_VERIFY, hedged per call site when hedging is on.
+
+    These calls sit on the sequential critical path and the verify model
+    has quota to spare, so a slow one is raced against a duplicate (see
+    hedging.Hedger).
+    """
+    return get_hedger().call(site, lambda: llm_create(llm, model=LLM_MODEL_VERIFY, **kwargs))
+
+
+def with_call_timeout(kwargs, cap):
+    """Set a per-request timeout clipped to the run budget, if one is running."""
+    timeout = BUDGET.timeout_for(cap)
+    if timeout is not None:
+        kwargs.setdefault("timeout", timeout)
+    return kwargs
+
+
+def llm_stream(llm, model, on_field=None, **kwargs):
+    """Stream a JSON-mode completion, reporting top-level fields as they complete.
+
+    on_field(key, value) is called as soon as each top-level member of the
+    JSON object has been received; if it returns True the stream is closed
+    early.  Rate limits, upstream failures and open circuits fall back to
+    LLM_MODEL_FALLBACK like llm_create.
+
+    Returns:
+        (parser, stopped_early) where parser is the IncrementalObject holding
+        the accumulated text and the completed fields.
     """
+    with_call_timeout(kwargs, HTTP_READ_TIMEOUT_SECONDS)
+    with TRACER.span("llm", model=model, stream=True) as span:
+        try:
+            stream = BREAKERS.get(f"llm:{model}").call(
+                llm.chat.completions.create, model=model, stream=True, **kwargs
+            )
+        except Exception as exc:
+            if model == LLM_MODEL_FALLBACK or not should_downgrade(exc):
+                raise
+            print(downgrade_notice(model, exc))
+            TRACER.annotate(downgraded_to=LLM_MODEL_FALLBACK)
+            TRACER.count("model_downgrades")
+            stream = BREAKERS.get(f"llm:{LLM_MODEL_FALLBACK}").call(
+                llm.chat.completions.create, model=LLM_MODEL_FALLBACK, stream=True, **kwargs
+            )
+
+        parser = IncrementalObject()
+        stopped = False
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                for key, value in parser.feed(chunk.choices[0].delta.content):
+                    span["attrs"].setdefault("first_field_s", round(time.perf_counter() - span["start"], 3))
+                    if on_field and on_field(key, value):
+                        stopped = True
+                        break
+                if stopped:
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+        span["attrs"]["stopped_early"] = stopped
+        return parser, stopped
+
+
+def response_content(response):
+    """Return the text of the first choice, or None if there is none."""
     try:
-        return llm.chat.completions.create(model=model, **kwargs)
-    except RateLimitError as exc:
-        if model == LLM_MODEL_FALLBACK:
-            raise  # already on fallback — nothing more to try
-        print(
-            f"  ⚠ Rate-limited on {model}, downgrading to "
-            f"{LLM_MODEL_FALLBACK}: {exc}"
-        )
-        return llm.chat.completions.create(model=LLM_MODEL_FALLBACK, **kwargs)
+        return response.choices[0].message.content
+    except (AttributeError, IndexError):
+        return None
+
+
+def build_json_repair_messages(content, schema, errors):
+    """Build a short follow-up asking the verify model to fix a malformed response."""
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You repair malformed JSON. Return ONLY the corrected JSON object. "
+                "Keep every value from the original response; only fix structure, "
+                "types and field names. Do not add new facts."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"This response has problems: {'; '.join(errors)}\n\n"
+                f"Required shape:\n{describe_schema(schema)}\n\n"
+                f"Original response:\n{content or '(empty)'}"
+            ),
+        },
+    ]
+
+
+def load_llm_json(llm, response, schema):
+    """Parse a JSON-mode completion against its call-site schema.
+
+    Tolerant local extraction and repair come first.  Only if required
+    fields are still missing or malformed do we spend one short "fix your
+    JSON" follow-up on the verify model, rather than throw away the
+    (possibly expensive creative-model) result.
+
+    Returns:
+        the validated dict, or None if it could not be salvaged.
+    """
+    return load_llm_text(llm, response_content(response), schema)
+
+
+def load_llm_text(llm, content, schema):
+    """load_llm_json for completion text that has already been received."""
+    result, errors = check_llm_json(content, schema)
+    if not errors:
+        return result
+
+    print(f"  ⚠ Malformed {schema['name']} response ({'; '.join(errors)}). Requesting JSON repair...")
+    TRACER.count("json_repair_calls")
+    fixed = llm_create(
+        llm,
+        model=LLM_MODEL_VERIFY,
+        messages=build_json_repair_messages(content, schema, errors),
+        response_format={"type": "json_object"},
+    )
+    result, errors = check_llm_json(response_content(fixed), schema)
+    if errors:
+        print(f"  ❌ JSON repair failed: {'; '.join(errors)}")
+        TRACER.count("json_repair_failures")
+        return None
+    return result
 
 
 # Untrusted source domains — prefer authoritative sources over these
@@ -89,22 +385,44 @@ def is_source_trustworthy(url):
     return not any(domain in url_lower for domain in UNTRUSTED_SOURCE_DOMAINS)
 
 
-# Topics to filter out — sensitive, violent, or inappropriate
+# Topics to filter out — sensitive, violent, or inappropriate.  Matching is
+# on whole words with plurals folded, so inflected forms ("murdered",
+# "abuser") are rules of their own; "race" deliberately stops at the noun
+# so "racing" and "racer" stay allowed.
 BLOCKED_TOPICS = [
-    "shooting", "murder", "killing", "terrorism", "terrorist",
-    "epstein", "abuse", "assault", "scandal", "death toll",
-    "massacre", "genocide", "suicide", "rape", "trafficking",
-    "war crime", "hate crime", "extremism", "conspiracy",
-    "race", "racial", "ethnicity", "ethnic",
+    "shooting", "murder", "murdered", "murderer", "murderous", "murdering",
+    "killing", "terrorism", "terrorist",
+    "epstein", "abuse", "abused", "abuser", "abusing", "abusive",
+    "assault", "assaulted", "assaulting", "scandal", "scandalous", "death toll",
+    "massacre", "massacred", "genocide", "suicide", "rape", "raped", "rapist", "raping",
+    "trafficking", "trafficked", "trafficker",
+    "war crime", "hate crime", "extremism", "extremist", "conspiracy",
+    "race", "racial", "racism", "racist", "ethnicity", "ethnic",
 ]
 
+# Phrases that contain a blocked word but are fine for trivia.  A blocked
+# match lying entirely inside one of these is ignored; plurals fold, so
+# "horse race" also covers "horse races".
+ALLOWED_TOPIC_PHRASES = [
+    "space race", "arms race", "rat race", "human race",
+    "horse race", "boat race", "relay race", "drag race", "road race",
+    "motor race", "grand prix race", "race car", "race track", "race course",
+    "race horse", "race win", "race winner", "race victory",
+    "race won", "race time", "race result", "race lap", "stage race", "one-day race",
+    "f1 race", "formula 1 race", "formula one race", "nascar race", "indycar race",
+    "motogp race", "sprint race", "marathon race", "ski race", "sled dog race",
+]
+
+CONTENT_FILTER = ContentFilter(BLOCKED_TOPICS, ALLOWED_TOPIC_PHRASES)
+TIME_SENSITIVE_FILTER = ContentFilter(TIME_SENSITIVE_TERMS)
+
 # ---------------------------------------------------------------------------
 # Clients
 # ---------------------------------------------------------------------------
 
 
-def create_clients():
-    """Initialize LLM and search clients."""
+def get_api_keys():
+    """Read the GitHub Models and Tavily credentials from the environment."""
     github_token = os.environ.get("GH_PAT") or os.environ.get("GITHUB_TOKEN")
     tavily_key = os.environ.get("TAVILY_API_KEY")
 
@@ -112,35 +430,204 @@ def create_clients():
         raise EnvironmentError("GITHUB_TOKEN or GH_PAT environment variable required")
     if not tavily_key:
         raise EnvironmentError("TAVILY_API_KEY environment variable required")
+    return github_token, tavily_key
 
-    llm = OpenAI(
-        base_url=GITHUB_MODELS_ENDPOINT,
-        api_key=github_token,
-    )
-    search = TavilyClient(api_key=tavily_key)
+
+def create_clients():
+    """Initialize LLM and search clients.
+
+    Both share one keep-alive HTTPPool (see http_clients.py), as do the
+    page fetches; with USE_SDK_CLIENTS the openai and tavily SDKs are used
+    instead.
+    """
+    github_token, tavily_key = get_api_keys()
+
+    if USE_SDK_CLIENTS:
+        from openai import OpenAI, Timeout
+        from tavily import TavilyClient
+
+        llm = OpenAI(
+            base_url=GITHUB_MODELS_ENDPOINT,
+            api_key=github_token,
+            timeout=Timeout(HTTP_READ_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        )
+        remote = TavilyClient(api_key=tavily_key)
+    else:
+        from http_clients import ChatClient, TavilySearch
+
+        llm = ChatClient(GITHUB_MODELS_ENDPOINT, github_token, http_pool())
+        remote = TavilySearch(tavily_key, http_pool())
+    search = tiered_search(Guarded(remote, BREAKERS.get("search")))
     return llm, search
 
 
+_http_pool = None
+
+
+def http_pool():
+    """The process-wide keep-alive HTTPPool."""
+    global _http_pool
+    if _http_pool is None:
+        from http_clients import HTTPPool
+
+        _http_pool = HTTPPool(
+            connect_timeout=HTTP_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=HTTP_READ_TIMEOUT_SECONDS,
+            max_idle=HTTP_MAX_CONNECTIONS,
+        )
+    return _http_pool
+
+
+def open_corpus():
+    """Open (creating if needed) the local source corpus."""
+    from search_backend import LocalCorpus
+
+    CORPUS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    return LocalCorpus(CORPUS_FILE, max_age_days=LOCAL_CORPUS_MAX_AGE_DAYS)
+
+
+def tiered_search(remote):
+    """Put the local corpus in front of remote (see search_backend.TieredSearch)."""
+    from search_backend import TieredSearch
+
+    return TieredSearch(
+        open_corpus(), remote, min_results=LOCAL_MIN_RESULTS, min_coverage=LOCAL_MIN_COVERAGE
+    )
+
+
+def live_search(search):
+    """The remote client behind a tiered search, for queries that must be fresh."""
+    return getattr(search, "remote", None) or search
+
+
+def is_time_sensitive(text, today=None):
+    """True if text asks about a ranking that changes over time.
+
+    That is, it uses TIME_SENSITIVE_TERMS wording or names this year or
+    last year; the local corpus may hold an outdated copy of such rankings.
+    """
+    today = today or datetime.now(CET)
+    if TIME_SENSITIVE_FILTER.check(text):
+        return True
+    return any(str(year) in (text or "") for year in (today.year, today.year - 1))
+
+
+def async_clients():
+    """Async context manager yielding pooled (llm, search) async clients."""
+    from async_clients import AsyncClients
+
+    github_token, tavily_key = get_api_keys()
+    return AsyncClients(
+        github_token, tavily_key, GITHUB_MODELS_ENDPOINT,
+        connect_timeout=HTTP_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=HTTP_READ_TIMEOUT_SECONDS,
+        max_connections=HTTP_MAX_CONNECTIONS,
+    )
+
+
+def run_async_step(step):
+    """Run one awaitable pipeline step on a fresh pooled client pair.
+
+    Args:
+        step: callable taking (llm, search) and returning a coroutine
+    """
+    import asyncio
+
+    async def main():
+        async with async_clients() as (llm, search):
+            return await step(llm, Guarded(search, BREAKERS.get("search"), is_async=True))
+
+    return asyncio.run(main())
+
+
 # ---------------------------------------------------------------------------
 # Step 0: Load history
 # ---------------------------------------------------------------------------
 
 
+_stores = {}
+
+
+def json_store(path, default, key=None):
+    """The process-wide JsonStore for path (see store.py).
+
+    With key, the file is written one compact record of data[key] per line
+    (see models.dumps_records) instead of indented.
+    """
+    if path not in _stores:
+        dumps = None
+        if key:
+            def dumps(data):
+                from models import dumps_records
+
+                return dumps_records(data, key)
+        _stores[path] = JsonStore(path, default, dumps=dumps)
+    return _stores[path]
+
+
+def questions_store():
+    return json_store(QUESTIONS_FILE, lambda: {"questions": []}, key="questions")
+
+
+def log_store():
+    return json_store(LOG_FILE, lambda: {"runs": []}, key="runs")
+
+
 def load_questions():
     """Load existing questions from questions.json."""
-    if QUESTIONS_FILE.exists():
-        with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("questions", [])
-    return []
+    return questions_store().read().get("questions", [])
+
+
+_calendar = None
+
+
+def recurring_calendar():
+    """The RecurringCalendar of RECURRING_EVENTS_FILE, loaded on first use."""
+    global _calendar
+    if _calendar is None:
+        _calendar = RecurringCalendar.load(RECURRING_EVENTS_FILE)
+    return _calendar
+
+
+def calendar_events(today):
+    """Recurring events in the discovery window, as (day, event) pairs."""
+    calendar = recurring_calendar()
+    last = today.date() + timedelta(days=CALENDAR_WINDOW_DAYS - 1)
+    for year in sorted({today.year, last.year}):
+        report_undated_events(calendar, year)
+    return calendar.upcoming(today.date(), days=CALENDAR_WINDOW_DAYS)
+
+
+def report_undated_events(calendar, year):
+    """Warn about calendar events whose per-year dates stop before year;
+    returns how many there are."""
+    undated = calendar.undated(year)
+    if undated:
+        names = ", ".join(event["name"] for event in undated[:5])
+        more = f" and {len(undated) - 5} more" if len(undated) > 5 else ""
+        print(f"  ⚠ {RECURRING_EVENTS_FILE.name}: {len(undated)} event(s) have no dates for {year}: {names}{more}")
+    return len(undated)
 
 
-def load_log():
-    """Load generation log."""
-    if LOG_FILE.exists():
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"runs": []}
+def evidence_store():
+    """The process-wide EvidenceStore for the log's sources (see evidence.py)."""
+    from evidence import EvidenceStore
+
+    return _stores.setdefault(EVIDENCE_FILE, EvidenceStore(EVIDENCE_FILE))
+
+
+def load_log(sources=False):
+    """Load generation log.
+
+    The runs refer to their search sources by hash; with sources, those
+    references are resolved from the evidence store.
+    """
+    from evidence import hydrate
+
+    log = log_store().read()
+    if sources:
+        log["runs"] = [hydrate(run_entry, evidence_store()) for run_entry in log.get("runs", [])]
+    return log
 
 
 def get_previous_questions_summary(questions):
@@ -156,6 +643,20 @@ def get_recent_questions(questions, days=7):
     return [q for q in questions if q.get("date", "") >= cutoff]
 
 
+def question_tags(question):
+    """A question's taxonomy tags: the stored ones, else tagged from its text."""
+    from taxonomy import tag_text
+
+    return question.get("tags") or tag_text(question.get("question", ""))
+
+
+def topic_tags(topic_info):
+    """A candidate topic's taxonomy tags: pooled ones carry theirs."""
+    from taxonomy import tag_text
+
+    return topic_info.get("tags") or tag_text(f"{topic_info.get('topic', '')} {topic_info.get('suggested_question', '')}")
+
+
 def get_recent_topics_summary(recent_questions):
     """Build a summary of topics covered in recent questions."""
     if not recent_questions:
@@ -165,6 +666,7 @@ def get_recent_topics_summary(recent_questions):
     )
 
 
+@traced("topic_dedup")
 def filter_recently_covered_topics(llm, topics, recent_questions, run_log):
     """Filter out topics whose broad theme has been covered in the last 7 days.
 
@@ -173,82 +675,28 @@ def filter_recently_covered_topics(llm, topics, recent_questions, run_log):
     the exact question wording.  Two different questions about the same
     subject area within 7 days hurt variety, so we drop them early (before
     the expensive generate-and-verify loop).
+
+    The taxonomy tags settle most topics (see taxonomy.py); the LLM only
+    judges the ambiguous ones, against the recent questions they relate to.
     """
     if not recent_questions:
         run_log["step1b_topic_dedup"] = {"skipped": True, "reason": "No recent questions"}
         return topics
 
-    recent_summary = get_recent_topics_summary(recent_questions)
     filtered = []
     dedup_log = []
 
     for topic_info in topics:
-        topic = topic_info.get("topic", "")
-        suggested_q = topic_info.get("suggested_question", "")
-
-        response = llm_create(
+        related = taxonomy_dedup(topic_info, recent_questions, dedup_log, filtered)
+        if related is None:
+            continue
+        response = verify_llm_create(
             llm,
-            model=LLM_MODEL_VERIFY,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You check whether a proposed trivia topic covers the same "
-                        "broad theme or subject area as any recently used question. "
-                        "This is about TOPIC diversity, not exact question duplication.\n\n"
-                        "Examples of SAME-topic overlaps (should be filtered):\n"
-                        "- 'Six Nations stadium capacities' and 'Six Nations Grand Slams' "
-                        "→ SAME topic (Six Nations rugby)\n"
-                        "- 'Champions League semi-finalists' and 'Champions League titles' "
-                        "→ SAME topic (Champions League)\n"
-                        "- 'Winter Olympics gold medals by country' and 'Most decorated "
-                        "Winter Olympians' → SAME topic (Winter Olympics)\n"
-                        "- 'Grammy Award winners' and 'Most Grammys in a single night' "
-                        "→ SAME topic (Grammy Awards)\n\n"
-                        "Examples of DIFFERENT topics (should NOT be filtered):\n"
-                        "- 'Grammy Award winners' and 'Billboard chart records' "
-                        "→ DIFFERENT (awards vs charts)\n"
-                        "- 'Tennis Grand Slam titles' and 'FIFA World Cup winners' "
-                        "→ DIFFERENT (tennis vs football)\n"
-                        "- 'Winter Olympics medals' and 'Summer Olympics medals' "
-                        "→ BORDERLINE but acceptable (different Games)\n"
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"Proposed topic: {topic}\n"
-                        f"Suggested question: {suggested_q}\n\n"
-                        f"Questions used in the past 7 days:\n{recent_summary}\n\n"
-                        "Does this proposed topic cover the same broad theme/subject "
-                        "area as any of the recent questions? Respond with ONLY a "
-                        "JSON object: {\"recently_covered\": true/false, "
-                        "\"reason\": \"brief explanation\", "
-                        "\"overlaps_with\": \"the recent question it overlaps with, or null\"}"
-                    ),
-                },
-            ],
+            "topic_dedup",
+            messages=build_topic_dedup_messages(topic_info, get_recent_topics_summary(related)),
             response_format={"type": "json_object"},
         )
-
-        try:
-            result = json.loads(response.choices[0].message.content)
-            entry = {
-                "topic": topic,
-                "suggested_question": suggested_q,
-                **result,
-            }
-            dedup_log.append(entry)
-
-            if result.get("recently_covered", False):
-                print(f"  ⏭ Skipping '{topic}' — topic recently covered")
-                print(f"    Reason: {result.get('reason', 'N/A')}")
-            else:
-                filtered.append(topic_info)
-        except (json.JSONDecodeError, IndexError, KeyError):
-            # If parsing fails, keep the topic to be safe
-            dedup_log.append({"topic": topic, "error": "Failed to parse response"})
-            filtered.append(topic_info)
+        record_topic_dedup(load_llm_json(llm, response, TOPIC_DEDUP_SCHEMA), topic_info, dedup_log, filtered)
 
     run_log["step1b_topic_dedup"] = {
         "recent_questions_count": len(recent_questions),
@@ -260,160 +708,344 @@ def filter_recently_covered_topics(llm, topics, recent_questions, run_log):
     return filtered
 
 
+def build_topic_dedup_messages(topic_info, recent_summary):
+    """Build the chat messages for the 7-day topic-coverage check."""
+    topic = topic_info.get("topic", "")
+    suggested_q = topic_info.get("suggested_question", "")
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You check whether a proposed trivia topic covers the same "
+                "broad theme or subject area as any recently used question. "
+                "This is about TOPIC diversity, not exact question duplication.\n\n"
+                "Examples of SAME-topic overlaps (should be filtered):\n"
+                "- 'Six Nations stadium capacities' and 'Six Nations Grand Slams' "
+                "→ SAME topic (Six Nations rugby)\n"
+                "- 'Champions League semi-finalists' and 'Champions League titles' "
+                "→ SAME topic (Champions League)\n"
+                "- 'Winter Olympics gold medals by country' and 'Most decorated "
+                "Winter Olympians' → SAME topic (Winter Olympics)\n"
+                "- 'Grammy Award winners' and 'Most Grammys in a single night' "
+                "→ SAME topic (Grammy Awards)\n\n"
+                "Examples of DIFFERENT topics (should NOT be filtered):\n"
+                "- 'Grammy Award winners' and 'Billboard chart records' "
+                "→ DIFFERENT (awards vs charts)\n"
+                "- 'Tennis Grand Slam titles' and 'FIFA World Cup winners' "
+                "→ DIFFERENT (tennis vs football)\n"
+                "- 'Winter Olympics medals' and 'Summer Olympics medals' "
+                "→ BORDERLINE but acceptable (different Games)\n"
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Proposed topic: {topic}\n"
+                f"Suggested question: {suggested_q}\n\n"
+                f"Questions used in the past 7 days:\n{recent_summary}\n\n"
+                "Does this proposed topic cover the same broad theme/subject "
+                "area as any of the recent questions? Respond with ONLY a "
+                "JSON object: {\"recently_covered\": true/false, "
+                "\"reason\": \"brief explanation\", "
+                "\"overlaps_with\": \"the recent question it overlaps with, or null\"}"
+            ),
+        },
+    ]
+
+
+def taxonomy_dedup(topic_info, recent_questions, dedup_log, filtered):
+    """Settle the 7-day coverage check from taxonomy tags where they decide it.
+
+    Returns the recent questions the LLM should compare the topic against,
+    or None if the tags decided (the verdict is logged, and the topic kept
+    unless it was covered).
+    """
+    from taxonomy import coverage, overlap
+
+    tags = topic_tags(topic_info)
+    recent_tags = [question_tags(q) for q in recent_questions]
+    verdict, matches = coverage(tags, recent_tags)
+    if verdict == "ambiguous":
+        return [recent_questions[i] for i in matches]
+
+    topic = topic_info.get("topic", "")
+    entry = {
+        "topic": topic,
+        "suggested_question": topic_info.get("suggested_question", ""),
+        "recently_covered": verdict == "covered",
+        "decided_by": "taxonomy",
+        "tags": tags,
+    }
+    if verdict == "covered":
+        overlapping = recent_questions[matches[0]]
+        entry["reason"] = f"Same {', '.join(overlap(tags, recent_tags[matches[0]])[0])} as a recent question"
+        entry["overlaps_with"] = overlapping["question"]
+        print(f"  ⏭ Skipping '{topic}' — topic recently covered")
+        print(f"    Reason: {entry['reason']}")
+    else:
+        entry["reason"] = "No category in common with the recent questions"
+        entry["overlaps_with"] = None
+        filtered.append(topic_info)
+    dedup_log.append(entry)
+    return None
+
+
+def record_topic_dedup(result, topic_info, dedup_log, filtered):
+    """Log a topic-coverage verdict and keep the topic unless it was covered."""
+    topic = topic_info.get("topic", "")
+    suggested_q = topic_info.get("suggested_question", "")
+    if result is None:
+        # If parsing fails, keep the topic to be safe
+        dedup_log.append({"topic": topic, "error": "Failed to parse response"})
+        filtered.append(topic_info)
+        return
+
+    entry = {
+        "topic": topic,
+        "suggested_question": suggested_q,
+        **result,
+    }
+    dedup_log.append(entry)
+
+    if result["recently_covered"]:
+        print(f"  ⏭ Skipping '{topic}' — topic recently covered")
+        print(f"    Reason: {result.get('reason', 'N/A')}")
+    else:
+        filtered.append(topic_info)
+
+
 # ---------------------------------------------------------------------------
 # Step 1: Discover current topics
 # ---------------------------------------------------------------------------
 
 
+def find_blocked_content(text):
+    """Return the blocked-topic rule that fires on text, or None if clean."""
+    return CONTENT_FILTER.check(text)
+
+
 def is_topic_appropriate(topic_text):
     """Filter out inappropriate or sensitive topics."""
-    lower = topic_text.lower()
-    return not any(blocked in lower for blocked in BLOCKED_TOPICS)
+    return find_blocked_content(topic_text) is None
 
 
+def check_question_content(question_data):
+    """Run the content filter over a generated question and all its options.
+
+    Returns a dict naming the field and rule that fired, or None if the
+    question text, answers and distractors are all clean.
+    """
+    fields = [("question", question_data.get("question", ""))]
+    fields += [("answer", a) for a in question_data.get("answers", [])]
+    fields += [("distractor", d) for d in question_data.get("distractors", [])]
+    for field, text in fields:
+        hit = find_blocked_content(str(text))
+        if hit:
+            return {"field": field, "text": text, **hit}
+    return None
+
+
+@traced("discover_topics")
 def discover_topics(llm, search, run_log, recent_questions=None):
     """Search for current events, celebrations, and cultural moments, then
     rank them for Factle suitability with creative question ideas."""
     today = datetime.now(CET)
-    today_str = today.strftime("%B %d, %Y")
 
-    # Multiple diverse search queries to capture different angles
-    search_queries = [
+    all_search_results = []
+    raw_search_log = []
+
+    for query in get_discovery_queries(today):
+        # Current events must come from the live web, never the corpus
+        results, search_errors = tavily_search_with_retries(live_search(search), query=query, max_results=5)
+        items = results.get("results", [])
+        all_search_results.extend(items)
+        raw_search_log.append(summarize_discovery_search(query, items, search_errors))
+
+    events = calendar_events(today)
+    run_log["step1_topic_discovery"] = {"searches": raw_search_log, "calendar": summarize_calendar(events)}
+
+    # Ask LLM to extract and rank creative, topical questions
+    response = llm_create(
+        llm,
+        model=LLM_MODEL_CREATIVE,
+        messages=build_discovery_messages(today, all_search_results, recent_questions, events),
+        response_format={"type": "json_object"},
+    )
+    return record_discovered_topics(load_llm_json(llm, response, DISCOVERY_SCHEMA), run_log)
+
+
+def get_discovery_queries(today):
+    """Multiple diverse search queries to capture different angles.
+
+    Holidays, national days and birthdays recur every year and come from
+    the local calendar (calendar_events); live searches are for the news.
+    """
+    today_str = today.strftime("%B %d, %Y")
+    return [
         f"major sports events tournaments happening {today_str}",
-        f"cultural events celebrations holidays {today.strftime('%B %Y')}",
         f"award ceremonies festivals conferences {today.strftime('%B %Y')}",
         f"notable events news highlights past week {today_str}",
-        f"famous birthdays national days {today.strftime('%B %d')}",
     ]
 
-    all_search_results = []
-    raw_search_log = []
 
-    for query in search_queries:
-        results, search_errors = tavily_search_with_retries(search, query=query, max_results=5)
-        items = results.get("results", [])
-        all_search_results.extend(items)
-        raw_search_log.append({
-            "query": query,
-            "results": [
-                {"title": r.get("title", ""), "url": r.get("url", ""), "snippet": r.get("content", "")[:200]}
-                for r in items
-            ],
-            "search_errors": search_errors,
-        })
+def summarize_calendar(events):
+    """Build the run-log record of the calendar events shown to discovery."""
+    return [f"{day.isoformat()} {event['name']}" for day, event in events]
+
+
+def summarize_discovery_search(query, items, search_errors):
+    """Build the run-log record for one discovery search."""
+    return {
+        "query": query,
+        "results": [
+            {"title": r.get("title", ""), "url": r.get("url", ""), "snippet": r.get("content", "")[:200]}
+            for r in items
+        ],
+        "search_errors": search_errors,
+    }
+
 
-    run_log["step1_topic_discovery"] = {"searches": raw_search_log}
+def build_discovery_messages(today, all_search_results, recent_questions=None, calendar_events=None):
+    """Build the chat messages that turn search results (and the calendar's
+    recurring events) into ranked topics."""
+    today_str = today.strftime("%B %d, %Y")
 
     # Build context from all search results
     search_context = "\n".join(
         f"- {r.get('title', '')}: {r.get('content', '')[:200]}"
         for r in all_search_results
     )
-
-    # Ask LLM to extract and rank creative, topical questions
-    response = llm_create(
-        llm,
-        model=LLM_MODEL_CREATIVE,
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You are a creative game show host designing daily trivia for 'Factle'. "
-                    "Factle questions are 'rank the top 5 in order' questions where ORDER "
-                    "matters and answers are objectively verifiable.\n\n"
-                    "IMPORTANT RULES:\n"
-                    "- Questions MUST be inspired by current events, recent happenings, "
-                    "celebrations, sports events, cultural moments, or seasonal themes.\n"
-                    "- Questions must NOT be generic (like 'top 5 most populous countries' "
-                    "or 'top 5 largest economies') — those are boring and overused.\n"
-                    "- Questions must NOT be about sensitive topics like violence, crime, "
-                    "abuse, shootings, political scandals, or anything offensive.\n"
-                    "- Be creative! Connect current events to interesting ranked lists.\n\n"
-                    "GREAT EXAMPLES of creative, topical questions:\n"
-                    "- During Winter Olympics: 'Top 5 countries by Winter Olympics all-time "
-                    "gold medals'\n"
-                    "- After Super Bowl: 'Top 5 NFL teams by number of Super Bowl wins'\n"
-                    "- During Grammy season: 'Top 5 artists with most Grammy Awards ever'\n"
-                    "- Valentine's Day: 'Top 5 countries that spend the most on Valentine\\'s Day'\n"
-                    "- During FIFA World Cup: 'Top 5 World Cup all-time top scorers'\n"
-                    "- Near a country's national day: 'Top 5 exports of that country'\n"
-                    "- Famous person's birthday: 'Top 5 highest-grossing films starring that actor'\n"
-                    "- During award season: 'Top 5 films with most Oscar wins'\n"
-                    "- During a music festival: 'Top 5 best-selling albums of all time'\n"
-                    "- During a space event: 'Top 5 longest manned space missions'\n\n"
-                    "BAD EXAMPLES (too generic, avoid these):\n"
-                    "- 'Top 5 most populated countries'\n"
-                    "- 'Top 5 largest countries by area'\n"
-                    "- 'Top 5 biggest economies'\n"
-                    "- 'Top 5 tallest mountains'\n\n"
-                    "CRITICAL DIVERSITY RULE:\n"
-                    "Each suggested topic MUST be from a DIFFERENT domain/category. "
-                    "Never suggest two topics in the same area. For example:\n"
-                    "- Champions League + FIFA World Cup = BOTH football → only pick one\n"
-                    "- Winter Olympics medals + Summer Olympics medals = BOTH Olympics → only pick one\n"
-                    "- Grammy Awards + Billboard charts = BOTH music → only pick one\n"
-                    "- Two different film ranking questions = BOTH cinema → only pick one\n"
-                    "Spread your suggestions across sports, science, geography, entertainment, "
-                    "food & drink, technology, history, culture, business, etc.\n"
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Today is {today_str}. Here are current events and happenings:\n\n"
-                    f"{search_context}\n\n"
-                    + (
-                        "IMPORTANT: The following topics/themes have ALREADY been used "
-                        "in the past 7 days. Do NOT suggest questions in the same "
-                        "broad topic area:\n"
-                        + get_recent_topics_summary(recent_questions or [])
-                        + "\n\n"
-                        if recent_questions
-                        else ""
-                    )
-                    + "Based on these events, suggest 8-10 creative Factle questions that "
-                    "are DIRECTLY inspired by what's happening right now. Each question "
-                    "must have objectively verifiable, ordered answers.\n\n"
-                    "For each suggestion, explain the connection to current events.\n\n"
-                    "At the end, include 2-3 seasonal/cultural fallbacks (related to this "
-                    "time of year, but not generic knowledge questions).\n\n"
-                    "Return ONLY a JSON object with a 'topics' key containing an array of "
-                    "objects with keys:\n"
-                    "- 'topic': the current event or theme inspiring this question\n"
-                    "- 'suggested_question': the exact Factle question to ask\n"
-                    "- 'connection': why this is relevant right now"
-                ),
-            },
-        ],
-        response_format={"type": "json_object"},
+    calendar_context = "\n".join(
+        f"- {day.strftime('%b %d')}: {event['name']} ({event['kind'].replace('_', ' ')})"
+        for day, event in calendar_events or []
     )
 
-    try:
-        result = json.loads(response.choices[0].message.content)
-        topics = []
-        if isinstance(result, list):
-            topics = result
-        elif "topics" in result:
-            topics = result["topics"]
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a creative game show host designing daily trivia for 'Factle'. "
+                "Factle questions are 'rank the top 5 in order' questions where ORDER "
+                "matters and answers are objectively verifiable.\n\n"
+                "IMPORTANT RULES:\n"
+                "- Questions MUST be inspired by current events, recent happenings, "
+                "celebrations, sports events, cultural moments, or seasonal themes.\n"
+                "- Questions must NOT be generic (like 'top 5 most populous countries' "
+                "or 'top 5 largest economies') — those are boring and overused.\n"
+                "- Questions must NOT be about sensitive topics like violence, crime, "
+                "abuse, shootings, political scandals, or anything offensive.\n"
+                "- Be creative! Connect current events to interesting ranked lists.\n\n"
+                "GREAT EXAMPLES of creative, topical questions:\n"
+                "- During Winter Olympics: 'Top 5 countries by Winter Olympics all-time "
+                "gold medals'\n"
+                "- After Super Bowl: 'Top 5 NFL teams by number of Super Bowl wins'\n"
+                "- During Grammy season: 'Top 5 artists with most Grammy Awards ever'\n"
+                "- Valentine's Day: 'Top 5 countries that spend the most on Valentine\\'s Day'\n"
+                "- During FIFA World Cup: 'Top 5 World Cup all-time top scorers'\n"
+                "- Near a country's national day: 'Top 5 exports of that country'\n"
+                "- Famous person's birthday: 'Top 5 highest-grossing films starring that actor'\n"
+                "- During award season: 'Top 5 films with most Oscar wins'\n"
+                "- During a music festival: 'Top 5 best-selling albums of all time'\n"
+                "- During a space event: 'Top 5 longest manned space missions'\n\n"
+                "BAD EXAMPLES (too generic, avoid these):\n"
+                "- 'Top 5 most populated countries'\n"
+                "- 'Top 5 largest countries by area'\n"
+                "- 'Top 5 biggest economies'\n"
+                "- 'Top 5 tallest mountains'\n\n"
+                "CRITICAL DIVERSITY RULE:\n"
+                "Each suggested topic MUST be from a DIFFERENT domain/category. "
+                "Never suggest two topics in the same area. For example:\n"
+                "- Champions League + FIFA World Cup = BOTH football → only pick one\n"
+                "- Winter Olympics medals + Summer Olympics medals = BOTH Olympics → only pick one\n"
+                "- Grammy Awards + Billboard charts = BOTH music → only pick one\n"
+                "- Two different film ranking questions = BOTH cinema → only pick one\n"
+                "Spread your suggestions across sports, science, geography, entertainment, "
+                "food & drink, technology, history, culture, business, etc.\n"
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Today is {today_str}. Here are current events and happenings:\n\n"
+                f"{search_context}\n\n"
+                + (
+                    "Holidays, observances, anniversaries and birthdays this week "
+                    "(from the calendar):\n"
+                    f"{calendar_context}\n\n"
+                    if calendar_context
+                    else ""
+                )
+                + (
+                    "IMPORTANT: The following topics/themes have ALREADY been used "
+                    "in the past 7 days. Do NOT suggest questions in the same "
+                    "broad topic area:\n"
+                    + get_recent_topics_summary(recent_questions or [])
+                    + "\n\n"
+                    if recent_questions
+                    else ""
+                )
+                + "Based on these events, suggest 8-10 creative Factle questions that "
+                "are DIRECTLY inspired by what's happening right now. Each question "
+                "must have objectively verifiable, ordered answers.\n\n"
+                "For each suggestion, explain the connection to current events.\n\n"
+                "At the end, include 2-3 seasonal/cultural fallbacks (related to this "
+                "time of year, but not generic knowledge questions).\n\n"
+                "Return ONLY a JSON object with a 'topics' key containing an array of "
+                "objects with keys:\n"
+                "- 'topic': the current event or theme inspiring this question\n"
+                "- 'suggested_question': the exact Factle question to ask\n"
+                "- 'connection': why this is relevant right now"
+            ),
+        },
+    ]
+
+
+def record_discovered_topics(result, run_log):
+    """Log the discovered topics, dropping blocked ones."""
+    if result is None:
+        run_log["step1_topic_discovery"]["error"] = "Failed to parse discovery response"
+        return []
+
+    # Filter out inappropriate topics
+    topics = result["topics"]
+    filtered = []
+    blocked = []
+    for t in topics:
+        hit = find_blocked_content(t.get("topic", "") + " " + t.get("suggested_question", ""))
+        if hit:
+            print(f"  🚫 Blocked '{t.get('topic', '')}' (rule: {hit['rule']})")
+            blocked.append({"topic": t.get("topic", ""), **hit})
         else:
-            for v in result.values():
-                if isinstance(v, list):
-                    topics = v
-                    break
+            filtered.append(t)
+
+    filtered, demoted = diversify_topics(filtered)
+    run_log["step1_topic_discovery"]["ranked_topics"] = filtered
+    run_log["step1_topic_discovery"]["filtered_count"] = len(topics) - len(filtered)
+    run_log["step1_topic_discovery"]["blocked_topics"] = blocked
+    run_log["step1_topic_discovery"]["demoted_topics"] = demoted
+    return filtered
 
-        # Filter out inappropriate topics
-        filtered = [
-            t for t in topics
-            if is_topic_appropriate(t.get("topic", "") + " " + t.get("suggested_question", ""))
-        ]
 
-        run_log["step1_topic_discovery"]["ranked_topics"] = filtered
-        run_log["step1_topic_discovery"]["filtered_count"] = len(topics) - len(filtered)
-        return filtered
-    except (json.JSONDecodeError, IndexError, KeyError) as e:
-        run_log["step1_topic_discovery"]["error"] = str(e)
+def diversify_topics(topics):
+    """Enforce the discovery prompt's one-topic-per-category rule.
 
-    return []
+    A topic whose confident categories (see taxonomy.confident_categories)
+    are all taken by higher-ranked topics is moved to the end of the list
+    (kept as a late fallback).  Returns the
+    reordered topics and the demoted topics' names.
+    """
+    from taxonomy import confident_categories
+
+    seen = set()
+    kept, demoted = [], []
+    for t in topics:
+        categories = set(confident_categories(topic_tags(t)))
+        if categories and categories <= seen:
+            demoted.append(t)
+        else:
+            kept.append(t)
+            seen |= categories
+    return kept + demoted, [t.get("topic", "") for t in demoted]
 
 
 # ---------------------------------------------------------------------------
@@ -421,47 +1053,83 @@ def discover_topics(llm, search, run_log, recent_questions=None):
 # ---------------------------------------------------------------------------
 
 
-def is_too_similar(llm, topic, suggested_question, previous_summary, attempt_log):
-    """Check if a proposed topic is too similar to previous questions."""
-    if not previous_summary.strip():
+def similarity_candidates(topic, suggested_question, previous_questions, attempt_log):
+    """The previous questions a proposed topic could duplicate: those sharing
+    a taxonomy category or entity with it (all of them if it is untagged).
+
+    An empty result settles the similarity check (logged in attempt_log).
+    """
+    from taxonomy import coverage, tag_text
+
+    if not previous_questions:
         attempt_log["similarity_check"] = {"skipped": True, "reason": "No previous questions"}
+        return []
+    verdict, matches = coverage(
+        tag_text(f"{topic} {suggested_question}"), [question_tags(q) for q in previous_questions]
+    )
+    if verdict == "clear":
+        attempt_log["similarity_check"] = {
+            "too_similar": False,
+            "reason": "No previous question shares a category",
+            "decided_by": "taxonomy",
+        }
+    return [previous_questions[i] for i in matches]
+
+
+@traced("similarity_check")
+def is_too_similar(llm, topic, suggested_question, previous_questions, attempt_log):
+    """Check if a proposed topic is too similar to previous questions.
+
+    Only the previous questions in the topic's taxonomy categories are
+    compared, and none at all if no previous question shares one.
+    """
+    related = similarity_candidates(topic, suggested_question, previous_questions, attempt_log)
+    if not related:
         return False
+    previous_summary = get_previous_questions_summary(related)
 
-    response = llm_create(
+    response = verify_llm_create(
         llm,
-        model=LLM_MODEL_VERIFY,
-        messages=[
-            {
-                "role": "system",
-                "content": "You compare trivia questions to detect duplicates or near-duplicates.",
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Proposed new topic: {topic}\n"
-                    f"Suggested question: {suggested_question}\n\n"
-                    f"Here are all previously used questions:\n{previous_summary}\n\n"
-                    "Is this new question too similar to any previous one? "
-                    "Two questions are 'too similar' if they ask essentially the "
-                    "same thing (e.g., 'largest countries by area' and 'biggest "
-                    "countries by land area'). Questions in the same broad category "
-                    "but about different specifics are fine (e.g., 'tallest mountains' "
-                    "and 'longest rivers' are both geography but different enough).\n\n"
-                    "Respond with ONLY a JSON object: {\"too_similar\": true/false, "
-                    "\"reason\": \"brief explanation\"}"
-                ),
-            },
-        ],
+        "similarity_check",
+        messages=build_similarity_messages(topic, suggested_question, previous_summary),
         response_format={"type": "json_object"},
     )
+    return record_similarity(load_llm_json(llm, response, SIMILARITY_SCHEMA), attempt_log)
 
-    try:
-        result = json.loads(response.choices[0].message.content)
-        attempt_log["similarity_check"] = result
-        return result.get("too_similar", False)
-    except (json.JSONDecodeError, KeyError):
+
+def build_similarity_messages(topic, suggested_question, previous_summary):
+    """Build the chat messages for the duplicate-question check."""
+    return [
+        {
+            "role": "system",
+            "content": "You compare trivia questions to detect duplicates or near-duplicates.",
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Proposed new topic: {topic}\n"
+                f"Suggested question: {suggested_question}\n\n"
+                f"Here are the previously used questions on related subjects:\n{previous_summary}\n\n"
+                "Is this new question too similar to any previous one? "
+                "Two questions are 'too similar' if they ask essentially the "
+                "same thing (e.g., 'largest countries by area' and 'biggest "
+                "countries by land area'). Questions in the same broad category "
+                "but about different specifics are fine (e.g., 'tallest mountains' "
+                "and 'longest rivers' are both geography but different enough).\n\n"
+                "Respond with ONLY a JSON object: {\"too_similar\": true/false, "
+                "\"reason\": \"brief explanation\"}"
+            ),
+        },
+    ]
+
+
+def record_similarity(result, attempt_log):
+    """Log the similarity verdict and return whether the topic is a duplicate."""
+    if result is None:
         attempt_log["similarity_check"] = {"error": "Failed to parse response"}
         return False
+    attempt_log["similarity_check"] = result
+    return result["too_similar"]
 
 
 # ---------------------------------------------------------------------------
@@ -469,66 +1137,147 @@ def is_too_similar(llm, topic, suggested_question, previous_summary, attempt_log
 # ---------------------------------------------------------------------------
 
 
-def generate_question(llm, topic, suggested_question):
+@traced("generate_question")
+def generate_question(llm, topic, suggested_question, guidance=None):
     """Generate a full Factle question with answers and distractors."""
     response = llm_create(
         llm,
         model=LLM_MODEL_CREATIVE,
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You create trivia questions for Factle, a game where players "
-                    "must rank 5 items in the correct order. You must provide:\n"
-                    "- A clear question\n"
-                    "- Exactly 5 correct answers in the RIGHT ORDER (1st to 5th)\n"
-                    "- Exactly 15 plausible but incorrect distractor options\n"
-                    "- A suggested source URL where the answer can be verified\n\n"
-                    "The distractors should be from the same category and realistic "
-                    "enough that someone might confuse them with the correct answers. "
-                    "All 20 options (5 correct + 15 distractors) must be unique."
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Topic: {topic}\n"
-                    f"Suggested question direction: {suggested_question}\n\n"
-                    "Generate the Factle question. Return ONLY a JSON object with:\n"
-                    "- \"question\": the question text\n"
-                    "- \"answers\": array of exactly 5 correct answers in order "
-                    "(index 0 = 1st place, index 4 = 5th place)\n"
-                    "- \"distractors\": array of exactly 15 plausible wrong options\n"
-                    "- \"source\": a URL where this ranking can be verified\n"
-                    "- \"search_query\": a search query that would find an "
-                    "authoritative source for verification"
-                ),
-            },
-        ],
+        messages=build_generation_messages(topic, suggested_question, guidance),
         response_format={"type": "json_object"},
     )
+    return load_llm_json(llm, response, GENERATED_QUESTION_SCHEMA)
 
-    try:
-        return json.loads(response.choices[0].message.content)
-    except (json.JSONDecodeError, IndexError):
-        return None
 
+@traced("generate_question")
+def generate_question_streaming(llm, search, topic, suggested_question, attempt_log, guidance=None):
+    """Stream the question and start its verification search mid-generation.
 
-def tavily_search_with_retries(search, query, max_results=5):
-    """Run Tavily search with bounded retries so transient timeouts don't crash runs."""
-    errors = []
-
-    for attempt in range(1, MAX_SEARCH_RETRIES + 1):
-        try:
-            return search.search(query=query, max_results=max_results), errors
-        except Exception as exc:
-            err_msg = f"attempt {attempt}/{MAX_SEARCH_RETRIES}: {type(exc).__name__}: {exc}"
-            errors.append(err_msg)
-            print(f"  ⚠ Tavily search failed ({err_msg})")
+    The prompt asks for search_query right after the question text, so the
+    first verification search runs while the model is still writing the
+    answers and the 15 distractors.  The search waits for both members:
+    the question text decides whether it must be live (is_time_sensitive)
+    and which page regions fit, as on the non-streaming path.
 
-            if attempt < MAX_SEARCH_RETRIES:
-                delay = SEARCH_RETRY_BASE_DELAY_SECONDS * attempt
-                time.sleep(delay)
+    Returns:
+        (question_data, prefetch) where prefetch is {"question", "query",
+        "future"} for the search already in flight (the future yields its
+        sources), or None if question or search_query never arrived.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    streamed = {}
+    prefetch = {}
+    pool = ThreadPoolExecutor(max_workers=1)
+
+    def on_field(key, value):
+        if key in ("question", "search_query") and isinstance(value, str) and value.strip():
+            streamed.setdefault(key, value.strip())
+        if len(streamed) == 2 and not prefetch:
+            print("  ⚡ question and search_query received mid-stream, starting verification search...")
+            prefetch["question"] = streamed["question"]
+            prefetch["query"] = streamed["search_query"]
+            # Run in a copy of this context so the search span nests under the attempt
+            prefetch["future"] = pool.submit(
+                contextvars.copy_context().run, search_for_verification,
+                search, {"question": prefetch["question"], "search_query": prefetch["query"]},
+                attempt_log, 0,
+            )
+        return False
+
+    try:
+        parser, _ = llm_stream(
+            llm,
+            model=LLM_MODEL_CREATIVE,
+            on_field=on_field,
+            messages=build_generation_messages(topic, suggested_question, guidance),
+            response_format={"type": "json_object"},
+        )
+    finally:
+        pool.shutdown(wait=False)
+    return load_llm_text(llm, parser.text, GENERATED_QUESTION_SCHEMA), prefetch or None
+
+
+def build_generation_messages(topic, suggested_question, guidance=None):
+    """Build the chat messages for generating a full Factle question.
+
+    guidance is an optional extra instruction from the question's track
+    (e.g. keep it easy).
+    """
+    track_note = f"Track guidance: {guidance}\n\n" if guidance else ""
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You create trivia questions for Factle, a game where players "
+                "must rank 5 items in the correct order. You must provide:\n"
+                "- A clear question\n"
+                "- Exactly 5 correct answers in the RIGHT ORDER (1st to 5th)\n"
+                "- Exactly 15 plausible but incorrect distractor options\n"
+                "- A suggested source URL where the answer can be verified\n\n"
+                "The distractors should be from the same category and realistic "
+                "enough that someone might confuse them with the correct answers. "
+                "All 20 options (5 correct + 15 distractors) must be unique."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Topic: {topic}\n"
+                f"Suggested question direction: {suggested_question}\n\n"
+                f"{track_note}"
+                "Generate the Factle question. Return ONLY a JSON object with "
+                "these keys, in this order:\n"
+                "- \"question\": the question text\n"
+                "- \"search_query\": a search query that would find an "
+                "authoritative source for verification\n"
+                "- \"answers\": array of exactly 5 correct answers in order "
+                "(index 0 = 1st place, index 4 = 5th place)\n"
+                "- \"source\": a URL where this ranking can be verified\n"
+                "- \"distractors\": array of exactly 15 plausible wrong options"
+            ),
+        },
+    ]
+
+
+def tavily_search_with_retries(search, query, max_results=5):
+    """Run Tavily search with bounded retries so transient timeouts don't crash runs."""
+    errors = []
+
+    with TRACER.span("search", query=query) as span:
+        for attempt in range(1, MAX_SEARCH_RETRIES + 1):
+            try:
+                results = search.search(
+                    query=query, max_results=max_results,
+                    **with_call_timeout({}, SEARCH_TIMEOUT_SECONDS),
+                )
+                backend = results.get("backend", "remote")
+                span["attrs"]["backend"] = backend
+                TRACER.count(f"{backend}_searches")
+                return results, errors
+            except CircuitOpenError as exc:
+                errors.append(str(exc))
+                print(f"  ⚡ Search skipped: {exc}")
+                TRACER.count("search_fast_fails")
+                break
+            except Exception as exc:
+                err_msg = f"attempt {attempt}/{MAX_SEARCH_RETRIES}: {type(exc).__name__}: {exc}"
+                errors.append(err_msg)
+                print(f"  ⚠ Tavily search failed ({err_msg})")
+                span["attrs"]["retries"] = len(errors)
+                TRACER.count("search_failures")
+
+                if BREAKERS.get("search").is_open():
+                    print("  ⚡ Search circuit opened; not retrying.")
+                    break
+                if attempt < MAX_SEARCH_RETRIES:
+                    delay = SEARCH_RETRY_BASE_DELAY_SECONDS * attempt
+                    if not BUDGET.check("search retry", "search", extra_seconds=delay):
+                        print("  ⏰ No run budget left for another search retry.")
+                        break
+                    span["attrs"]["sleep_s"] = span["attrs"].get("sleep_s", 0) + delay
+                    TRACER.count("search_sleep_s", delay)
+                    time.sleep(delay)
 
     return {"results": []}, errors
 
@@ -538,23 +1287,91 @@ def tavily_search_with_retries(search, query, max_results=5):
 # ---------------------------------------------------------------------------
 
 
+@traced("verification_search")
 def search_for_verification(search, question_data, attempt_log, iteration=0):
-    """Search the web for authoritative sources to verify the answer."""
+    """Search the web for authoritative sources to verify the answer.
+
+    Time-sensitive questions skip the local corpus (see is_time_sensitive).
+    """
     query = question_data.get("search_query", question_data.get("question", ""))
+    if is_time_sensitive(f"{question_data.get('question', '')} {query}"):
+        search = live_search(search)
     results, search_errors = tavily_search_with_retries(search, query=query, max_results=5)
+    fetch_source_pages(results, f"{question_data.get('question', '')} {query}")
+    return collect_verification_sources(query, results, search_errors, attempt_log, iteration)
+
+
+_page_fetcher = None
+_page_fetcher_lock = threading.Lock()
+
+
+def get_page_fetcher():
+    """The run's shared PageFetcher (on the process-wide HTTPPool)."""
+    global _page_fetcher
+    with _page_fetcher_lock:
+        if _page_fetcher is None:
+            from page_fetcher import PageFetcher
 
+            _page_fetcher = PageFetcher(
+                PAGE_CACHE_DIR, per_host=PAGE_FETCH_PER_HOST, timeout=PAGE_FETCH_TIMEOUT_SECONDS,
+                pool=http_pool(),
+            )
+        return _page_fetcher
+
+
+@traced("fetch_pages")
+def fetch_source_pages(results, question_text):
+    """Attach the best-matching table or list of each top trusted page.
+
+    The region is stored on the result as "page_region" and shown to the
+    verify model in place of the truncated search snippet.
+
+    Returns:
+        number of results that got a region.
+    """
+    targets = [
+        r for r in results.get("results", [])
+        if r.get("url") and is_source_trustworthy(r["url"])
+    ][:PAGE_FETCH_TOP_N]
+    if not targets or not BUDGET.check("page fetch", "fetch_pages"):
+        return 0
+
+    from page_fetcher import extract_ranked_region
+
+    pages = get_page_fetcher().fetch_many(
+        [r["url"] for r in targets],
+        timeout=BUDGET.timeout_for(PAGE_FETCH_TIMEOUT_SECONDS),
+    )
+    extracted = 0
+    for r in targets:
+        html = pages.get(r["url"])
+        region = extract_ranked_region(html, question_text, PAGE_REGION_MAX_CHARS) if html else ""
+        if region:
+            r["page_region"] = region
+            extracted += 1
+    TRACER.annotate(pages=len(targets), regions=extracted)
+    return extracted
+
+
+def source_text(result):
+    """What the verify model sees of a source: its page region, else the snippet."""
+    return result.get("page_region") or result.get("content", "")[:SOURCE_SNIPPET_CHARS]
+
+
+def collect_verification_sources(query, results, search_errors, attempt_log, iteration=0):
+    """Trim search results into verification sources and log what was found."""
     sources = []
     for r in results.get("results", []):
         sources.append({
             "title": r.get("title", ""),
             "url": r.get("url", ""),
-            "content": r.get("content", "")[:500],
+            "content": source_text(r),
         })
 
-    log_key = f"verification_search_iter{iteration}"
-    attempt_log[log_key] = {
+    attempt_log.iteration(iteration).verification_search = {
         "query": query,
         "sources_found": [{"title": s["title"], "url": s["url"]} for s in sources],
+        "pages_extracted": sum(1 for r in results.get("results", []) if r.get("page_region")),
         "search_errors": search_errors,
     }
 
@@ -566,86 +1383,197 @@ def search_for_verification(search, question_data, attempt_log, iteration=0):
 # ---------------------------------------------------------------------------
 
 
+@traced("cross_check")
 def cross_check(llm, question_text, answers, sources, attempt_log, iteration=0):
     """Cross-check answers against web sources. Works for both initial and
     corrected answers."""
-    sources_text = "\n\n".join(
-        f"Source: {s['title']} ({s['url']})\n{s['content']}" for s in sources
+    response = verify_llm_create(
+        llm,
+        "cross_check",
+        messages=build_cross_check_messages(question_text, answers, sources),
+        response_format={"type": "json_object"},
     )
+    return record_cross_check(load_llm_json(llm, response, CROSS_CHECK_SCHEMA), answers, attempt_log, iteration)
 
-    response = llm_create(
+
+@traced("cross_check")
+def cross_check_streaming(llm, question_text, answers, sources, attempt_log, iteration=0):
+    """Streamed cross_check that stops reading once the verdict is VERIFIED.
+
+    The prompt asks for status, best_source and answer_values first; for a
+    VERIFIED verdict those are all the verify loop uses, so the long
+    free-text reason is not waited for.
+    """
+    fields = {}
+
+    def on_field(key, value):
+        fields[key] = value
+        return (
+            str(fields.get("status", "")).strip().upper() == "VERIFIED"
+            and all(k in fields for k in CROSS_CHECK_EARLY_STOP_FIELDS)
+        )
+
+    parser, stopped = llm_stream(
         llm,
         model=LLM_MODEL_VERIFY,
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You are a meticulous fact-checker. You compare a trivia answer "
-                    "against authoritative web source data. The ORDER of the answers "
-                    "is critical — this is a ranking question.\n\n"
-                    "Be very careful about ordering. If the source clearly shows a "
-                    "different order, you MUST correct it. If you can verify some "
-                    "answers but not the exact order, try to provide the correct "
-                    "order from the source data.\n\n"
-                    "SOURCE QUALITY: For 'best_source', strongly prefer authoritative "
-                    "and official sources (e.g. Wikipedia, official organization sites, "
-                    "government databases, established news outlets, sports governing "
-                    "bodies). NEVER return social media links (Facebook, Reddit, Twitter, "
-                    "Instagram) or personal blogs as best_source.\n\n"
-                    "If the source data contains enough information to determine the "
-                    "correct answers and order, use it — don't give up too easily."
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Question: {question_text}\n\n"
-                    f"Proposed answers (in order, 1st to 5th):\n"
-                    f"1. {answers[0]}\n"
-                    f"2. {answers[1]}\n"
-                    f"3. {answers[2]}\n"
-                    f"4. {answers[3]}\n"
-                    f"5. {answers[4]}\n\n"
-                    f"Web source data:\n{sources_text}\n\n"
-                    "Based on the source data, are these answers correct AND in the "
-                    "right order?\n\n"
-                    "Respond with ONLY a JSON object:\n"
-                    "- \"status\": one of \"VERIFIED\", \"CORRECTED\", or \"UNVERIFIABLE\"\n"
-                    "- \"best_source\": the URL of the most authoritative source used\n"
-                    "- \"answer_values\": array of 5 numbers, the actual numeric values "
-                    "for each answer (e.g. medal counts, population, revenue). Use the "
-                    "same unit for all. If values are unknown, use null.\n"
-                    "- \"corrected_answers\": (only if CORRECTED) array of 5 answers in "
-                    "the correct order\n"
-                    "- \"corrected_values\": (only if CORRECTED) array of 5 numeric values "
-                    "matching corrected_answers\n"
-                    "- \"reason\": detailed explanation of your finding, including what "
-                    "the sources say\n\n"
-                    "Use VERIFIED if the answers match the sources in both "
-                    "content and order.\n"
-                    "Use CORRECTED if you can determine the right answers/order from "
-                    "the sources. Provide the corrected list.\n"
-                    "Use UNVERIFIABLE ONLY if the source data truly has no relevant "
-                    "information about this question."
-                ),
-            },
-        ],
+        on_field=on_field,
+        messages=build_cross_check_messages(question_text, answers, sources),
         response_format={"type": "json_object"},
     )
+    if stopped:
+        TRACER.count("cross_check_early_stops")
+        result = load_llm_text(llm, json.dumps(parser.fields), CROSS_CHECK_SCHEMA)
+        if result is not None:
+            result.setdefault("reason", "Stream stopped early after a VERIFIED verdict")
+    else:
+        result = load_llm_text(llm, parser.text, CROSS_CHECK_SCHEMA)
+    return record_cross_check(result, answers, attempt_log, iteration)
 
-    try:
-        result = json.loads(response.choices[0].message.content)
-        log_key = f"cross_check_iter{iteration}"
-        attempt_log[log_key] = {
-            "status": result.get("status"),
-            "reason": result.get("reason"),
-            "proposed_answers": list(answers),
-            "corrected_answers": result.get("corrected_answers"),
-            "best_source": result.get("best_source"),
+
+@traced("cross_check_vote")
+def cross_check_vote(llm, question_text, answers, sources, attempt_log, votes, iteration=0):
+    """Cross-check with several independent sampled verdicts in one round.
+
+    The votes are requested as n choices of one completion (topped up with
+    concurrent calls if the endpoint returns fewer) and aggregated into a
+    consensus order with a confidence (see voting.aggregate_votes).  A
+    confident consensus is reported as VERIFIED (the proposed order) or
+    CORRECTED (a different order, already confirmed by the vote); anything
+    else as UNVERIFIABLE.  Malformed verdicts abstain instead of costing
+    JSON repair calls.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from voting import aggregate_votes
+
+    messages = build_cross_check_messages(question_text, answers, sources)
+
+    def sample(n):
+        response = llm_create(
+            llm,
+            model=LLM_MODEL_VERIFY,
+            messages=messages,
+            response_format={"type": "json_object"},
+            temperature=VOTE_TEMPERATURE,
+            n=n,
+        )
+        return [choice.message.content for choice in response.choices[:n]]
+
+    contents = sample(votes)
+    if len(contents) < votes:
+        missing = votes - len(contents)
+        with ThreadPoolExecutor(max_workers=missing) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, sample, 1) for _ in range(missing)]
+            for future in futures:
+                try:
+                    contents.extend(future.result())
+                except CircuitOpenError:
+                    raise
+                except Exception as exc:
+                    print(f"  ⚠ Cross-check vote failed: {type(exc).__name__}: {exc}")
+    verdicts = []
+    for content in contents:
+        verdict, errors = check_llm_json(content, CROSS_CHECK_SCHEMA)
+        verdicts.append(None if errors else verdict)
+
+    vote = aggregate_votes(verdicts, answers)
+    attempt_log.iteration(iteration).vote = vote
+    summary = (
+        f"{vote['agreeing']}/{vote['votes']} votes for this exact order, "
+        f"{vote['abstained']} abstained, confidence {vote['confidence']:.2f}"
+    )
+    print(f"  🗳️  Consensus {vote['order']}: {summary}")
+    if not vote["order"] or vote["confidence"] < VOTE_MIN_CONFIDENCE:
+        result = {"status": "UNVERIFIABLE", "reason": f"No confident consensus: {summary}"}
+    elif vote["order"] == list(answers):
+        result = {"status": "VERIFIED", "answer_values": vote["values"], "reason": f"Consensus: {summary}"}
+    else:
+        result = {
+            "status": "CORRECTED",
+            "corrected_answers": vote["order"],
+            "corrected_values": vote["values"],
+            "reason": f"Consensus correction: {summary}",
         }
-        return result
-    except (json.JSONDecodeError, IndexError):
+    sources_cited = Counter(v.get("best_source") for v in verdicts if v and v.get("best_source"))
+    if sources_cited:
+        result["best_source"] = sources_cited.most_common(1)[0][0]
+    result["vote"] = vote
+    return record_cross_check(result, answers, attempt_log, iteration)
+
+
+def build_cross_check_messages(question_text, answers, sources):
+    """Build the chat messages for cross-checking answers against sources."""
+    sources_text = "\n\n".join(
+        f"Source: {s['title']} ({s['url']})\n{s['content']}" for s in sources
+    )
+
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a meticulous fact-checker. You compare a trivia answer "
+                "against authoritative web source data. The ORDER of the answers "
+                "is critical — this is a ranking question.\n\n"
+                "Be very careful about ordering. If the source clearly shows a "
+                "different order, you MUST correct it. If you can verify some "
+                "answers but not the exact order, try to provide the correct "
+                "order from the source data.\n\n"
+                "SOURCE QUALITY: For 'best_source', strongly prefer authoritative "
+                "and official sources (e.g. Wikipedia, official organization sites, "
+                "government databases, established news outlets, sports governing "
+                "bodies). NEVER return social media links (Facebook, Reddit, Twitter, "
+                "Instagram) or personal blogs as best_source.\n\n"
+                "If the source data contains enough information to determine the "
+                "correct answers and order, use it — don't give up too easily."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Question: {question_text}\n\n"
+                f"Proposed answers (in order, 1st to 5th):\n"
+                f"1. {answers[0]}\n"
+                f"2. {answers[1]}\n"
+                f"3. {answers[2]}\n"
+                f"4. {answers[3]}\n"
+                f"5. {answers[4]}\n\n"
+                f"Web source data:\n{sources_text}\n\n"
+                "Based on the source data, are these answers correct AND in the "
+                "right order?\n\n"
+                "Respond with ONLY a JSON object:\n"
+                "- \"status\": one of \"VERIFIED\", \"CORRECTED\", or \"UNVERIFIABLE\"\n"
+                "- \"best_source\": the URL of the most authoritative source used\n"
+                "- \"answer_values\": array of 5 numbers, the actual numeric values "
+                "for each answer (e.g. medal counts, population, revenue). Use the "
+                "same unit for all. If values are unknown, use null.\n"
+                "- \"corrected_answers\": (only if CORRECTED) array of 5 answers in "
+                "the correct order\n"
+                "- \"corrected_values\": (only if CORRECTED) array of 5 numeric values "
+                "matching corrected_answers\n"
+                "- \"reason\": detailed explanation of your finding, including what "
+                "the sources say\n\n"
+                "Use VERIFIED if the answers match the sources in both "
+                "content and order.\n"
+                "Use CORRECTED if you can determine the right answers/order from "
+                "the sources. Provide the corrected list.\n"
+                "Use UNVERIFIABLE ONLY if the source data truly has no relevant "
+                "information about this question."
+            ),
+        },
+    ]
+
+
+def record_cross_check(result, answers, attempt_log, iteration=0):
+    """Log a cross-check verdict; unparseable responses count as UNVERIFIABLE."""
+    if result is None:
         return {"status": "UNVERIFIABLE", "reason": "Failed to parse cross-check response"}
+    attempt_log.iteration(iteration).cross_check = {
+        "status": result.get("status"),
+        "reason": result.get("reason"),
+        "proposed_answers": list(answers),
+        "corrected_answers": result.get("corrected_answers"),
+        "best_source": result.get("best_source"),
+    }
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -653,81 +1581,269 @@ def cross_check(llm, question_text, answers, sources, attempt_log, iteration=0):
 # ---------------------------------------------------------------------------
 
 
-def re_verify_correction(llm, search, question_text, corrected_answers, attempt_log, iteration=0):
+@traced("re_verify")
+def re_verify_correction(llm, search, question_text, corrected_answers, attempt_log, iteration=0,
+                         disputed=None):
     """
     When answers were corrected by the cross-check, do a second round of
     verification with a more targeted search to confirm the corrected order.
+    disputed is the adjacent answer pair the consistency check doubts, if
+    any; the search then targets that pair instead of the top two.
+
+    The search always goes to the live web: served from the local corpus it
+    could return the very sources the cross-check just used, and the second
+    check would not be independent.
     """
-    top_two = corrected_answers[:2]
-    specific_query = (
-        f"{question_text} "
-        f"{top_two[0]} vs {top_two[1]} ranking list"
-    )
+    specific_query = build_re_verify_query(question_text, corrected_answers, disputed)
 
     results, search_errors = tavily_search_with_retries(
-        search, query=specific_query, max_results=5
+        live_search(search), query=specific_query, max_results=5
+    )
+    fetch_source_pages(results, specific_query)
+
+    response = verify_llm_create(
+        llm,
+        "re_verify",
+        messages=build_re_verify_messages(question_text, corrected_answers, results),
+        response_format={"type": "json_object"},
+    )
+    return record_re_verify(
+        load_llm_json(llm, response, RE_VERIFY_SCHEMA),
+        specific_query, results, search_errors, attempt_log, iteration,
+    )
+
+
+def build_re_verify_query(question_text, corrected_answers, disputed=None):
+    """Build a targeted search query around the disputed pair, else the top two."""
+    pair = disputed or corrected_answers[:2]
+    return (
+        f"{question_text} "
+        f"{pair[0]} vs {pair[1]} ranking list"
     )
+
+
+def build_re_verify_messages(question_text, corrected_answers, results):
+    """Build the chat messages for confirming a corrected order."""
     sources_text = "\n\n".join(
-        f"Source: {r.get('title', '')} ({r.get('url', '')})\n{r.get('content', '')[:500]}"
+        f"Source: {r.get('title', '')} ({r.get('url', '')})\n{source_text(r)}"
         for r in results.get("results", [])
     )
 
-    response = llm_create(
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a fact-checker performing a SECOND verification of a "
+                "corrected trivia answer. A previous check corrected the order "
+                "of answers. You must confirm or reject this corrected order "
+                "using the new source data provided. Be very strict about ordering."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Question: {question_text}\n\n"
+                f"Corrected answers (in order, 1st to 5th):\n"
+                f"1. {corrected_answers[0]}\n"
+                f"2. {corrected_answers[1]}\n"
+                f"3. {corrected_answers[2]}\n"
+                f"4. {corrected_answers[3]}\n"
+                f"5. {corrected_answers[4]}\n\n"
+                f"Additional source data:\n{sources_text}\n\n"
+                "Based on this additional source data, is the corrected order "
+                "confirmed?\n\n"
+                "Respond with ONLY a JSON object:\n"
+                "- \"status\": \"CONFIRMED\" or \"REJECTED\"\n"
+                "- \"reason\": brief explanation\n"
+                "- \"best_source\": URL of the most authoritative source\n"
+                "- \"answer_values\": array of 5 numbers, the actual numeric "
+                "values for each answer. If values are unknown, use null."
+            ),
+        },
+    ]
+
+
+def record_re_verify(result, specific_query, results, search_errors, attempt_log, iteration=0):
+    """Log a re-verification verdict; unparseable responses count as REJECTED."""
+    if result is None:
+        attempt_log.iteration(iteration).re_verify = {"error": "Failed to parse response"}
+        return {"status": "REJECTED", "reason": "Failed to parse re-verification response"}
+    attempt_log.iteration(iteration).re_verify = {
+        "search_query": specific_query,
+        "sources_found": [
+            {"title": r.get("title", ""), "url": r.get("url", "")}
+            for r in results.get("results", [])
+        ],
+        "search_errors": search_errors,
+        "status": result.get("status"),
+        "reason": result.get("reason"),
+        "best_source": result.get("best_source"),
+    }
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Async counterparts of discovery and the coverage filter
+#
+# Same prompts, parsing and logging as the sync steps above, but awaitable
+# over the pooled async clients so their independent calls run concurrently.
+# The per-topic steps (similarity, generation, verification) stay sync only:
+# they are sequential anyway, and one copy keeps --async-io on the same
+# evidence (page fetches, hedging, the local corpus) as the default path.
+# ---------------------------------------------------------------------------
+
+
+async def llm_create_async(llm, model, **kwargs):
+    """Awaitable llm_create with the same rate-limit and circuit-breaker downgrade."""
+    with_call_timeout(kwargs, HTTP_READ_TIMEOUT_SECONDS)
+    with TRACER.span("llm", model=model):
+        try:
+            return await BREAKERS.get(f"llm:{model}").call_async(
+                llm.chat.completions.create, model=model, **kwargs
+            )
+        except Exception as exc:
+            if model == LLM_MODEL_FALLBACK or not should_downgrade(exc):
+                raise
+            print(downgrade_notice(model, exc))
+            TRACER.annotate(downgraded_to=LLM_MODEL_FALLBACK)
+            TRACER.count("model_downgrades")
+            return await BREAKERS.get(f"llm:{LLM_MODEL_FALLBACK}").call_async(
+                llm.chat.completions.create, model=LLM_MODEL_FALLBACK, **kwargs
+            )
+
+
+async def load_llm_json_async(llm, response, schema):
+    """Awaitable load_llm_json."""
+    content = response_content(response)
+    result, errors = check_llm_json(content, schema)
+    if not errors:
+        return result
+
+    print(f"  ⚠ Malformed {schema['name']} response ({'; '.join(errors)}). Requesting JSON repair...")
+    TRACER.count("json_repair_calls")
+    fixed = await llm_create_async(
         llm,
         model=LLM_MODEL_VERIFY,
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You are a fact-checker performing a SECOND verification of a "
-                    "corrected trivia answer. A previous check corrected the order "
-                    "of answers. You must confirm or reject this corrected order "
-                    "using the new source data provided. Be very strict about ordering."
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Question: {question_text}\n\n"
-                    f"Corrected answers (in order, 1st to 5th):\n"
-                    f"1. {corrected_answers[0]}\n"
-                    f"2. {corrected_answers[1]}\n"
-                    f"3. {corrected_answers[2]}\n"
-                    f"4. {corrected_answers[3]}\n"
-                    f"5. {corrected_answers[4]}\n\n"
-                    f"Additional source data:\n{sources_text}\n\n"
-                    "Based on this additional source data, is the corrected order "
-                    "confirmed?\n\n"
-                    "Respond with ONLY a JSON object:\n"
-                    "- \"status\": \"CONFIRMED\" or \"REJECTED\"\n"
-                    "- \"reason\": brief explanation\n"
-                    "- \"best_source\": URL of the most authoritative source\n"
-                    "- \"answer_values\": array of 5 numbers, the actual numeric "
-                    "values for each answer. If values are unknown, use null."
-                ),
-            },
-        ],
+        messages=build_json_repair_messages(content, schema, errors),
         response_format={"type": "json_object"},
     )
+    result, errors = check_llm_json(response_content(fixed), schema)
+    if errors:
+        print(f"  ❌ JSON repair failed: {'; '.join(errors)}")
+        TRACER.count("json_repair_failures")
+        return None
+    return result
 
-    try:
-        result = json.loads(response.choices[0].message.content)
-        log_key = f"re_verify_iter{iteration}"
-        attempt_log[log_key] = {
-            "search_query": specific_query,
-            "sources_found": [
-                {"title": r.get("title", ""), "url": r.get("url", "")}
-                for r in results.get("results", [])
-            ],
-            "search_errors": search_errors,
-            "status": result.get("status"),
-            "reason": result.get("reason"),
-            "best_source": result.get("best_source"),
-        }
-        return result
-    except (json.JSONDecodeError, IndexError):
-        attempt_log[f"re_verify_iter{iteration}"] = {"error": "Failed to parse response"}
-        return {"status": "REJECTED", "reason": "Failed to parse re-verification response"}
+
+async def tavily_search_with_retries_async(search, query, max_results=5):
+    """Awaitable tavily_search_with_retries."""
+    import asyncio
+
+    errors = []
+
+    with TRACER.span("search", query=query) as span:
+        for attempt in range(1, MAX_SEARCH_RETRIES + 1):
+            try:
+                return await search.search(
+                    query=query, max_results=max_results,
+                    **with_call_timeout({}, SEARCH_TIMEOUT_SECONDS),
+                ), errors
+            except CircuitOpenError as exc:
+                errors.append(str(exc))
+                print(f"  ⚡ Search skipped: {exc}")
+                TRACER.count("search_fast_fails")
+                break
+            except Exception as exc:
+                err_msg = f"attempt {attempt}/{MAX_SEARCH_RETRIES}: {type(exc).__name__}: {exc}"
+                errors.append(err_msg)
+                print(f"  ⚠ Tavily search failed ({err_msg})")
+                span["attrs"]["retries"] = len(errors)
+                TRACER.count("search_failures")
+
+                if BREAKERS.get("search").is_open():
+                    print("  ⚡ Search circuit opened; not retrying.")
+                    break
+                if attempt < MAX_SEARCH_RETRIES:
+                    delay = SEARCH_RETRY_BASE_DELAY_SECONDS * attempt
+                    if not BUDGET.check("search retry", "search", extra_seconds=delay):
+                        print("  ⏰ No run budget left for another search retry.")
+                        break
+                    span["attrs"]["sleep_s"] = span["attrs"].get("sleep_s", 0) + delay
+                    TRACER.count("search_sleep_s", delay)
+                    await asyncio.sleep(delay)
+
+    return {"results": []}, errors
+
+
+@traced("discover_topics")
+async def discover_topics_async(llm, search, run_log, recent_questions=None):
+    """Awaitable discover_topics; the discovery searches run concurrently."""
+    import asyncio
+
+    today = datetime.now(CET)
+    queries = get_discovery_queries(today)
+    outcomes = await asyncio.gather(*(
+        tavily_search_with_retries_async(search, query=query, max_results=5)
+        for query in queries
+    ))
+
+    all_search_results = []
+    raw_search_log = []
+    for query, (results, search_errors) in zip(queries, outcomes):
+        items = results.get("results", [])
+        all_search_results.extend(items)
+        raw_search_log.append(summarize_discovery_search(query, items, search_errors))
+
+    events = calendar_events(today)
+    run_log["step1_topic_discovery"] = {"searches": raw_search_log, "calendar": summarize_calendar(events)}
+
+    response = await llm_create_async(
+        llm,
+        model=LLM_MODEL_CREATIVE,
+        messages=build_discovery_messages(today, all_search_results, recent_questions, events),
+        response_format={"type": "json_object"},
+    )
+    return record_discovered_topics(await load_llm_json_async(llm, response, DISCOVERY_SCHEMA), run_log)
+
+
+@traced("topic_dedup")
+async def filter_recently_covered_topics_async(llm, topics, recent_questions, run_log):
+    """Awaitable filter_recently_covered_topics; topics are checked concurrently."""
+    import asyncio
+
+    if not recent_questions:
+        run_log["step1b_topic_dedup"] = {"skipped": True, "reason": "No recent questions"}
+        return topics
+
+    filtered = []
+    dedup_log = []
+    ambiguous = []
+    for topic_info in topics:
+        related = taxonomy_dedup(topic_info, recent_questions, dedup_log, filtered)
+        if related is not None:
+            ambiguous.append((topic_info, related))
+
+    responses = await asyncio.gather(*(
+        llm_create_async(
+            llm,
+            model=LLM_MODEL_VERIFY,
+            messages=build_topic_dedup_messages(topic_info, get_recent_topics_summary(related)),
+            response_format={"type": "json_object"},
+        )
+        for topic_info, related in ambiguous
+    ))
+    for (topic_info, _), response in zip(ambiguous, responses):
+        record_topic_dedup(await load_llm_json_async(llm, response, TOPIC_DEDUP_SCHEMA), topic_info, dedup_log, filtered)
+    filtered.sort(key=topics.index)
+
+    run_log["step1b_topic_dedup"] = {
+        "recent_questions_count": len(recent_questions),
+        "topics_before": len(topics),
+        "topics_after": len(filtered),
+        "details": dedup_log,
+    }
+
+    return filtered
 
 
 # ---------------------------------------------------------------------------
@@ -819,19 +1935,21 @@ def validate_question_entry(entry):
 
 
 def assemble_question_entry(date_str, question_data, answers, source_url, next_id):
-    """Assemble the final question JSON entry."""
+    """Assemble the final question entry (a models.Question)."""
+    from models import Question
+
     # Combine answers + distractors into the 20 options
     distractors = question_data.get("distractors", [])
     options = list(answers) + distractors
 
-    return {
-        "id": next_id,
-        "date": date_str,
-        "question": question_data["question"],
-        "options": options,
-        "answers": list(answers),
-        "source": source_url,
-    }
+    return Question(
+        id=next_id,
+        date=date_str,
+        question=question_data["question"],
+        options=options,
+        answers=list(answers),
+        source=source_url,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -839,18 +1957,72 @@ def assemble_question_entry(date_str, question_data, answers, source_url, next_i
 # ---------------------------------------------------------------------------
 
 
-def save_question(entry, questions):
-    """Append the new question to questions.json."""
-    questions.append(entry)
-    data = {"questions": questions}
-    with open(QUESTIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+# Overlapping jobs each plan from the snapshot they loaded; commits re-read
+# the file under its lock and apply the job's change on top (store.py).
+
+
+def report_drift(kind, record):
+    """Warn about keys a record has beyond its model (see models.py)."""
+    unknown = record.unknown_fields()
+    if unknown:
+        print(f"  ⚠ {kind} has field(s) not in models.py: {', '.join(unknown)}")
+        TRACER.count("schema_drift")
+
+
+def report_merge(store):
+    if store.merged:
+        print(f"  🔀 {store.path.name} was changed by another job since it was loaded; merged.")
+        TRACER.count("store_merges")
+
+
+def tag_question(entry):
+    """Set entry's taxonomy tags (see taxonomy.py) under "tags"; returns entry."""
+    from taxonomy import tag_text
+
+    entry["tags"] = tag_text(entry["question"])
+    return entry
+
+
+def claim_date(questions, entry):
+    """Append entry under the next free id, unless its date is already taken.
+
+    Returns entry (with its re-assigned id), or None.
+    """
+    if any(q.get("date") == entry["date"] for q in questions):
+        return None
+    entry["id"] = max((q.get("id", 0) for q in questions), default=0) + 1
+    questions.append(entry.to_dict())
+    return entry
+
 
+def commit_question(entry):
+    """Publish entry (a models.Question) to questions.json.
 
-def save_log(log):
-    """Save the generation log."""
-    with open(LOG_FILE, "w", encoding="utf-8") as f:
-        json.dump(log, f, indent=4, ensure_ascii=False)
+    Returns the entry as saved (its id re-assigned at commit time), or None
+    if another job published a question for the same date meanwhile.
+    """
+    tag_question(entry)
+    report_drift("Question", entry)
+    store = questions_store()
+    with store.transaction() as data:
+        committed = claim_date(data.setdefault("questions", []), entry)
+    report_merge(store)
+    return committed
+
+
+def commit_run_log(run_log):
+    """Append one run's record (a models.Run) to the generation log, its
+    sources stored once in the evidence store and referenced by hash."""
+    from evidence import compact
+
+    report_drift("Run log", run_log)
+    evidence = evidence_store()
+    record = compact(run_log.to_dict(), evidence)
+    evidence.flush()
+    store = log_store()
+    with store.transaction() as log:
+        log.setdefault("runs", []).append(record)
+    report_merge(store)
 
 
 # ---------------------------------------------------------------------------
@@ -878,7 +2050,7 @@ FALLBACK_TOPIC_IDEAS = [
 ]
 
 
-def get_fallback_topics(questions):
+def get_fallback_topics(questions, limit=MAX_TOPIC_ATTEMPTS):
     """Return fallback topic ideas that haven't been used as questions yet."""
     used_questions_lower = {q["question"].lower() for q in questions}
     fallbacks = []
@@ -886,170 +2058,206 @@ def get_fallback_topics(questions):
         # Skip if a very similar question was already used
         if idea["suggested_question"].lower() not in used_questions_lower:
             fallbacks.append(idea)
-    return fallbacks[:MAX_TOPIC_ATTEMPTS]
+    return fallbacks[:limit]
 
 
 # ---------------------------------------------------------------------------
-# Main orchestrator
+# Topic pool: discovered candidates carried over to the next runs
 # ---------------------------------------------------------------------------
 
+# A discovery pass yields 8-10 vetted candidates and a run usually needs one
+# or two.  The rest wait in the pool for TOPIC_POOL_TTL_DAYS, so most nights
+# start from it and skip the discovery searches and the gpt-5 call.
 
-def run(dry_run=False):
-    """Main generation pipeline."""
-    print("=" * 60)
-    print("Factle Daily Question Generator")
-    print("=" * 60)
 
-    # Initialize
-    llm, search = create_clients()
-    questions = load_questions()
-    log = load_log()
-    today = datetime.now(CET)
-    date_str = today.strftime("%Y-%m-%d")
-    next_id = max((q.get("id", 0) for q in questions), default=0) + 1
-    previous_summary = get_previous_questions_summary(questions)
+def topic_pool_store():
+    return json_store(TOPIC_POOL_FILE, lambda: {"candidates": []}, key="candidates")
 
-    # Check if question already exists for today
-    if any(q.get("date") == date_str for q in questions):
-        print(f"Question for {date_str} already exists. Skipping.")
-        return
 
-    run_log = {
-        "date": date_str,
-        "topics_discovered": [],
-        "attempts": [],
-        "result": "pending",
-    }
+def topic_key(topic_info):
+    return " ".join(str(topic_info.get("suggested_question", "")).split()).casefold()
 
-    print(f"\nDate: {date_str}")
-    print(f"Previous questions: {len(questions)}")
-    print(f"Next ID: {next_id}")
 
-    # ------------------------------------------------------------------
-    # Step 1: Discover topics
-    # ------------------------------------------------------------------
-    print("\n--- Step 1: Discovering current topics ---")
-    recent_questions = get_recent_questions(questions, days=7)
-    topics = discover_topics(llm, search, run_log, recent_questions=recent_questions)
+def pooled_topics(date_str):
+    """Pooled candidates still fresh on date_str, in the order discovery ranked them."""
+    return [c for c in topic_pool_store().read().get("candidates", []) if c.get("expires", "") >= date_str]
 
-    if not topics:
-        print("WARNING: No topics discovered from current events.")
-        print("Using fallback topic ideas (still verified through pipeline).")
-        topics = get_fallback_topics(questions)
-        run_log["fallback_used"] = True
-        if not topics:
-            run_log["result"] = "failed_no_topics"
-            print("CRITICAL: No topics available at all!")
-            log["runs"].append(run_log)
-            if not dry_run:
-                save_log(log)
-            sys.exit(1)
 
-    run_log["topics_discovered"] = [
-        {
-            "topic": t.get("topic", "unknown"),
-            "suggested_question": t.get("suggested_question", "unknown"),
-            "connection": t.get("connection", ""),
-        }
-        for t in topics
-    ]
-    print(f"Found {len(topics)} candidate topics:")
-    for i, t in enumerate(topics):
-        print(f"  {i+1}. [{t.get('topic', 'N/A')}] {t.get('suggested_question', 'N/A')}")
-        print(f"      Connection: {t.get('connection', 'N/A')}")
+def commit_topic_pool(date_str, discovered, consumed):
+    """Add newly discovered candidates to the pool, dropping the consumed
+    (attempted, or covered by a recent question) and expired ones.
 
-    # ------------------------------------------------------------------
-    # Step 1b: Filter topics covered in the last 7 days
-    # ------------------------------------------------------------------
-    print("\n--- Step 1b: Filtering recently covered topics (7-day window) ---")
-    recent_questions = get_recent_questions(questions, days=7)
-    print(f"Found {len(recent_questions)} questions from the past 7 days")
-    if recent_questions:
-        for rq in recent_questions:
-            print(f"  - [{rq['date']}] {rq['question']}")
+    Returns the pool size.
+    """
+    expires = (datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=TOPIC_POOL_TTL_DAYS)).strftime("%Y-%m-%d")
+    dropped = {topic_key(t) for t in consumed}
+    store = topic_pool_store()
+    with store.transaction() as pool:
+        candidates = [c for c in pool.get("candidates", []) if c.get("expires", "") >= date_str]
+        known = {topic_key(c) for c in candidates}
+        for t in discovered:
+            if topic_key(t) in known:
+                continue
+            known.add(topic_key(t))
+            candidates.append({
+                "topic": t.get("topic", ""),
+                "suggested_question": t.get("suggested_question", ""),
+                "connection": t.get("connection", ""),
+                "discovered": date_str,
+                "expires": expires,
+                "tags": topic_tags(t),
+            })
+        pool["candidates"] = [c for c in candidates if topic_key(c) not in dropped]
+        size = len(pool["candidates"])
+    report_merge(store)
+    return size
+
+
+def consumed_topics(run_log, covered):
+    """The candidates a run used up: every attempted topic (main track and
+    extra tracks) and the covered ones the 7-day coverage filter dropped."""
+    attempted = list(run_log["attempts"])
+    for track_log in (run_log.get("tracks") or {}).values():
+        attempted += track_log.get("attempts", [])
+    return attempted + list(covered)
+
+
+def save_topic_pool(run_log, date_str, discovered, covered):
+    size = commit_topic_pool(date_str, discovered, consumed_topics(run_log, covered))
+    run_log["topic_pool"]["size"] = size
+    print(f"Topic pool: {size} candidate(s) kept for the next runs")
 
-    topics = filter_recently_covered_topics(llm, topics, recent_questions, run_log)
-    print(f"Topics remaining after dedup: {len(topics)}")
 
-    if not topics:
-        print("WARNING: All topics filtered by recent coverage check.")
-        if not run_log.get("fallback_used"):
-            print("Falling through to fallback topics.")
-        # Let the attempt loop handle the empty list — it will fall
-        # through to the fallback section below.
+# ---------------------------------------------------------------------------
+# Step 1c: Order candidates by expected cost per verified question
+# ---------------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Step 2: Attempt loop (outer: topics, inner: verify retries)
-    # ------------------------------------------------------------------
-    success = False
-    final_entry = None
 
-    for attempt_idx, topic_info in enumerate(topics[:MAX_TOPIC_ATTEMPTS]):
-        topic = topic_info.get("topic", "")
-        suggested_q = topic_info.get("suggested_question", "")
-        attempt_log = {
-            "topic": topic,
-            "suggested_question": suggested_q,
-            "connection": topic_info.get("connection", ""),
-            "status": "pending",
-            "reason": "",
-            "verify_iterations": 0,
-        }
+def train_verifiability_model(log):
+    """Fit the offline verifiability predictor on every labeled past attempt.
 
-        print(f"\n{'='*50}")
-        print(f"Attempt {attempt_idx + 1}/{MAX_TOPIC_ATTEMPTS}: {topic}")
-        print(f"Question: {suggested_q}")
-        print(f"{'='*50}")
+    Returns:
+        (model, scores) where scores is its cross-validated Brier score
+        against the base rate's (predictor.evaluate).
+    """
+    from predictor import VerifiabilityModel, evaluate, training_examples
 
-        # 2a. Similarity check
-        print("  [Step 2a] Checking similarity...")
-        if is_too_similar(llm, topic, suggested_q, previous_summary, attempt_log):
-            print("  ❌ Too similar to a previous question. Skipping.")
-            attempt_log["status"] = "skipped_similar"
-            attempt_log["reason"] = "Too similar to previous question"
-            run_log["attempts"].append(attempt_log)
-            continue
+    examples = list(training_examples(log))
+    with TRACER.span("train_predictor") as span:
+        model = VerifiabilityModel().fit(examples)
+        scores = evaluate(examples)
+        span["attrs"].update(scores)
+    return model, scores
 
-        # 2b. Generate question
-        print("  [Step 2b] Generating question...")
-        question_data = generate_question(llm, topic, suggested_q)
-        if not question_data or "answers" not in question_data or len(question_data.get("answers", [])) != 5:
-            print("  ❌ Failed to generate valid question. Skipping.")
-            attempt_log["status"] = "generation_failed"
-            attempt_log["reason"] = "LLM did not return valid question structure"
-            run_log["attempts"].append(attempt_log)
-            continue
 
-        question_text = question_data["question"]
-        attempt_log["generated_question"] = {
-            "question": question_text,
-            "answers": question_data["answers"],
-            "distractors": question_data.get("distractors", []),
-            "suggested_source": question_data.get("source", ""),
+def predictor_is_useful(scores):
+    """Whether the predictor beats the base rate by PREDICTOR_MIN_BRIER_GAIN."""
+    if scores["brier"] is None:
+        return False
+    return scores["baseline_brier"] - scores["brier"] >= PREDICTOR_MIN_BRIER_GAIN
+
+
+def rank_topics_by_expected_cost(topics, model, run_log, label="ranked"):
+    """Reorder topics so the cheapest expected verified question comes first.
+
+    One attempt costs roughly a similarity check, a generation and the
+    predicted number of verify iterations (latencies from the run budget);
+    dividing by the predicted success probability gives the expected cost
+    per success.  The sort is stable, so equal scores keep discovery order.
+    Without a model (see predictor_is_useful) topics keep their order.
+    """
+    from predictor import attempt_text
+
+    if not topics or model is None or not model.examples:
+        return topics
+
+    scored = []
+    for t in topics:
+        p_success, iterations = model.predict(attempt_text(t))
+        iterations = min(max(iterations, 1.0), MAX_VERIFY_RETRIES)
+        attempt_cost = (
+            BUDGET.estimate("similarity_check")
+            + BUDGET.estimate("generate_question")
+            + iterations * BUDGET.estimate("verify_iteration")
+        )
+        scored.append((attempt_cost / max(p_success, 0.02), p_success, iterations, t))
+    scored.sort(key=lambda s: s[0])
+
+    ranking = run_log.setdefault("step1c_topic_ranking", {"training_examples": model.examples})
+    ranking[label] = [
+        {
+            "topic": t.get("topic", ""),
+            "p_success": round(p, 3),
+            "expected_iterations": round(it, 2),
+            "expected_cost_s": round(cost),
         }
+        for cost, p, it, t in scored
+    ]
+    for cost, p, it, t in scored:
+        print(f"  {p:>4.0%} success, ~{it:.1f} iterations, ~{cost / 60:.0f} min/success  {t.get('topic', '')}")
+    return [t for _, _, _, t in scored]
+
+
+# ---------------------------------------------------------------------------
+# Step 2: Per-topic pipeline (similarity → generate → verify → validate)
+# ---------------------------------------------------------------------------
 
-        print(f"  Question: {question_text}")
-        print(f"  Initial answers: {question_data['answers']}")
 
-        # ----------------------------------------------------------
-        # Inner verification loop: retry up to MAX_VERIFY_RETRIES
-        # for the SAME question, correcting the order each time
-        # ----------------------------------------------------------
-        current_answers = list(question_data["answers"])
-        source_url = question_data.get("source", "")
-        verified = False
+def pick_verified_source(check_result, sources, source_url):
+    """Pick the source URL for a VERIFIED cross-check, preferring trusted ones."""
+    candidate_source = check_result.get("best_source", "")
+    if candidate_source and is_source_trustworthy(candidate_source):
+        return candidate_source
+    # Pick first trustworthy source from search results
+    trustworthy = [s["url"] for s in sources if is_source_trustworthy(s["url"])]
+    if trustworthy:
+        return trustworthy[0]
+    if candidate_source:
+        return candidate_source  # fallback to untrusted if nothing else
+    if sources:
+        return sources[0]["url"]
+    return source_url
+
+
+def verify_question(llm, search, question_data, attempt_log, stream=False, prefetch=None, votes=0):
+    """Verify a generated question's answer order against web sources.
+
+    Retries up to MAX_VERIFY_RETRIES times for the SAME question, correcting
+    the order each time.  With stream, cross-checks are streamed and stop
+    early on VERIFIED; prefetch is a first-iteration search already started
+    by generate_question_streaming, used if its query is still current.
+    With votes, each cross-check is that many parallel verdicts aggregated
+    into one consensus order (see cross_check_vote), whose corrections need
+    no separate re-verification.
 
-        for verify_iter in range(MAX_VERIFY_RETRIES):
+    Returns:
+        dict with 'verified', 'answers', 'source_url' and 'evidence' (the
+        sources and verdicts the final answer order is based on).
+    """
+    question_text = question_data["question"]
+    current_answers = list(question_data["answers"])
+    source_url = question_data.get("source", "")
+
+    for verify_iter in range(MAX_VERIFY_RETRIES):
+        if verify_iter and not BUDGET.check("verify iteration", "verify_iteration"):
+            print("\n  ⏰ Not enough run budget for another verification iteration.")
+            attempt_log["budget_exhausted"] = True
+            break
+        with TRACER.span("verify_iteration", iteration=verify_iter + 1):
             attempt_log["verify_iterations"] = verify_iter + 1
             print(f"\n  --- Verification iteration {verify_iter + 1}/{MAX_VERIFY_RETRIES} ---")
             print(f"  Current answers: {current_answers}")
 
             # 2c. Search for verification sources
             print(f"  [Step 2c] Searching for verification sources...")
-            sources = search_for_verification(search, question_data, attempt_log, iteration=verify_iter)
+            if (verify_iter == 0 and prefetch and prefetch["query"] == question_data.get("search_query")
+                    and prefetch["question"] == question_data.get("question", "").strip()):
+                sources = prefetch["future"].result()
+            else:
+                sources = search_for_verification(search, question_data, attempt_log, iteration=verify_iter)
             if not sources:
                 print("  ❌ No sources found for verification.")
-                attempt_log[f"verify_iter{verify_iter}_result"] = "no_sources"
+                attempt_log.iteration(verify_iter).result = "no_sources"
                 continue
 
             print(f"  Found {len(sources)} sources")
@@ -1058,10 +2266,17 @@ def run(dry_run=False):
 
             # 2d. Cross-check
             print(f"  [Step 2d] Cross-checking answers against sources...")
-            check_result = cross_check(
-                llm, question_text, current_answers, sources,
-                attempt_log, iteration=verify_iter
-            )
+            if votes:
+                check_result = cross_check_vote(
+                    llm, question_text, current_answers, sources,
+                    attempt_log, votes, iteration=verify_iter
+                )
+            else:
+                check = cross_check_streaming if stream else cross_check
+                check_result = check(
+                    llm, question_text, current_answers, sources,
+                    attempt_log, iteration=verify_iter
+                )
             status = check_result.get("status", "UNVERIFIABLE")
             print(f"  Cross-check result: {status}")
             print(f"  Reason: {check_result.get('reason', 'N/A')}")
@@ -1069,40 +2284,64 @@ def run(dry_run=False):
             if status == "VERIFIED":
                 print("  ✅ Answers verified!")
                 # Use the best source from verification, not the LLM's suggested source
-                candidate_source = check_result.get("best_source", "")
-                if candidate_source and is_source_trustworthy(candidate_source):
-                    source_url = candidate_source
-                else:
-                    # Pick first trustworthy source from search results
-                    trustworthy = [s["url"] for s in sources if is_source_trustworthy(s["url"])]
-                    if trustworthy:
-                        source_url = trustworthy[0]
-                    elif candidate_source:
-                        source_url = candidate_source  # fallback to untrusted if nothing else
-                    elif sources:
-                        source_url = sources[0]["url"]
+                source_url = pick_verified_source(check_result, sources, source_url)
                 # Deterministic tiebreaker post-processing
                 answer_values = check_result.get("answer_values")
                 current_answers, tb_changed = enforce_tiebreaker(current_answers, answer_values)
                 if tb_changed:
                     print(f"  🔤 Tiebreaker applied (alphabetical): {current_answers}")
-                verified = True
-                break
+                return {
+                    "verified": True,
+                    "answers": current_answers,
+                    "source_url": source_url,
+                    "evidence": {"sources": sources, "cross_check": check_result},
+                }
 
             elif status == "CORRECTED":
-                corrected = check_result.get("corrected_answers", [])
+                corrected = check_result.get("corrected_answers") or []
                 if len(corrected) != 5:
                     print(f"  ❌ Correction has {len(corrected)} answers (need 5). Retrying...")
                     continue
 
                 print(f"  Corrected answers: {corrected}")
 
-                # 2e. Re-verify the correction with a targeted search
-                print(f"  [Step 2e] Re-verifying corrected order...")
-                re_verify = re_verify_correction(
-                    llm, search, question_text, corrected,
-                    attempt_log, iteration=verify_iter
+                # 2e. Re-verify the correction: not at all if a confident
+                # vote produced it, locally if its values are self-consistent
+                # and found in the sources, else with a search targeted at
+                # the pair the local check disputes
+                consistency = check_consistency(
+                    question_text, corrected, check_result.get("corrected_values"), sources
                 )
+                attempt_log.iteration(verify_iter).consistency = consistency
+                if "vote" in check_result:
+                    print("  [Step 2e] Correction is the cross-check vote's consensus; "
+                          "skipping re-verification.")
+                    TRACER.count("re_verify_skipped")
+                    re_verify = {
+                        "status": "CONFIRMED",
+                        "reason": check_result["reason"],
+                        "best_source": check_result.get("best_source", ""),
+                        "answer_values": check_result.get("corrected_values"),
+                    }
+                elif consistency["consistent"]:
+                    print("  [Step 2e] Correction is self-consistent and source-backed; "
+                          "skipping re-verification search.")
+                    TRACER.count("re_verify_skipped")
+                    re_verify = {
+                        "status": "CONFIRMED",
+                        "reason": "Local consistency check: values ordered, no suspicious gaps, "
+                                  f"{sum(consistency['backed'])}/5 found in sources",
+                        "best_source": check_result.get("best_source", ""),
+                        "answer_values": check_result.get("corrected_values"),
+                    }
+                else:
+                    print(f"  [Step 2e] Re-verifying corrected order "
+                          f"(disputed: {consistency['disputed'] or 'top two'})...")
+                    re_verify = re_verify_correction(
+                        llm, search, question_text, corrected,
+                        attempt_log, iteration=verify_iter,
+                        disputed=consistency["disputed"],
+                    )
                 re_status = re_verify.get("status", "REJECTED")
                 print(f"  Re-verification result: {re_status}")
                 print(f"  Reason: {re_verify.get('reason', 'N/A')}")
@@ -1126,13 +2365,20 @@ def run(dry_run=False):
                         check_result.get("best_source", ""),
                         source_url,
                     ]
-                    picked = next(
+                    source_url = next(
                         (u for u in candidates if u and is_source_trustworthy(u)),
                         next((u for u in candidates if u), source_url),
                     )
-                    source_url = picked
-                    verified = True
-                    break
+                    return {
+                        "verified": True,
+                        "answers": current_answers,
+                        "source_url": source_url,
+                        "evidence": {
+                            "sources": sources,
+                            "cross_check": check_result,
+                            "re_verify": re_verify,
+                        },
+                    }
                 else:
                     # Use the corrected answers as the new baseline
                     # and try verifying again in the next iteration
@@ -1150,165 +2396,701 @@ def run(dry_run=False):
                 )
                 continue
 
-        if not verified:
-            print(f"  ❌ Failed to verify after {MAX_VERIFY_RETRIES} iterations. Moving to next topic.")
-            attempt_log["status"] = "verification_exhausted"
-            attempt_log["reason"] = f"Could not verify after {MAX_VERIFY_RETRIES} iterations"
-            run_log["attempts"].append(attempt_log)
+    return {"verified": False, "answers": current_answers, "source_url": source_url, "evidence": None}
+
+
+def new_attempt_log(topic_info, is_fallback=False):
+    """Create the log record (a models.Attempt) for one topic attempt."""
+    from models import UNSET, Attempt
+
+    return Attempt(
+        topic=topic_info.get("topic", ""),
+        suggested_question=topic_info.get("suggested_question", ""),
+        connection="fallback" if is_fallback else topic_info.get("connection", ""),
+        reason="",
+        verify_iterations=0,
+        is_fallback=True if is_fallback else UNSET,
+    )
+
+
+def attempt_topic(llm, search, topic_info, previous_questions, attempt_log, date_str, next_id,
+                  stream=False, guidance=None, votes=0):
+    """Take one candidate topic through the full per-topic pipeline.
+
+    Runs the similarity check, generation, content filter, verification
+    loop and validation, recording the outcome in attempt_log.  With stream,
+    generation and cross-checks are streamed so the first verification
+    search overlaps generation.  With votes, cross-checks are parallel
+    votes (see verify_question).  An attempt whose models' circuits are all
+    open ends at once as "upstream_unavailable".
+
+    Returns:
+        (entry, evidence) on success, (None, None) otherwise.
+    """
+    try:
+        return run_attempt_steps(
+            llm, search, previous_questions, attempt_log, date_str, next_id, stream, guidance, votes
+        )
+    except CircuitOpenError as exc:
+        print(f"  ⚡ {exc}. Skipping.")
+        attempt_log["status"] = "upstream_unavailable"
+        attempt_log["reason"] = str(exc)
+        return None, None
+
+
+def run_attempt_steps(llm, search, previous_questions, attempt_log, date_str, next_id, stream, guidance,
+                      votes=0):
+    """The steps of attempt_topic (which handles open circuits)."""
+    topic = attempt_log["topic"]
+    suggested_q = attempt_log["suggested_question"]
+
+    # 2a. Similarity check
+    print("  [Step 2a] Checking similarity...")
+    if is_too_similar(llm, topic, suggested_q, previous_questions, attempt_log):
+        print("  ❌ Too similar to a previous question. Skipping.")
+        attempt_log["status"] = "skipped_similar"
+        attempt_log["reason"] = "Too similar to previous question"
+        return None, None
+
+    # 2b. Generate question
+    print("  [Step 2b] Generating question...")
+    prefetch = None
+    if stream:
+        question_data, prefetch = generate_question_streaming(
+            llm, search, topic, suggested_q, attempt_log, guidance=guidance
+        )
+    else:
+        question_data = generate_question(llm, topic, suggested_q, guidance=guidance)
+    if not question_data or "answers" not in question_data or len(question_data.get("answers", [])) != 5:
+        print("  ❌ Failed to generate valid question. Skipping.")
+        attempt_log["status"] = "generation_failed"
+        attempt_log["reason"] = "LLM did not return valid question structure"
+        return None, None
+
+    question_text = question_data["question"]
+    attempt_log["generated_question"] = {
+        "question": question_text,
+        "answers": question_data["answers"],
+        "distractors": question_data.get("distractors", []),
+        "suggested_source": question_data.get("source", ""),
+    }
+
+    blocked_hit = check_question_content(question_data)
+    if blocked_hit:
+        print(f"  🚫 Blocked content in {blocked_hit['field']} (rule: {blocked_hit['rule']}). Skipping.")
+        attempt_log["status"] = "content_blocked"
+        attempt_log["reason"] = f"Blocked {blocked_hit['field']}: {blocked_hit['text']}"
+        attempt_log["content_filter"] = blocked_hit
+        return None, None
+
+    print(f"  Question: {question_text}")
+    print(f"  Initial answers: {question_data['answers']}")
+
+    verification = verify_question(
+        llm, search, question_data, attempt_log, stream=stream, prefetch=prefetch, votes=votes
+    )
+    if not verification["verified"]:
+        iterations = attempt_log["verify_iterations"]
+        print(f"  ❌ Failed to verify after {iterations} iterations. Moving to next topic.")
+        attempt_log["status"] = "verification_exhausted"
+        attempt_log["reason"] = f"Could not verify after {iterations} iterations"
+        return None, None
+
+    current_answers = verification["answers"]
+    source_url = verification["source_url"]
+
+    # If we reach here, we have verified answers
+    print("\n  [Step 3] Assembling final question entry...")
+    entry = assemble_question_entry(
+        date_str, question_data, current_answers, source_url, next_id
+    )
+    validation_errors = validate_question_entry(entry)
+
+    if validation_errors:
+        print(f"  ❌ Validation failed: {validation_errors}")
+        attempt_log["status"] = "validation_failed"
+        attempt_log["reason"] = "; ".join(validation_errors)
+        return None, None
+
+    # Success!
+    print("  ✅ Question validated successfully!")
+    attempt_log["status"] = "success"
+    attempt_log["question_id"] = next_id
+    attempt_log["final_answers"] = current_answers
+    attempt_log["final_source"] = source_url
+    return entry, verification["evidence"]
+
+
+# ---------------------------------------------------------------------------
+# Reserve bank: pre-verified evergreen questions for instant failover
+# ---------------------------------------------------------------------------
+
+
+def reserve_store():
+    return json_store(RESERVE_FILE, lambda: {"questions": []})
+
+
+def load_reserve():
+    """Load the reserve bank of pre-verified questions."""
+    return reserve_store().read()
+
+
+def bank_reserve_question(record):
+    """Add a verified question to the reserve bank; returns the bank size."""
+    store = reserve_store()
+    with store.transaction() as reserve:
+        banked = reserve.setdefault("questions", [])
+        if all(r["question"].lower() != record["question"].lower() for r in banked):
+            banked.append(record)
+        size = len(banked)
+    report_merge(store)
+    return size
+
+
+def get_reserve_candidates(questions, reserve):
+    """Return evergreen topic ideas not yet published nor already banked."""
+    banked = {r["topic"].lower() for r in reserve["questions"]}
+    return [
+        idea for idea in get_fallback_topics(questions, limit=None)
+        if idea["topic"].lower() not in banked
+    ]
+
+
+@traced("fill_reserve")
+def fill_reserve(llm, search, questions, target=RESERVE_FILL_TARGET, max_new=None, attempts=None):
+    """Generate, verify and validate evergreen questions into the reserve bank.
+
+    Each banked entry keeps the evidence it was verified against so it can be
+    audited later.  Stops once the bank holds target entries, max_new entries
+    were added, or the evergreen ideas run out.  If attempts is a list, each
+    attempt log is appended to it.
+
+    Returns:
+        number of entries added.
+    """
+    reserve = load_reserve()
+    size = len(reserve["questions"])
+    added = 0
+
+    for topic_info in get_reserve_candidates(questions, reserve):
+        if size >= target or (max_new is not None and added >= max_new):
+            break
+        if not BUDGET.check("reserve fill", *ATTEMPT_STEPS):
+            print("\n⏰ Not enough run budget left for another reserve fill.")
+            break
+
+        attempt_log = new_attempt_log(topic_info, is_fallback=True)
+        print(f"\n{'='*50}")
+        print(f"Reserve fill: {attempt_log['topic']}")
+        print(f"Question: {attempt_log['suggested_question']}")
+        print(f"{'='*50}")
+
+        # Banked entries get their real id and date when they are popped
+        with TRACER.span("attempt", topic=attempt_log["topic"], reserve=True) as span:
+            entry, evidence = attempt_topic(
+                llm, search, topic_info, questions, attempt_log, date_str=None, next_id=None
+            )
+            span["attrs"]["status"] = attempt_log["status"]
+        if attempts is not None:
+            attempts.append(attempt_log)
+        if not entry:
+            print(f"  ⏭ Not banked: {attempt_log['status']}")
             continue
 
-        # If we reach here, we have verified answers
-        print("\n  [Step 3] Assembling final question entry...")
-        final_entry = assemble_question_entry(
-            date_str, question_data, current_answers, source_url, next_id
+        size = bank_reserve_question({
+            "topic": attempt_log["topic"],
+            "question": entry["question"],
+            "options": entry["options"],
+            "answers": entry["answers"],
+            "source": entry["source"],
+            "verified_at": datetime.now(CET).strftime("%Y-%m-%d"),
+            "evidence": evidence,
+        })
+        added += 1
+        print(f"  🏦 Banked ({size} in reserve)")
+
+    return added
+
+
+def pop_reserve_question(questions, date_str, next_id, dry_run=False):
+    """Take the first banked question that has not been published yet.
+
+    Returns the assembled question entry and the banked record, or
+    (None, None) if the bank is empty.
+    """
+    from models import Question
+
+    used_questions_lower = {q["question"].lower() for q in questions}
+
+    def pop(reserve):
+        for i, banked in enumerate(reserve["questions"]):
+            if banked["question"].lower() in used_questions_lower:
+                continue
+            entry = Question(
+                id=next_id,
+                date=date_str,
+                question=banked["question"],
+                options=banked["options"],
+                answers=banked["answers"],
+                source=banked["source"],
+            )
+            if validate_question_entry(entry):
+                continue
+            # Drop the popped entry plus any that were published meanwhile
+            reserve["questions"] = [
+                r for j, r in enumerate(reserve["questions"])
+                if j != i and r["question"].lower() not in used_questions_lower
+            ]
+            return entry, banked
+        return None, None
+
+    if dry_run:
+        return pop(load_reserve())
+    # Pop under the lock so two failing jobs never take the same banked question
+    store = reserve_store()
+    with store.transaction() as reserve:
+        popped = pop(reserve)
+    report_merge(store)
+    return popped
+
+
+def topup_reserve(llm, search, questions):
+    """Top up the reserve bank if it is running low.
+
+    Runs last, after today's question and the extra tracks are saved, and
+    within the run budget (fill_reserve checks it per attempt), so a slow
+    or failed top-up can never cost us a daily question nor compete with
+    one for quota.
+
+    Returns:
+        the top-up log, {"bank_size", "added", "attempts"}, or None if the
+        bank was not low.
+    """
+    size = len(load_reserve()["questions"])
+    if size >= RESERVE_LOW_WATERMARK:
+        return None
+
+    print(f"\n🏦 Reserve bank low ({size} < {RESERVE_LOW_WATERMARK}). Topping up...")
+    topup_log = {"bank_size": size, "added": 0, "attempts": []}
+    try:
+        topup_log["added"] = fill_reserve(
+            llm, search, questions, max_new=RESERVE_TOPUP_BATCH, attempts=topup_log["attempts"]
         )
-        validation_errors = validate_question_entry(final_entry)
+        print(f"🏦 Reserve top-up added {topup_log['added']} question(s)")
+    except Exception as exc:
+        print(f"  ⚠ Reserve top-up failed: {type(exc).__name__}: {exc}")
+        topup_log["error"] = f"{type(exc).__name__}: {exc}"
+    return topup_log
 
-        if validation_errors:
-            print(f"  ❌ Validation failed: {validation_errors}")
-            attempt_log["status"] = "validation_failed"
-            attempt_log["reason"] = "; ".join(validation_errors)
-            run_log["attempts"].append(attempt_log)
+
+# ---------------------------------------------------------------------------
+# Main orchestrator
+# ---------------------------------------------------------------------------
+
+
+# ---------------------------------------------------------------------------
+# Extra daily tracks sharing the day's discovery pass
+# ---------------------------------------------------------------------------
+
+# Each track gets its own question per day, stored in tracks.json (the main
+# question stays in questions.json).  Tracks draw on the candidates the main
+# track did not use; topic_terms, if set, restricts a track to candidates
+# mentioning one of them.
+TRACKS = {
+    "sports": {
+        "topic_terms": [
+            "sport", "football", "soccer", "basketball", "baseball", "tennis", "golf",
+            "cricket", "rugby", "hockey", "olympic", "olympics", "world cup", "formula 1",
+            "grand prix", "marathon", "cycling", "tour de france", "nba", "nfl", "nhl",
+            "mlb", "ncaa", "super bowl", "champions league", "premier league", "masters",
+            "wimbledon", "medal", "athlete", "championship", "tournament",
+        ],
+        "guidance": "This is for the sports track: the ranking must be about sport.",
+    },
+    "easy": {
+        "topic_terms": [],
+        "guidance": (
+            "This is for the easy track: pick a well-known ranking a casual player "
+            "could reason about, with familiar names as answers and distractors."
+        ),
+    },
+}
+TRACK_FILTERS = {
+    name: ContentFilter(track["topic_terms"]) for name, track in TRACKS.items() if track["topic_terms"]
+}
+
+
+def parse_track_names(value):
+    """argparse type for --tracks: comma-separated names from TRACKS."""
+    names = [n.strip() for n in value.split(",") if n.strip()]
+    unknown = [n for n in names if n not in TRACKS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown track(s) {', '.join(unknown)}; choose from {', '.join(TRACKS)}"
+        )
+    return names
+
+
+def tracks_store():
+    return json_store(TRACKS_FILE, lambda: {})
+
+
+def load_tracks():
+    """Load tracks.json as {"tracks": {name: {"questions": [...]}}}."""
+    data = tracks_store().read()
+    data.setdefault("tracks", {})
+    for name in TRACKS:
+        data["tracks"].setdefault(name, {"questions": []})
+    return data
+
+
+def commit_track_question(name, entry):
+    """Publish entry on a track; like commit_question, None if its date is taken."""
+    tag_question(entry)
+    store = tracks_store()
+    with store.transaction() as data:
+        track = data.setdefault("tracks", {}).setdefault(name, {"questions": []})
+        committed = claim_date(track["questions"], entry)
+    report_merge(store)
+    return committed
+
+
+def track_candidates(name, topics, questions, taken):
+    """Candidates for one track: unused discovered topics, then fallback ideas.
+
+    Fallback ideas already asked on this track are skipped, so each track
+    keeps its own dedup history.
+    """
+    from predictor import attempt_text
+
+    pool = list(topics) + get_fallback_topics(questions, limit=len(FALLBACK_TOPIC_IDEAS))
+    matcher = TRACK_FILTERS.get(name)
+    return [
+        t for t in pool
+        if t.get("topic", "") not in taken
+        and (matcher is None or matcher.check(attempt_text(t)))
+    ][:TRACK_MAX_ATTEMPTS]
+
+
+def run_tracks(llm, search, names, topics, run_log, date_str, stream=False, dry_run=False, votes=0):
+    """Fan the day's candidates out to the extra tracks.
+
+    Each track runs the normal per-topic pipeline (with its own similarity
+    history and generation guidance) and stops at its first success.
+    Topics attempted by the main track or an earlier track are not reused.
+
+    Returns:
+        the per-track log, {name: {"result", "attempts", "question_id"?}}.
+    """
+    tracks_data = load_tracks()
+    taken = {a["topic"] for a in run_log["attempts"]}
+    track_logs = {}
+
+    for name in names:
+        questions = tracks_data["tracks"][name]["questions"]
+        track_log = {"result": "pending", "attempts": []}
+        track_logs[name] = track_log
+        if any(q.get("date") == date_str for q in questions):
+            print(f"\n[{name}] Question for {date_str} already exists. Skipping.")
+            track_log["result"] = "exists"
             continue
 
-        # Success!
-        print("  ✅ Question validated successfully!")
-        attempt_log["status"] = "success"
-        attempt_log["question_id"] = next_id
-        attempt_log["final_answers"] = current_answers
-        attempt_log["final_source"] = source_url
-        run_log["attempts"].append(attempt_log)
-        success = True
-        break
+        next_id = max((q.get("id", 0) for q in questions), default=0) + 1
+        entry = None
+        for topic_info in track_candidates(name, topics, questions, taken):
+            if not BUDGET.check(f"{name} track attempt", *ATTEMPT_STEPS):
+                print(f"\n⏰ [{name}] Run budget too low for another attempt.")
+                track_log["deadline_reached"] = True
+                break
+            taken.add(topic_info.get("topic", ""))
+            attempt_log = new_attempt_log(topic_info, is_fallback=topic_info in FALLBACK_TOPIC_IDEAS)
+
+            print(f"\n{'='*50}")
+            print(f"[{name}] {attempt_log['topic']}")
+            print(f"Question: {attempt_log['suggested_question']}")
+            print(f"{'='*50}")
+
+            with TRACER.span("attempt", topic=attempt_log["topic"], track=name) as span:
+                entry, _ = attempt_topic(
+                    llm, search, topic_info, questions, attempt_log, date_str, next_id,
+                    stream=stream, guidance=TRACKS[name]["guidance"], votes=votes,
+                )
+                span["attrs"]["status"] = attempt_log["status"]
+            track_log["attempts"].append(attempt_log)
+            if entry:
+                break
+
+        if not entry:
+            print(f"  ❌ [{name}] No question today.")
+            track_log["result"] = "failed"
+            continue
+
+        if not dry_run:
+            entry = commit_track_question(name, entry)
+            if not entry:
+                print(f"  ⚠ [{name}] Another job published {date_str} meanwhile. Not saved.")
+                track_log["result"] = "exists"
+                continue
+        track_log["result"] = "success"
+        track_log["question_id"] = track_log["attempts"][-1]["question_id"] = entry["id"]
+        print(f"  ✅ [{name}] {entry['question']}")
+        if dry_run:
+            print(json.dumps(entry.to_dict(), indent=2, ensure_ascii=False))
+
+    return track_logs
+
+
+def run(dry_run=False, async_io=False, trace_path=None, stream=False,
+        deadline_seconds=RUN_DEADLINE_SECONDS, tracks=(), hedge=False, votes=0, fresh_topics=False):
+    """Main generation pipeline, bounded by a deadline_seconds wall-clock budget.
+
+    Attempts, verification iterations and search retries are only started
+    while the budget can still afford them (see deadline.RunBudget); once
+    it cannot, the run fails over to the reserve bank and saves.  tracks
+    names extra daily tracks (see TRACKS) to fill from the same discovery
+    pass once the main question is saved.
+
+    With async_io, topic discovery and the 7-day coverage filter run on the
+    pooled async clients, with their independent calls issued concurrently.
+    With stream, generation and cross-check completions are streamed (see
+    attempt_topic).
+    With hedge, slow verify-model calls are duplicated (see verify_llm_create).
+    With votes, each cross-check is that many parallel verdicts aggregated
+    into one ranking instead of sequential re-verification rounds.
+    Candidates come from the topic pool while it holds enough fresh ones;
+    with fresh_topics, discovery runs regardless.
+    With trace_path, the run's spans are written there as Chrome trace-event
+    JSON (also on failure).
+    """
+    get_hedger().enabled = hedge
+    BUDGET.start(deadline_seconds, margin_seconds=RUN_FAILOVER_MARGIN_SECONDS)
+    if BREAKERS.load(BREAKER_STATE_FILE):
+        print(f"⚡ Circuits still open from the last run: {', '.join(BREAKERS.summary())}")
+    try:
+        with TRACER.span("run", dry_run=dry_run):
+            run_pipeline(
+                dry_run=dry_run, async_io=async_io, stream=stream, tracks=tracks, votes=votes,
+                fresh_topics=fresh_topics,
+            )
+    finally:
+        BREAKERS.save(BREAKER_STATE_FILE)
+        if trace_path:
+            TRACER.export_chrome_trace(trace_path)
+            print(f"Trace written to {trace_path}")
+
+
+def run_pipeline(dry_run=False, async_io=False, stream=False, tracks=(), votes=0, fresh_topics=False):
+    """Run discovery, the attempt loops and saving for today's question."""
+    from models import Run
+
+    print("=" * 60)
+    print("Factle Daily Question Generator")
+    print("=" * 60)
+
+    # Initialize
+    llm, search = create_clients()
+    questions = load_questions()
+    log = load_log()
+    today = datetime.now(CET)
+    date_str = today.strftime("%Y-%m-%d")
+    next_id = max((q.get("id", 0) for q in questions), default=0) + 1
+
+    # Check if question already exists for today
+    if any(q.get("date") == date_str for q in questions):
+        print(f"Question for {date_str} already exists. Skipping.")
+        return
+
+    run_log = Run(date=date_str)
+
+    def can_afford_attempt():
+        if BUDGET.check("topic attempt", *ATTEMPT_STEPS):
+            return True
+        print(
+            f"\n⏰ Run budget too low for another attempt "
+            f"({max(BUDGET.remaining(), 0):.0f}s left). Stopping live attempts."
+        )
+        run_log["deadline_reached"] = True
+        return False
+
+    print(f"\nDate: {date_str}")
+    print(f"Previous questions: {len(questions)}")
+    print(f"Next ID: {next_id}")
 
     # ------------------------------------------------------------------
-    # Fallback: try fallback topic ideas through the same pipeline
+    # Step 1: Discover topics
     # ------------------------------------------------------------------
-    if not success and not run_log.get("fallback_used"):
-        print("\n--- All current-events topics failed. Trying fallback topics. ---")
-        fallback_topics = get_fallback_topics(questions)
+    print("\n--- Step 1: Discovering current topics ---")
+    recent_questions = get_recent_questions(questions, days=7)
+    pooled = [] if fresh_topics else pooled_topics(date_str)
+    discovered = []
+    if len(pooled) >= TOPIC_POOL_MIN_CANDIDATES:
+        print(f"Using {len(pooled)} fresh candidate(s) from the topic pool; skipping discovery.")
+        run_log["step1_topic_discovery"] = {"pooled": True, "candidates": len(pooled)}
+    else:
+        try:
+            if async_io:
+                discovered = run_async_step(lambda a_llm, a_search: discover_topics_async(
+                    a_llm, a_search, run_log, recent_questions=recent_questions
+                ))
+            else:
+                discovered = discover_topics(llm, search, run_log, recent_questions=recent_questions)
+        except CircuitOpenError as exc:
+            print(f"  ⚡ Discovery skipped: {exc}")
+            run_log["step1_topic_discovery"] = {"skipped": True, "reason": str(exc)}
+    # A failed discovery still has the pool's last few candidates
+    topics = discovered or pooled
+    run_log["topic_pool"] = {"used": bool(topics) and not discovered, "fresh": len(pooled)}
+
+    if not topics:
+        print("WARNING: No topics discovered from current events.")
+        print("Using fallback topic ideas (still verified through pipeline).")
+        topics = get_fallback_topics(questions)
         run_log["fallback_used"] = True
 
-        for attempt_idx, topic_info in enumerate(fallback_topics):
-            topic = topic_info.get("topic", "")
-            suggested_q = topic_info.get("suggested_question", "")
-            attempt_log = {
-                "topic": topic,
-                "suggested_question": suggested_q,
-                "connection": "fallback",
-                "status": "pending",
-                "reason": "",
-                "verify_iterations": 0,
-                "is_fallback": True,
-            }
+    run_log["topics_discovered"] = [
+        {
+            "topic": t.get("topic", "unknown"),
+            "suggested_question": t.get("suggested_question", "unknown"),
+            "connection": t.get("connection", ""),
+        }
+        for t in topics
+    ]
+    print(f"Found {len(topics)} candidate topics:")
+    for i, t in enumerate(topics):
+        print(f"  {i+1}. [{t.get('topic', 'N/A')}] {t.get('suggested_question', 'N/A')}")
+        print(f"      Connection: {t.get('connection', 'N/A')}")
 
-            print(f"\n{'='*50}")
-            print(f"Fallback attempt {attempt_idx + 1}/{len(fallback_topics)}: {topic}")
-            print(f"Question: {suggested_q}")
-            print(f"{'='*50}")
+    # ------------------------------------------------------------------
+    # Step 1b: Filter topics covered in the last 7 days
+    # ------------------------------------------------------------------
+    print("\n--- Step 1b: Filtering recently covered topics (7-day window) ---")
+    candidates = topics
+    recent_questions = get_recent_questions(questions, days=7)
+    print(f"Found {len(recent_questions)} questions from the past 7 days")
+    if recent_questions:
+        for rq in recent_questions:
+            print(f"  - [{rq['date']}] {rq['question']}")
 
-            # Similarity check
-            if is_too_similar(llm, topic, suggested_q, previous_summary, attempt_log):
-                print("  ❌ Too similar to a previous question. Skipping.")
-                attempt_log["status"] = "skipped_similar"
-                run_log["attempts"].append(attempt_log)
-                continue
+    try:
+        if async_io:
+            topics = run_async_step(lambda a_llm, a_search: filter_recently_covered_topics_async(
+                a_llm, topics, recent_questions, run_log
+            ))
+        else:
+            topics = filter_recently_covered_topics(llm, topics, recent_questions, run_log)
+    except CircuitOpenError as exc:
+        # The per-question similarity check still runs in each attempt
+        print(f"  ⚡ Topic dedup skipped: {exc}")
+        run_log["step1b_topic_dedup"] = {"skipped": True, "reason": str(exc)}
+    covered = [t for t in candidates if t not in topics]
+    print(f"Topics remaining after dedup: {len(topics)}")
 
-            # Generate question
-            question_data = generate_question(llm, topic, suggested_q)
-            if not question_data or "answers" not in question_data or len(question_data.get("answers", [])) != 5:
-                print("  ❌ Failed to generate valid question. Skipping.")
-                attempt_log["status"] = "generation_failed"
-                run_log["attempts"].append(attempt_log)
-                continue
+    if not topics:
+        print("WARNING: All topics filtered by recent coverage check.")
+        if not run_log.get("fallback_used"):
+            print("Falling through to fallback topics.")
+        # Let the attempt loop handle the empty list — it will fall
+        # through to the fallback section below.
 
-            question_text = question_data["question"]
-            attempt_log["generated_question"] = {
-                "question": question_text,
-                "answers": question_data["answers"],
-                "distractors": question_data.get("distractors", []),
-            }
+    # ------------------------------------------------------------------
+    # Step 1c: Try the candidates most likely to verify cheaply first
+    # ------------------------------------------------------------------
+    predictor, scores = train_verifiability_model(log)
+    if not predictor_is_useful(scores):
+        # No better than the base rate: reordering would only add noise to the LLM's order
+        run_log["step1c_topic_ranking"] = {"training_examples": predictor.examples, "skipped": scores}
+        predictor = None
+    if topics and predictor:
+        print(f"\n--- Step 1c: Ranking candidates by expected cost ({predictor.examples} past attempts) ---")
+        topics = rank_topics_by_expected_cost(topics, predictor, run_log)
+    elif topics:
+        print(f"\n--- Step 1c: Keeping discovery order (predictor Brier {scores['brier']} "
+              f"vs. base rate {scores['baseline_brier']}) ---")
 
-            # Verification loop (same as main loop)
-            current_answers = list(question_data["answers"])
-            source_url = question_data.get("source", "")
-            verified = False
+    # ------------------------------------------------------------------
+    # Step 2: Attempt loop (outer: topics, inner: verify retries)
+    # ------------------------------------------------------------------
+    final_entry = None
 
-            for verify_iter in range(MAX_VERIFY_RETRIES):
-                attempt_log["verify_iterations"] = verify_iter + 1
-                sources = search_for_verification(search, question_data, attempt_log, iteration=verify_iter)
-                if not sources:
-                    continue
+    for attempt_idx, topic_info in enumerate(topics[:MAX_TOPIC_ATTEMPTS]):
+        if not can_afford_attempt():
+            break
 
-                check_result = cross_check(
-                    llm, question_text, current_answers, sources,
-                    attempt_log, iteration=verify_iter
-                )
-                status = check_result.get("status", "UNVERIFIABLE")
-
-                if status == "VERIFIED":
-                    if check_result.get("best_source"):
-                        source_url = check_result["best_source"]
-                    elif sources:
-                        source_url = sources[0]["url"]
-                    verified = True
-                    break
-                elif status == "CORRECTED":
-                    corrected = check_result.get("corrected_answers", [])
-                    if len(corrected) != 5:
-                        continue
-                    re_verify = re_verify_correction(
-                        llm, search, question_text, corrected,
-                        attempt_log, iteration=verify_iter
-                    )
-                    if re_verify.get("status") == "CONFIRMED":
-                        current_answers = corrected
-                        source_url = (
-                            re_verify.get("best_source")
-                            or check_result.get("best_source")
-                            or source_url
-                        )
-                        verified = True
-                        break
-                    else:
-                        current_answers = corrected
-                        continue
-                else:
-                    question_data["search_query"] = (
-                        f"{question_text} {current_answers[0]} {current_answers[1]} ranking"
-                    )
-                    continue
+        attempt_log = new_attempt_log(topic_info)
 
-            if not verified:
-                attempt_log["status"] = "verification_exhausted"
-                run_log["attempts"].append(attempt_log)
-                continue
+        print(f"\n{'='*50}")
+        print(f"Attempt {attempt_idx + 1}/{MAX_TOPIC_ATTEMPTS}: {attempt_log['topic']}")
+        print(f"Question: {attempt_log['suggested_question']}")
+        print(f"{'='*50}")
 
-            final_entry = assemble_question_entry(
-                date_str, question_data, current_answers, source_url, next_id
+        with TRACER.span("attempt", topic=attempt_log["topic"]) as span:
+            final_entry, _ = attempt_topic(
+                llm, search, topic_info, questions, attempt_log, date_str, next_id,
+                stream=stream, votes=votes,
             )
-            validation_errors = validate_question_entry(final_entry)
-            if validation_errors:
-                attempt_log["status"] = "validation_failed"
-                attempt_log["reason"] = "; ".join(validation_errors)
-                run_log["attempts"].append(attempt_log)
-                continue
+            span["attrs"]["status"] = attempt_log["status"]
+        run_log["attempts"].append(attempt_log)
+        if final_entry:
+            break
 
-            print("  ✅ Fallback question verified and validated!")
-            attempt_log["status"] = "success"
-            attempt_log["question_id"] = next_id
-            attempt_log["final_answers"] = current_answers
-            attempt_log["final_source"] = source_url
+    # ------------------------------------------------------------------
+    # Fallback: try fallback topic ideas through the same pipeline
+    # ------------------------------------------------------------------
+    if not final_entry and not run_log.get("fallback_used") and not run_log.get("deadline_reached"):
+        print("\n--- All current-events topics failed. Trying fallback topics. ---")
+        fallback_topics = rank_topics_by_expected_cost(
+            get_fallback_topics(questions, limit=len(FALLBACK_TOPIC_IDEAS)), predictor, run_log, "fallback"
+        )[:MAX_TOPIC_ATTEMPTS]
+        run_log["fallback_used"] = True
+
+        for attempt_idx, topic_info in enumerate(fallback_topics):
+            if not can_afford_attempt():
+                break
+
+            attempt_log = new_attempt_log(topic_info, is_fallback=True)
+
+            print(f"\n{'='*50}")
+            print(f"Fallback attempt {attempt_idx + 1}/{len(fallback_topics)}: {attempt_log['topic']}")
+            print(f"Question: {attempt_log['suggested_question']}")
+            print(f"{'='*50}")
+
+            with TRACER.span("attempt", topic=attempt_log["topic"], fallback=True) as span:
+                final_entry, _ = attempt_topic(
+                    llm, search, topic_info, questions, attempt_log, date_str, next_id,
+                    stream=stream, votes=votes,
+                )
+                span["attrs"]["status"] = attempt_log["status"]
             run_log["attempts"].append(attempt_log)
-            success = True
-            break
+            if final_entry:
+                print("  ✅ Fallback question verified and validated!")
+                break
 
-    if not success:
+    # ------------------------------------------------------------------
+    # Reserve bank: instant failover to a pre-verified question
+    # ------------------------------------------------------------------
+    banked = None
+    if not final_entry:
+        print("\n--- Live pipeline failed. Pulling from reserve bank. ---")
+        final_entry, banked = pop_reserve_question(questions, date_str, next_id, dry_run=dry_run)
+        if final_entry:
+            print(f"  🏦 Using reserve question: {final_entry['question']}")
+            run_log["reserve_used"] = {
+                "topic": banked["topic"],
+                "verified_at": banked.get("verified_at"),
+            }
+        else:
+            print("  ❌ Reserve bank is empty.")
+
+    if not final_entry:
         run_log["result"] = "failed"
-        print("\nCRITICAL: All attempts (current events + fallbacks) failed verification!")
-        log["runs"].append(run_log)
+        print("\nCRITICAL: All attempts (current events + fallbacks + reserve) failed!")
+        run_log["budget"] = BUDGET.summary()
+        run_log["breakers"] = BREAKERS.summary()
+        run_log["hedging"] = get_hedger().summary()
+        run_log["trace_summary"] = TRACER.summary()
         if not dry_run:
-            save_log(log)
+            save_topic_pool(run_log, date_str, discovered, covered)
+            commit_run_log(run_log)
         sys.exit(1)
     else:
         run_log["result"] = "success"
@@ -1317,17 +3099,54 @@ def run(dry_run=False):
     # ------------------------------------------------------------------
     # Step 4: Save
     # ------------------------------------------------------------------
+    saved = False
     if dry_run:
         print("\n--- DRY RUN — not saving ---")
-        print(json.dumps(final_entry, indent=2, ensure_ascii=False))
+        print(json.dumps(final_entry.to_dict(), indent=2, ensure_ascii=False))
     else:
         print("\n--- Saving question ---")
-        save_question(final_entry, questions)
-        print(f"Saved to {QUESTIONS_FILE}")
+        committed = commit_question(final_entry)
+        if committed is None:
+            print(f"  ⚠ Another job published a question for {date_str} meanwhile. Not saving ours.")
+            run_log["result"] = "superseded"
+            run_log.pop("question_id")
+            if banked:
+                bank_reserve_question(banked)  # put it back for another day
+        else:
+            if committed["id"] != next_id:
+                print(f"  🔀 ID {next_id} was taken meanwhile; saved as ID {committed['id']}")
+                for attempt in run_log["attempts"]:
+                    if attempt.get("question_id") == next_id:
+                        attempt["question_id"] = committed["id"]
+                run_log["question_id"] = committed["id"]
+            final_entry = committed
+            print(f"Saved to {QUESTIONS_FILE}")
+            saved = True
 
-    log["runs"].append(run_log)
+    # ------------------------------------------------------------------
+    # Step 5: Extra tracks from the same candidates
+    # ------------------------------------------------------------------
+    if tracks:
+        print(f"\n--- Step 5: Extra tracks ({', '.join(tracks)}) ---")
+        run_log["tracks"] = run_tracks(
+            llm, search, tracks, topics, run_log, date_str, stream=stream, dry_run=dry_run, votes=votes
+        )
+
+    # ------------------------------------------------------------------
+    # Step 6: Top up the reserve bank with whatever budget is left
+    # ------------------------------------------------------------------
+    if saved:
+        topup_log = topup_reserve(llm, search, load_questions())
+        if topup_log:
+            run_log["reserve_topup"] = topup_log
+
+    run_log["budget"] = BUDGET.summary()
+    run_log["breakers"] = BREAKERS.summary()
+    run_log["hedging"] = get_hedger().summary()
+    run_log["trace_summary"] = TRACER.summary()
     if not dry_run:
-        save_log(log)
+        save_topic_pool(run_log, date_str, discovered, covered)
+        commit_run_log(run_log)
         print(f"Log saved to {LOG_FILE}")
 
     print("\n✅ Done!")
@@ -1335,16 +3154,652 @@ def run(dry_run=False):
     print(f"Answers: {final_entry['answers']}")
 
 
+# ---------------------------------------------------------------------------
+# Offline tooling: validate, analyze-log, migrate, bench
+# ---------------------------------------------------------------------------
+
+
+def validate_archive(questions):
+    """Check every published question offline.
+
+    Returns a list of (question_id, problem) tuples; empty means clean.
+    """
+    problems = []
+    seen_ids = set()
+    seen_dates = set()
+
+    for q in questions:
+        qid = q.get("id")
+        for err in validate_question_entry(q):
+            problems.append((qid, err))
+
+        if qid in seen_ids:
+            problems.append((qid, "Duplicate id"))
+        seen_ids.add(qid)
+
+        date = q.get("date", "")
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            problems.append((qid, f"Invalid date '{date}'"))
+        if date in seen_dates:
+            problems.append((qid, f"Duplicate date {date}"))
+        seen_dates.add(date)
+
+        blocked_hit = check_question_content({
+            "question": q.get("question", ""),
+            "answers": q.get("answers", []),
+            "distractors": [o for o in q.get("options", []) if o not in q.get("answers", [])],
+        })
+        if blocked_hit:
+            problems.append((qid, f"Blocked content in {blocked_hit['field']}: {blocked_hit['text']} (rule: {blocked_hit['rule']})"))
+
+    return problems
+
+
+def summarize_log(log, since=None):
+    """Aggregate the generation log into run/attempt statistics."""
+    from models import Run
+
+    runs = [Run.from_dict(r) for r in log.get("runs", []) if not since or r.get("date", "") >= since]
+    attempts = [a for r in runs for a in r.attempts]
+    successes = [a for a in attempts if a.status == "success"]
+
+    return {
+        "runs": len(runs),
+        "run_results": dict(Counter(r.result for r in runs).most_common()),
+        "attempts": len(attempts),
+        "attempt_statuses": dict(Counter(a.status for a in attempts).most_common()),
+        "attempts_per_run": round(len(attempts) / len(runs), 2) if runs else 0,
+        "verify_iterations_per_success": (
+            round(sum(a.verify_iterations or 0 for a in successes) / len(successes), 2)
+            if successes else 0
+        ),
+        "fallback_runs": sum(1 for r in runs if r.fallback_used),
+        "reserve_runs": sum(1 for r in runs if r.reserve_used),
+        "pooled_topic_runs": sum(1 for r in runs if r.topic_pool and r.topic_pool.get("used")),
+    }
+
+
+def strip_entry_whitespace(questions_data, log):
+    """Strip stray whitespace from question text, options and answers."""
+    changed = 0
+    for q in questions_data["questions"]:
+        before = (q.get("question"), q.get("options"), q.get("answers"))
+        q["question"] = q.get("question", "").strip()
+        q["options"] = [o.strip() for o in q.get("options", [])]
+        q["answers"] = [a.strip() for a in q.get("answers", [])]
+        if (q["question"], q["options"], q["answers"]) != before:
+            changed += 1
+    return changed
+
+
+def tag_questions(questions_data, log):
+    """Tag questions with taxonomy categories and entities, re-tagging any
+    whose tags no longer match the lexicon."""
+    from taxonomy import tag_text
+
+    changed = 0
+    for q in questions_data["questions"]:
+        tags = tag_text(q["question"])
+        if q.get("tags") != tags:
+            q["tags"] = tags
+            changed += 1
+    return changed
+
+
+# (name, function) pairs run in order by the migrate command.  Each function
+# takes (questions_data, log), mutates them in place, and returns how many
+# records it changed.  Migrations must be idempotent.
+MIGRATIONS = [
+    ("strip-whitespace", strip_entry_whitespace),
+    ("tag-questions", tag_questions),
+]
+
+# cross_check status -> audit verdict; anything but "ok" is flagged in the report
+AUDIT_VERDICTS = {
+    "VERIFIED": "ok",
+    "CORRECTED": "ranking_changed",
+    "UNVERIFIABLE": "unverifiable",
+}
+
+
+def select_archive(questions, since=None, until=None):
+    """Return archived questions dated within [since, until]."""
+    return [
+        q for q in questions
+        if (not since or q.get("date", "") >= since) and (not until or q.get("date", "") <= until)
+    ]
+
+
+def audit_question(llm, search, question, llm_limiter, search_limiter):
+    """Re-run verification search + cross-check for one archived question."""
+    from models import Attempt
+
+    attempt_log = Attempt(topic=question["question"])
+    result = {
+        "id": question.get("id"),
+        "date": question.get("date"),
+        "question": question["question"],
+        "answers": question["answers"],
+    }
+
+    search_limiter.acquire()
+    sources = search_for_verification(search, {"search_query": question["question"]}, attempt_log)
+    if not sources:
+        result.update(verdict="no_sources", reason="No sources found")
+        return result
+
+    llm_limiter.acquire()
+    check = cross_check(llm, question["question"], question["answers"], sources, attempt_log)
+    status = check.get("status", "UNVERIFIABLE")
+    result.update(
+        verdict=AUDIT_VERDICTS.get(status, "unverifiable"),
+        status=status,
+        reason=check.get("reason"),
+        corrected_answers=check.get("corrected_answers"),
+        best_source=check.get("best_source"),
+    )
+    return result
+
+
+def build_audit_report(results, stats):
+    """Summarize audit results, listing every entry that no longer verifies."""
+    flagged = sorted(
+        (r for r in results.values() if r.get("verdict") != "ok"),
+        key=lambda r: r.get("id") or 0,
+    )
+    return {
+        "generated_at": datetime.now(CET).isoformat(timespec="seconds"),
+        "stats": stats,
+        "verdicts": dict(Counter(r.get("verdict") for r in results.values()).most_common()),
+        "flagged": flagged,
+    }
+
+
+STARTUP_BUDGET_MS = 100
+HEAVY_MODULES = ["openai", "tavily", "httpx", "asyncio"]
+
+
+def time_launches(cmd, runs):
+    """Return the median wall time in ms of launching cmd runs times."""
+    import subprocess
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - started) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def measure_startup(command, runs):
+    """Time fresh interpreter launches of an offline command.
+
+    The bare interpreter launch (`python -c pass`) is timed as a baseline so
+    the result reflects our own startup cost, not the host's site hooks.
+
+    Returns (median_ms, baseline_ms, heavy_modules_loaded) where the last
+    item lists any network SDKs that importing this module pulled in.
+    """
+    import subprocess
+
+    baseline = time_launches([sys.executable, "-c", "pass"], runs)
+    median = time_launches([sys.executable, __file__, *command], runs)
+
+    probe = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import generate_question; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", probe, str(Path(__file__).resolve().parent)],
+        capture_output=True, text=True, check=False,
+    ).stdout.strip()
+    return median, baseline, [m for m in loaded.split(",") if m]
+
+
+# ---------------------------------------------------------------------------
+# Prompt experiments: replay recorded cases under prompt variants
+# ---------------------------------------------------------------------------
+
+
+def prompt_steps():
+    """{system-prompt prefix: step name} for every prompt a variant can edit."""
+    from experiment import step_key
+
+    answers = [""] * 5
+    builders = {
+        "discover_topics": build_discovery_messages(datetime.now(CET), []),
+        "topic_dedup": build_topic_dedup_messages({}, ""),
+        "similarity_check": build_similarity_messages("", "", ""),
+        "generate_question": build_generation_messages("", ""),
+        "cross_check": build_cross_check_messages("", answers, []),
+        "re_verify": build_re_verify_messages("", answers, {"results": []}),
+    }
+    return {step_key(messages): step for step, messages in builders.items()}
+
+
+def recorded_cases(log, limit=None):
+    """Experiment cases from logged attempts that reached verification.
+
+    Each case keeps the attempt's topic, suggested question, recorded status
+    and the searches it saw.  The log keeps only source titles and URLs, so
+    replayed sources have no content; fixture files can supply it.
+    """
+    from models import UNSET, Run
+
+    cases = []
+    for run_entry in log.get("runs", []):
+        run = Run.from_dict(run_entry)
+        for i, attempt in enumerate(run.attempts):
+            if attempt.generated_question is UNSET:
+                continue
+            searches = [
+                [{**s, "content": ""} for s in it.verification_search["sources_found"]]
+                for it in attempt.iterations
+                if it.verification_search and it.verification_search.get("sources_found")
+            ]
+            cases.append({
+                "id": f"{run.date}#{i}",
+                "topic": attempt.topic,
+                "suggested_question": attempt.suggested_question or "",
+                "recorded_status": attempt.status,
+                "searches": searches,
+            })
+    return cases[-limit:] if limit else cases
+
+
+def init_experiment_worker():
+    """Prepare a worker process: no live page fetches, HTTP client imported up front."""
+    global PAGE_FETCH_TOP_N
+    PAGE_FETCH_TOP_N = 0  # replays see only the recorded sources
+    import http_clients  # keep its import cost out of the first case's latency
+
+
+def evaluate_case(case, edits, options):
+    """Replay one case through generation and verification (experiment worker).
+
+    options["endpoint"] selects a local OpenAI-compatible server (with
+    options["model"] as the model name), else the deterministic FakeLLM.
+    """
+    from experiment import FakeLLM, MeteredLLM, ReplaySearch
+
+    steps = prompt_steps()
+    if options.get("endpoint"):
+        from http_clients import ChatClient
+
+        inner = ChatClient(options["endpoint"], os.environ.get("EXPERIMENT_API_KEY", "local"))
+        llm = MeteredLLM(inner, steps, edits, model=options.get("model"))
+    else:
+        llm = FakeLLM(steps, edits)
+    attempt_log = new_attempt_log(case)
+
+    started = time.perf_counter()
+    verified = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        question_data = generate_question(llm, case["topic"], case["suggested_question"])
+        if question_data and len(question_data.get("answers", [])) == 5:
+            search = ReplaySearch(case.get("searches") or [])
+            verified = verify_question(llm, search, question_data, attempt_log)["verified"]
+    return {
+        "success": verified,
+        "verify_iterations": attempt_log["verify_iterations"],
+        "latency_s": round(time.perf_counter() - started, 3),
+        **llm.stats,
+    }
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Generate daily Factle question")
-    parser.add_argument(
-        "--dry-run",
+
+def cmd_generate(args):
+    run(
+        dry_run=args.dry_run, async_io=args.async_io, trace_path=args.trace,
+        stream=args.stream, deadline_seconds=args.deadline_minutes * 60,
+        tracks=args.tracks, hedge=args.hedge, votes=args.votes, fresh_topics=args.fresh_topics,
+    )
+
+
+def cmd_fill_reserve(args):
+    llm, search = create_clients()
+    added = fill_reserve(llm, search, load_questions(), target=args.target)
+    print(f"\n🏦 Added {added} question(s) to {RESERVE_FILE}")
+
+
+def cmd_validate(args):
+    questions = load_questions()
+    problems = validate_archive(questions)
+    for qid, problem in problems:
+        print(f"  ❌ ID {qid}: {problem}")
+    print(f"Checked {len(questions)} questions: {len(problems)} problem(s)")
+
+    if TRACKS_FILE.exists():
+        for name, track in load_tracks()["tracks"].items():
+            track_problems = validate_archive(track["questions"])
+            for qid, problem in track_problems:
+                print(f"  ❌ [{name}] ID {qid}: {problem}")
+            print(f"Checked {len(track['questions'])} {name} questions: {len(track_problems)} problem(s)")
+            problems += track_problems
+
+    # Stale per-year calendar dates are a data chore, not a broken archive: warn only
+    if RECURRING_EVENTS_FILE.exists():
+        this_year = datetime.now(CET).year
+        for year in (this_year, this_year + 1):
+            report_undated_events(recurring_calendar(), year)
+
+    if problems:
+        sys.exit(1)
+
+
+def cmd_analyze_log(args):
+    summary = summarize_log(load_log(), since=args.since)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for key, value in summary.items():
+        if isinstance(value, dict):
+            print(f"{key}:")
+            for k, v in value.items():
+                print(f"  {k}: {v}")
+        else:
+            print(f"{key}: {value}")
+
+
+def cmd_predictor(args):
+    from predictor import VerifiabilityModel, evaluate, training_examples
+
+    log = load_log()
+    examples = list(training_examples(log))
+    scores = evaluate(examples)
+    print(f"Training examples: {scores['examples']}")
+    if scores["brier"] is None:
+        print("Not enough labeled attempts to cross-validate.")
+        return
+    print(f"Cross-validated Brier score: {scores['brier']} (base rate only: {scores['baseline_brier']})")
+    if not predictor_is_useful(scores):
+        print(f"Gain below {PREDICTOR_MIN_BRIER_GAIN}: generation keeps the discovery order.")
+    model = VerifiabilityModel().fit(examples)
+    print("Strongest features (log-odds of success):")
+    for name, weight in model.top_features():
+        print(f"  {weight:+.3f}  {name}")
+    if args.question:
+        p_success, iterations = model.predict(" ".join(args.question))
+        print(f"\nP(success) = {p_success:.2f}, expected verify iterations = {iterations:.1f}")
+
+
+def cmd_build_corpus(args):
+    """Backfill the local corpus from sources saved with past verifications."""
+    corpus = open_corpus()
+    before = corpus.count()
+    sources = [
+        s
+        for banked in load_reserve()["questions"]
+        for s in (banked.get("evidence") or {}).get("sources", [])
+    ]
+    corpus.add(sources)
+    print(f"Indexed {len(sources)} reserve-bank source(s); corpus now has {corpus.count()} document(s) (was {before})")
+    if args.query:
+        query = " ".join(args.query)
+        t0 = time.perf_counter()
+        results, coverage = corpus.search(query)
+        print(f"\n'{query}': {len(results)} hit(s), coverage {coverage:.0%}, {(time.perf_counter() - t0) * 1000:.1f} ms")
+        for r in results:
+            print(f"  {r['score']:>7.2f}  {r['title'][:60]} ({r['url'][:60]})")
+    corpus.close()
+
+
+def apply_migrations(questions_data, log):
+    total = 0
+    for name, migration in MIGRATIONS:
+        changed = migration(questions_data, log)
+        total += changed
+        print(f"  {name}: {changed} record(s) changed")
+    return total
+
+
+def cmd_migrate(args):
+    if args.dry_run:
+        total = apply_migrations({"questions": load_questions()}, load_log())
+        print("No files written." if not total else "DRY RUN — no files written.")
+        return
+    # Under both writer locks, so a job committing meanwhile is neither lost
+    # nor left unmigrated (commits only ever hold one lock at a time)
+    with questions_store().transaction() as questions_data, log_store().transaction() as log:
+        total = apply_migrations(questions_data, log)
+    print(f"Migrated {QUESTIONS_FILE.name} and {LOG_FILE.name}" if total else "No files written.")
+
+
+def cmd_compact_log(args):
+    """Move the sources embedded in older runs into the evidence store."""
+    from evidence import compact, hydrate
+
+    evidence = evidence_store()
+    stored = len(evidence)
+    before = LOG_FILE.stat().st_size if LOG_FILE.exists() else 0
+    store = log_store()
+    with store.transaction() as log:
+        runs = log.get("runs", [])
+        compacted = [compact(run_entry, evidence) for run_entry in runs]
+        if any(hydrate(c, evidence) != hydrate(r, evidence) for c, r in zip(compacted, runs)):
+            sys.exit("❌ Compacted runs do not rehydrate to the originals. Nothing written.")
+        after = len(store.serialize({**log, "runs": compacted}).encode("utf-8"))
+        new_sources = len(evidence) - stored
+        print(f"{len(runs)} runs: {before / 1e6:.2f} MB → {after / 1e6:.2f} MB, "
+              f"{new_sources} new source(s) for {EVIDENCE_FILE.name}")
+        if args.dry_run:
+            print("DRY RUN — no files written.")
+            return
+        evidence.flush()
+        log["runs"] = compacted
+
+
+def cmd_bench(args):
+    command = args.offline_command.split()
+    median, baseline, heavy = measure_startup(command, args.runs)
+    overhead = median - baseline
+    print(f"Startup of '{' '.join(command)}' over {args.runs} run(s):")
+    print(f"  median {median:.1f} ms (bare interpreter {baseline:.1f} ms, overhead {overhead:.1f} ms)")
+    print(f"  heavy modules on import: {', '.join(heavy) or 'none'}")
+    if overhead > STARTUP_BUDGET_MS or heavy:
+        print(f"  ❌ Over the {STARTUP_BUDGET_MS} ms offline startup budget")
+        sys.exit(1)
+    print(f"  ✅ Within the {STARTUP_BUDGET_MS} ms offline startup budget")
+
+
+def cmd_audit(args):
+    from audit import AuditCache, RateLimiter, run_audit
+
+    llm, search = create_clients()
+    questions = select_archive(load_questions(), since=args.since, until=args.until)
+    cache = AuditCache(AUDIT_CACHE_FILE, ttl_days=-1 if args.fresh else AUDIT_CACHE_TTL_DAYS)
+    llm_limiter = RateLimiter(AUDIT_LLM_CALLS_PER_MINUTE)
+    search_limiter = RateLimiter(AUDIT_SEARCH_CALLS_PER_MINUTE)
+
+    print(f"Auditing {len(questions)} question(s) with {args.workers} worker(s)...")
+    # Audits check against the live web, not sources we already trusted
+    search = live_search(search)
+    results, stats = run_audit(
+        questions,
+        lambda q: audit_question(llm, search, q, llm_limiter, search_limiter),
+        cache,
+        workers=args.workers,
+        deadline_seconds=args.deadline_minutes * 60,
+        max_new=args.max_new,
+    )
+
+    report = build_audit_report(results, stats)
+    AUDIT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"Stats: {stats}")
+    print(f"Verdicts: {report['verdicts']}")
+    for r in report["flagged"]:
+        print(f"  ⚠ ID {r['id']} [{r['date']}] {r['verdict']}: {r['question']}")
+        if r.get("corrected_answers"):
+            print(f"    Now: {r['corrected_answers']}")
+    print(f"Report written to {args.report}")
+
+
+def cmd_experiment(args):
+    from experiment import load_variants, run_experiment, summarize
+
+    variants = load_variants(args.variants)
+    if args.fixtures:
+        with open(args.fixtures, "r", encoding="utf-8") as f:
+            cases = json.load(f)
+        cases = cases[-args.limit:] if args.limit else cases
+    else:
+        cases = recorded_cases(load_log(sources=True), limit=args.limit)
+    options = {"endpoint": args.endpoint, "model": args.model}
+
+    backend = args.endpoint or "fake model"
+    print(f"Replaying {len(cases)} case(s) x {len(variants)} variant(s) on {backend} "
+          f"with {args.workers} worker(s)...")
+    rows = run_experiment(
+        evaluate_case, cases, variants, options, workers=args.workers, initializer=init_experiment_worker
+    )
+    report = summarize(rows)
+
+    print(f"\n{'variant':<24} {'success':>8} {'iters':>6} {'tokens':>8} {'calls':>6} {'p50 s':>7} {'p90 s':>7}")
+    for name, m in report["variants"].items():
+        print(
+            f"{name:<24} {m['success_rate']:>8.0%} {m['verify_iterations'] or 0:>6.2f} "
+            f"{m['prompt_tokens'] or 0:>8.0f} {m['llm_calls'] or 0:>6.2f} "
+            f"{m['latency_p50_s'] or 0:>7.2f} {m['latency_p90_s'] or 0:>7.2f}"
+        )
+    for line in report["regressions"]:
+        print(f"  ⚠ {line}")
+
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump({**report, "backend": backend, "rows": rows}, f, indent=2, ensure_ascii=False)
+    print(f"Report written to {args.report}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Factle question generator and tooling")
+    sub = parser.add_subparsers(dest="command", metavar="command")
+
+    p = sub.add_parser("generate", help="Generate today's question (default)")
+    p.add_argument("--dry-run", action="store_true", help="Run without saving to files")
+    p.add_argument(
+        "--async-io",
+        action="store_true",
+        help="Run discovery and topic dedup concurrently on pooled async clients",
+    )
+    p.add_argument(
+        "--stream",
         action="store_true",
-        help="Run without saving to files",
+        help="Stream completions: search while generating, stop cross-checks early on VERIFIED",
+    )
+    p.add_argument(
+        "--deadline-minutes", type=float, default=RUN_DEADLINE_SECONDS / 60,
+        help=f"Wall-clock budget for the whole run (default {RUN_DEADLINE_SECONDS // 60})",
     )
-    args = parser.parse_args()
-    run(dry_run=args.dry_run)
+    p.add_argument(
+        "--tracks", type=parse_track_names, default=[], metavar="NAMES",
+        help=f"Also fill these extra tracks from the same discovery pass ({', '.join(TRACKS)})",
+    )
+    p.add_argument(
+        "--hedge",
+        action="store_true",
+        help=f"Duplicate verify-model calls slower than their p{HEDGE_PERCENTILE * 100:.0f} (at most {HEDGE_MAX_PER_RUN} per run)",
+    )
+    p.add_argument(
+        "--votes", type=int, default=0, metavar="N",
+        help="Cross-check with N parallel verdicts aggregated into one ranking (e.g. 5) "
+             "instead of sequential re-verification rounds",
+    )
+    p.add_argument(
+        "--fresh-topics",
+        action="store_true",
+        help="Run full topic discovery even if the topic pool has fresh candidates",
+    )
+    p.add_argument("--trace", metavar="PATH", help="Write a Chrome trace-event JSON of the run to PATH")
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser("fill-reserve", help="Fill the reserve bank with verified evergreen questions")
+    p.add_argument(
+        "target", type=int, nargs="?", default=RESERVE_FILL_TARGET,
+        help=f"Bank size to fill up to (default {RESERVE_FILL_TARGET})",
+    )
+    p.set_defaults(func=cmd_fill_reserve)
+
+    p = sub.add_parser("validate", help="Check questions.json offline")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("analyze-log", help="Summarize generation_log.json")
+    p.add_argument("--since", metavar="YYYY-MM-DD", help="Only include runs on or after this date")
+    p.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    p.set_defaults(func=cmd_analyze_log)
+
+    p = sub.add_parser("predictor", help="Cross-validate the topic verifiability predictor on the log")
+    p.add_argument("question", nargs="*", help="Optional candidate question text to score")
+    p.set_defaults(func=cmd_predictor)
+
+    p = sub.add_parser("build-corpus", help="Backfill the local search corpus from saved evidence")
+    p.add_argument("query", nargs="*", help="Optional query to try against the corpus")
+    p.set_defaults(func=cmd_build_corpus)
+
+    p = sub.add_parser("migrate", help="Apply data migrations to questions.json and the log")
+    p.add_argument("--dry-run", action="store_true", help="Report changes without writing files")
+    p.set_defaults(func=cmd_migrate)
+
+    p = sub.add_parser("compact-log", help="Move sources embedded in the log into the evidence store")
+    p.add_argument("--dry-run", action="store_true", help="Report the size change without writing files")
+    p.set_defaults(func=cmd_compact_log)
+
+    p = sub.add_parser("audit", help="Re-verify archived questions against current sources")
+    p.add_argument("--since", metavar="YYYY-MM-DD", help="Only audit questions dated on or after this")
+    p.add_argument("--until", metavar="YYYY-MM-DD", help="Only audit questions dated on or before this")
+    p.add_argument("--workers", type=int, default=AUDIT_WORKERS, help=f"Worker threads (default {AUDIT_WORKERS})")
+    p.add_argument(
+        "--max-new", type=int, default=AUDIT_MAX_NEW,
+        help=f"Max uncached questions to audit this run (default {AUDIT_MAX_NEW})",
+    )
+    p.add_argument(
+        "--deadline-minutes", type=float, default=AUDIT_DEADLINE_MINUTES,
+        help=f"Stop starting new audits after this long (default {AUDIT_DEADLINE_MINUTES})",
+    )
+    p.add_argument("--fresh", action="store_true", help="Ignore cached results and re-audit everything")
+    p.add_argument("--report", type=Path, default=AUDIT_REPORT_FILE, help="Where to write the JSON report")
+    p.set_defaults(func=cmd_audit)
+
+    p = sub.add_parser("bench", help="Measure offline command startup time")
+    p.add_argument("--runs", type=int, default=10, help="Interpreter launches to time (default 10)")
+    p.add_argument(
+        "--offline-command", default="validate",
+        help="Command line to time (default 'validate')",
+    )
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("experiment", help="Compare prompt variants by replaying recorded attempts")
+    p.add_argument("variants", type=Path, help="JSON file of {variant: {step: edits}} (see experiment.py)")
+    p.add_argument("--endpoint", metavar="URL", help="Local OpenAI-compatible endpoint (default: built-in fake model)")
+    p.add_argument("--model", help="Model name to send to --endpoint instead of the pipeline's own")
+    p.add_argument("--fixtures", type=Path, help="JSON list of cases to replay instead of the generation log")
+    p.add_argument("--limit", type=int, help="Replay only the most recent N cases")
+    p.add_argument(
+        "--workers", type=int, default=EXPERIMENT_WORKERS,
+        help=f"Worker processes (default {EXPERIMENT_WORKERS})",
+    )
+    p.add_argument("--report", type=Path, default=EXPERIMENT_REPORT_FILE, help="Where to write the JSON report")
+    p.set_defaults(func=cmd_experiment)
+
+    return parser
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Bare invocations and the old flag style (e.g. `--dry-run`) still mean generate
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "generate")
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Hedged requests for latency-critical calls.
+
+The pipeline is sequential, so one slow completion stalls everything behind
+it.  Hedger.call() starts a call and, if it has not finished within its call
+site's usual latency (a percentile of that site's calls so far this run, or
+a prior until there are enough), starts an identical second call and
+returns whichever succeeds first.  Hedges are capped per run so a slow
+upstream cannot double the request volume.
+
+The SDK calls block and cannot be cancelled: the losing call finishes in
+the background and its result is dropped.
+
+Usage:
+    HEDGER = Hedger({"cross_check": 30}, percentile=0.9, max_hedges=6)
+    HEDGER.enabled = True
+    response = HEDGER.call("cross_check", lambda: llm_create(...))
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Hedger:
+    """Per-call-site latency tracking with capped duplicate requests.
+
+    Args:
+        priors:      {site: seconds} hedge delay used until a site has
+                     min_samples measured calls
+        percentile:  of a site's measured latencies, the hedge delay
+        max_hedges:  duplicate requests allowed per run
+        min_samples: measured calls needed before the percentile is used
+    """
+
+    def __init__(self, priors, percentile=0.9, max_hedges=6, min_samples=3, workers=8):
+        self.priors = priors
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.min_samples = min_samples
+        self.workers = workers
+        self.enabled = False
+        self.samples = {}
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "capped": 0}
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def delay(self, site):
+        """Seconds to wait on a site's call before hedging it (None: never)."""
+        with self._lock:
+            samples = sorted(self.samples.get(site, ()))
+        if len(samples) >= self.min_samples:
+            return samples[min(len(samples) - 1, int(self.percentile * len(samples)))]
+        return self.priors.get(site)
+
+    def _record(self, site, seconds):
+        with self._lock:
+            self.samples.setdefault(site, []).append(seconds)
+
+    def _claim_hedge(self):
+        with self._lock:
+            if self.stats["hedged"] >= self.max_hedges:
+                self.stats["capped"] += 1
+                return False
+            self.stats["hedged"] += 1
+            return True
+
+    def _submit(self, fn):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hedge")
+        # Run in a copy of the caller's context so trace spans nest under it
+        return self._pool.submit(contextvars.copy_context().run, fn)
+
+    def call(self, site, fn):
+        """Return fn(), hedged with a second fn() if the first is slow.
+
+        If every started call fails, the first call's exception is raised.
+        """
+        with self._lock:
+            self.stats["calls"] += 1
+        delay = self.delay(site) if self.enabled else None
+        started = time.perf_counter()
+        if delay is None:
+            result = fn()
+            self._record(site, time.perf_counter() - started)
+            return result
+
+        primary = self._submit(fn)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._claim_hedge():
+            result = primary.result()
+            self._record(site, time.perf_counter() - started)
+            return result
+
+        backup = self._submit(fn)
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None:
+                break
+        else:
+            return primary.result()  # both failed: raise the first call's error
+        if winner is backup:
+            with self._lock:
+                self.stats["hedge_wins"] += 1
+        self._record(site, time.perf_counter() - started)
+        return winner.result()
+
+    def summary(self):
+        """Hedge counts plus each site's current hedge delay."""
+        return {
+            **self.stats,
+            "delays_s": {
+                site: round(delay, 2)
+                for site in self.samples
+                if (delay := self.delay(site)) is not None
+            },
+        }
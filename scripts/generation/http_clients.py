@@ -0,0 +1,322 @@
+"""
+Standard-library clients for the pipeline's upstream HTTP APIs.
+
+The pipeline only needs chat.completions.create (plain, JSON-mode and
+streamed) from the OpenAI-compatible GitHub Models endpoint, Tavily's search
+and plain page downloads.  These clients provide exactly that on
+http.client, so a run needs no pip install and pays no SDK import time:
+
+    ChatClient    chat.completions.create(model=..., messages=..., stream=...)
+                  returning objects shaped like the openai SDK's
+    TavilySearch  search(query, max_results=5, **params) -> Tavily's JSON
+    HTTPPool      keep-alive connections per host, shared by both and by
+                  page_fetcher.PageFetcher
+
+Errors mirror the SDK's where the pipeline looks at them: APIStatusError
+carries status_code (RateLimitError for 429), and APIConnectionError is an
+OSError.  Like the SDK, ChatClient retries connection errors and 408/409/5xx
+responses (max_retries times, with backoff); unlike it, a 429 is raised at
+once, since the pipeline's answer to a rate limit is to downgrade the model.
+
+Usage:
+    pool = HTTPPool(connect_timeout=10, read_timeout=180)
+    llm = ChatClient("https://models.inference.ai.azure.com", token, pool)
+    response = llm.chat.completions.create(model="gpt-4o", messages=[...])
+    search = TavilySearch(tavily_key, pool)
+"""
+
+import http.client
+import json
+import re
+import threading
+import time
+import types
+import zlib
+from urllib.parse import urljoin, urlsplit
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+RETRY_STATUSES = (408, 409, 500, 502, 503, 504)
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+class APIError(Exception):
+    """Base class for upstream API errors."""
+
+
+class APIStatusError(APIError):
+    """The upstream answered with an error status."""
+
+    def __init__(self, message, status_code, body=None):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        self.body = body
+
+
+class RateLimitError(APIStatusError):
+    """429 Too Many Requests."""
+
+
+class APIConnectionError(APIError, ConnectionError):
+    """The request did not get a response (refused, reset, timed out...)."""
+
+
+def status_error(status, body):
+    """The APIStatusError for an error response's status and body."""
+    text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else str(body)
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        payload = None
+    message = text[:500]
+    if isinstance(payload, dict):
+        error = payload.get("error") or payload.get("detail")
+        message = error.get("message", message) if isinstance(error, dict) else str(error or message)
+    cls = RateLimitError if status == 429 else APIStatusError
+    return cls(message, status, payload)
+
+
+def to_namespace(value):
+    """JSON data as nested SimpleNamespaces (attribute access like SDK objects)."""
+    if isinstance(value, dict):
+        return types.SimpleNamespace(**{k: to_namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [to_namespace(v) for v in value]
+    return value
+
+
+class Response:
+    """One HTTP response; its connection goes back to the pool once the
+    body has been read completely, and is dropped by close() otherwise."""
+
+    def __init__(self, pool, key, conn, raw):
+        self.pool = pool
+        self.key = key
+        self.conn = conn
+        self.raw = raw
+        self.status = raw.status
+        self.headers = raw.headers
+        self.url = None
+
+    def _release(self):
+        if self.conn is not None:
+            self.pool.release(self.key, self.conn, reusable=self.raw.isclosed() and not self.raw.will_close)
+            self.conn = None
+
+    def read(self, limit=None):
+        """The (decompressed) body, truncated to limit bytes if given."""
+        try:
+            encoding = (self.headers.get("Content-Encoding") or "").lower()
+            if encoding in ("gzip", "deflate"):
+                decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+                chunks, size = [], 0
+                while limit is None or size < limit:
+                    data = self.raw.read(64 * 1024)
+                    if not data:
+                        break
+                    chunk = decoder.decompress(data, (limit - size) if limit else 0)
+                    chunks.append(chunk)
+                    size += len(chunk)
+                return b"".join(chunks)[:limit]
+            return self.raw.read(limit) if limit is not None else self.raw.read()
+        except (OSError, http.client.HTTPException) as exc:
+            self.close()
+            raise APIConnectionError(str(exc)) from exc
+        finally:
+            self._release()
+
+    def text(self, limit=None):
+        """read() decoded with the Content-Type charset (UTF-8 if none)."""
+        match = CHARSET_RE.search(self.headers.get("Content-Type") or "")
+        encoding = match.group(1) if match else "utf-8"
+        body = self.read(limit)
+        try:
+            return body.decode(encoding, errors="replace")
+        except LookupError:  # unknown charset name
+            return body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.read())
+
+    def iter_lines(self):
+        """Decoded lines of a streamed (uncompressed) body."""
+        try:
+            for line in self.raw:
+                yield line.decode("utf-8").rstrip("\r\n")
+        except (OSError, http.client.HTTPException) as exc:
+            raise APIConnectionError(str(exc)) from exc
+        finally:
+            self._release()
+
+    def close(self):
+        if self.conn is not None:
+            self.raw.close()
+            self.pool.release(self.key, self.conn, reusable=False)
+            self.conn = None
+
+
+class HTTPPool:
+    """Keep-alive HTTP(S) connections per (scheme, host, port), thread-safe.
+
+    Args:
+        connect_timeout: seconds to establish a connection
+        read_timeout:    default seconds to wait on a response read
+        max_idle:        idle connections kept per host
+    """
+
+    def __init__(self, connect_timeout=10, read_timeout=180, max_idle=8, user_agent="factle-generator/1.0"):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_idle = max_idle
+        self.user_agent = user_agent
+        self.idle = {}
+        self.stats = {"connections": 0, "reused": 0}
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        """(connection, reused) for key, an idle one if there is one."""
+        with self._lock:
+            idle = self.idle.get(key)
+            if idle:
+                self.stats["reused"] += 1
+                return idle.pop(), True
+            self.stats["connections"] += 1
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=self.connect_timeout), False
+
+    def release(self, key, conn, reusable=True):
+        with self._lock:
+            idle = self.idle.setdefault(key, [])
+            if reusable and len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method, url, body, headers, timeout):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate", **(headers or {})}
+        while True:
+            conn, reused = self.acquire(key)
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                conn.sock.settimeout(timeout or self.read_timeout)
+                conn.request(method, path, body=body, headers=headers)
+                return Response(self, key, conn, conn.getresponse())
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                if reused and not isinstance(exc, TimeoutError):
+                    continue  # the server closed an idle keep-alive connection; retry on a new one
+                raise APIConnectionError(f"{type(exc).__name__}: {exc}") from exc
+
+    def request(self, method, url, body=None, headers=None, timeout=None, max_redirects=0):
+        """Send a request and return its Response (redirects followed up to
+        max_redirects times; the body is not read)."""
+        for _ in range(max_redirects + 1):
+            response = self._send(method, url, body, headers, timeout)
+            location = response.headers.get("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                break
+            response.read()
+            url = urljoin(url, location)
+            if response.status == 303:
+                method, body = "GET", None
+        response.url = url
+        return response
+
+    def close(self):
+        with self._lock:
+            conns = [c for idle in self.idle.values() for c in idle]
+            self.idle = {}
+        for conn in conns:
+            conn.close()
+
+
+class ChatStream:
+    """Iterator of chat-completion chunks from a server-sent-events response."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def __iter__(self):
+        for line in self.response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            yield to_namespace(json.loads(data))
+
+    def close(self):
+        self.response.close()
+
+
+class ChatClient:
+    """chat.completions.create over an OpenAI-compatible REST endpoint.
+
+    Args:
+        base_url:    e.g. "https://models.inference.ai.azure.com"
+        api_key:     bearer token
+        pool:        HTTPPool to send on (a private one if None)
+        max_retries: retries of connection errors and RETRY_STATUSES
+    """
+
+    def __init__(self, base_url, api_key, pool=None, max_retries=2, backoff_seconds=0.5):
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.api_key = api_key
+        self.pool = pool or HTTPPool()
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, stream=False, timeout=None, **params):
+        """Returns the completion (choices[i].message.content, usage...), or
+        with stream a ChatStream of chunks (choices[0].delta.content)."""
+        body = {"model": model, "messages": messages, **params}
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        if stream:
+            body["stream"] = True
+            headers["Accept"] = "text/event-stream"
+            headers["Accept-Encoding"] = "identity"
+        payload = json.dumps(body).encode("utf-8")
+
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            try:
+                response = self.pool.request("POST", self.url, body=payload, headers=headers, timeout=timeout)
+            except APIConnectionError:
+                if last:
+                    raise
+            else:
+                if response.status < 400:
+                    return ChatStream(response) if stream else to_namespace(response.json())
+                error = status_error(response.status, response.read())
+                if last or response.status not in RETRY_STATUSES:
+                    raise error
+            time.sleep(self.backoff_seconds * 2 ** attempt)
+
+
+class TavilySearch:
+    """Tavily's search API: the subset of TavilyClient the pipeline uses."""
+
+    def __init__(self, api_key, pool=None, url=TAVILY_SEARCH_URL):
+        self.api_key = api_key
+        self.pool = pool or HTTPPool()
+        self.url = url
+
+    def search(self, query, max_results=5, timeout=None, **params):
+        """Search Tavily; returns its {"results": [...], ...} payload."""
+        response = self.pool.request(
+            "POST", self.url,
+            body=json.dumps({"query": query, "max_results": max_results, **params}).encode("utf-8"),
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            timeout=timeout,
+        )
+        if response.status >= 400:
+            raise status_error(response.status, response.read())
+        return response.json()
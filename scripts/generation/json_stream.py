@@ -0,0 +1,80 @@
+"""
+Incremental parser for a JSON object arriving in streamed chunks.
+
+Completions are requested in JSON mode, so the model emits one flat-ish
+object whose top-level members arrive in prompt order.  IncrementalObject
+reports each top-level member as soon as its value is complete, which lets
+the pipeline act on early fields (a search query, a verdict) while the rest
+of the object is still being generated.
+
+Usage:
+    parser = IncrementalObject()
+    for chunk in stream:
+        for key, value in parser.feed(chunk):
+            ...
+    parser.text  # full accumulated text, for the normal schema check
+"""
+
+import json
+
+
+class IncrementalObject:
+    """Emit (key, value) for each top-level member once it is complete.
+
+    A member is complete when the scanner reaches the ',' or '}' that ends
+    it at depth 1; nested arrays and objects are therefore emitted whole.
+    Anything before the first '{' (code fences, prose) is ignored.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields = {}
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start = None
+
+    def feed(self, chunk):
+        """Add a chunk of text; return the members completed by it."""
+        self.text += chunk or ""
+        completed = []
+        text = self.text
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                if self._depth:
+                    self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1 and ch == "{":
+                    self._member_start = i + 1
+            elif ch in "}]":
+                if self._depth == 1:
+                    completed += self._close_member(text[self._member_start:i])
+                    self._member_start = None
+                self._depth = max(self._depth - 1, 0)
+            elif ch == "," and self._depth == 1:
+                completed += self._close_member(text[self._member_start:i])
+                self._member_start = i + 1
+        self._pos = len(text)
+        return completed
+
+    def _close_member(self, member):
+        if self._member_start is None or not member.strip():
+            return []
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            # Malformed member: leave it to the full-text schema check
+            return []
+        self.fields.update(parsed)
+        return list(parsed.items())
@@ -0,0 +1,311 @@
+"""
+Response schemas for every JSON-mode LLM call in the Factle pipeline.
+
+Each schema names the fields a call site relies on and how to check them.
+check_llm_json() extracts JSON tolerantly (code fences, surrounding prose,
+trailing commas, Python literals), validates and coerces the fields, and
+reports only the errors that make the response unusable.  Problems with
+optional fields are fixed locally (bad numeric values become null, bad
+optional fields are dropped) so they never cost another model call.
+
+Field specs:
+    {"type": "str" | "bool" | "enum" | "strings" | "numbers" | "objects",
+     "required": bool,       # missing/invalid is fatal
+     "values": [...],        # enum only
+     "length": int,          # exact list length (strings / numbers)
+     "keys": [...]}          # required string keys of each object (objects)
+"""
+
+import json
+import re
+
+FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+PY_LITERALS = {"None": "null", "True": "true", "False": "false"}
+NUMBER_NOISE_RE = re.compile(r"[,\s$€£%]")
+
+
+def extract_json(text):
+    """Parse the first JSON value in text, repairing common LLM slips.
+
+    Raises:
+        ValueError: if no parseable JSON value can be recovered.
+    """
+    if not text:
+        raise ValueError("empty response")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    candidate = find_json_span(FENCE_RE.sub("", text))
+    if candidate is None:
+        raise ValueError("no JSON object found")
+    for attempt in (candidate, repair_json_text(candidate)):
+        try:
+            return json.loads(attempt)
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("unrepairable JSON")
+
+
+def find_json_span(text):
+    """Return the first balanced {...} or [...] substring, honoring strings."""
+    start = next((i for i, ch in enumerate(text) if ch in "{["), None)
+    if start is None:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    # Unbalanced (e.g. truncated output): nothing safe to parse
+    return None
+
+
+def repair_json_text(text):
+    """Fix trailing commas and bare Python literals outside of strings."""
+    out = []
+    i = 0
+    in_string = False
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            out.append(ch)
+            if ch == "\\" and i + 1 < len(text):
+                out.append(text[i + 1])
+                i += 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+            out.append(ch)
+        else:
+            for literal, replacement in PY_LITERALS.items():
+                if text.startswith(literal, i) and not text[i + len(literal):i + len(literal) + 1].isalnum():
+                    out.append(replacement)
+                    i += len(literal) - 1
+                    break
+            else:
+                out.append(ch)
+        i += 1
+    return TRAILING_COMMA_RE.sub(r"\1", "".join(out))
+
+
+def coerce_number(value):
+    """Turn '1,234', '12.5%' or '$3' into a float; None if not numeric."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(NUMBER_NOISE_RE.sub("", value))
+        except ValueError:
+            return None
+    return None
+
+
+def coerce_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    return None
+
+
+def check_field(name, spec, value):
+    """Validate one field. Returns (coerced_value, error_or_None)."""
+    kind = spec["type"]
+    if kind == "str":
+        if isinstance(value, str) and value.strip():
+            return value.strip(), None
+        return None, f"'{name}' must be a non-empty string"
+    if kind == "bool":
+        coerced = coerce_bool(value)
+        return coerced, None if coerced is not None else f"'{name}' must be true or false"
+    if kind == "enum":
+        coerced = value.strip().upper() if isinstance(value, str) else value
+        if coerced in spec["values"]:
+            return coerced, None
+        return None, f"'{name}' must be one of {', '.join(spec['values'])}"
+
+    if not isinstance(value, list):
+        return None, f"'{name}' must be an array"
+    if "length" in spec and len(value) != spec["length"]:
+        return None, f"'{name}' must have exactly {spec['length']} items, got {len(value)}"
+    if kind == "strings":
+        items = [str(v).strip() for v in value if v is not None and str(v).strip()]
+        if len(items) != len(value):
+            return None, f"'{name}' must contain only non-empty strings"
+        return items, None
+    if kind == "numbers":
+        # Unknown / unparseable values become null, which callers already handle
+        return [coerce_number(v) for v in value], None
+    if kind == "objects":
+        items = [
+            v for v in value
+            if isinstance(v, dict) and all(isinstance(v.get(k), str) and v.get(k).strip() for k in spec.get("keys", []))
+        ]
+        if not items:
+            return None, f"'{name}' has no usable entries"
+        return items, None
+    raise ValueError(f"Unknown field type {kind}")
+
+
+def check_llm_json(content, schema):
+    """Extract, validate and coerce an LLM response against schema.
+
+    Returns:
+        (data, errors): data is the cleaned dict (None if nothing could be
+        parsed); errors lists the problems that make it unusable.
+    """
+    try:
+        data = extract_json(content)
+    except ValueError as exc:
+        return None, [f"invalid JSON: {exc}"]
+
+    if schema.get("normalize"):
+        data = schema["normalize"](data)
+    if not isinstance(data, dict):
+        return None, ["expected a JSON object"]
+
+    cleaned = dict(data)
+    errors = []
+    for name, spec in schema["fields"].items():
+        value = data.get(name)
+        if value is None:
+            if spec.get("required"):
+                errors.append(f"missing '{name}'")
+            continue
+        coerced, error = check_field(name, spec, value)
+        if error and spec.get("required"):
+            errors.append(error)
+        elif error:
+            cleaned.pop(name, None)  # optional: drop it rather than pay for a repair
+        else:
+            cleaned[name] = coerced
+
+    if not errors and schema.get("check"):
+        errors.extend(schema["check"](cleaned))
+    return cleaned, errors
+
+
+def describe_schema(schema):
+    """Render the schema as bullet lines for a repair prompt."""
+    lines = []
+    for name, spec in schema["fields"].items():
+        kind = spec["type"]
+        if kind == "enum":
+            desc = "one of " + ", ".join(f'"{v}"' for v in spec["values"])
+        elif kind == "strings":
+            desc = "array of strings"
+        elif kind == "numbers":
+            desc = "array of numbers (null if unknown)"
+        elif kind == "objects":
+            desc = "array of objects with string keys " + ", ".join(spec.get("keys", []))
+        elif kind == "bool":
+            desc = "true or false"
+        else:
+            desc = "string"
+        if "length" in spec:
+            desc += f" with exactly {spec['length']} items"
+        lines.append(f"- \"{name}\": {desc}{' (required)' if spec.get('required') else ''}")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Call-site schemas
+# ---------------------------------------------------------------------------
+
+
+def normalize_topics(data):
+    """Accept a bare list or any single list-valued key as the topics array."""
+    if isinstance(data, list):
+        return {"topics": data}
+    if isinstance(data, dict) and "topics" not in data:
+        for v in data.values():
+            if isinstance(v, list):
+                return {**data, "topics": v}
+    return data
+
+
+def check_cross_check(data):
+    if data["status"] == "CORRECTED" and not data.get("corrected_answers"):
+        return ["'corrected_answers' must list exactly 5 answers when status is CORRECTED"]
+    return []
+
+
+DISCOVERY_SCHEMA = {
+    "name": "discover_topics",
+    "normalize": normalize_topics,
+    "fields": {
+        "topics": {"type": "objects", "keys": ["topic", "suggested_question"], "required": True},
+    },
+}
+
+TOPIC_DEDUP_SCHEMA = {
+    "name": "topic_dedup",
+    "fields": {
+        "recently_covered": {"type": "bool", "required": True},
+        "reason": {"type": "str"},
+        "overlaps_with": {"type": "str"},
+    },
+}
+
+SIMILARITY_SCHEMA = {
+    "name": "similarity_check",
+    "fields": {
+        "too_similar": {"type": "bool", "required": True},
+        "reason": {"type": "str"},
+    },
+}
+
+GENERATED_QUESTION_SCHEMA = {
+    "name": "generate_question",
+    "fields": {
+        "question": {"type": "str", "required": True},
+        "answers": {"type": "strings", "length": 5, "required": True},
+        "distractors": {"type": "strings", "required": True},
+        "source": {"type": "str"},
+        "search_query": {"type": "str"},
+    },
+}
+
+CROSS_CHECK_SCHEMA = {
+    "name": "cross_check",
+    "check": check_cross_check,
+    "fields": {
+        "status": {"type": "enum", "values": ["VERIFIED", "CORRECTED", "UNVERIFIABLE"], "required": True},
+        "best_source": {"type": "str"},
+        "answer_values": {"type": "numbers", "length": 5},
+        "corrected_answers": {"type": "strings", "length": 5},
+        "corrected_values": {"type": "numbers", "length": 5},
+        "reason": {"type": "str"},
+    },
+}
+
+RE_VERIFY_SCHEMA = {
+    "name": "re_verify",
+    "fields": {
+        "status": {"type": "enum", "values": ["CONFIRMED", "REJECTED"], "required": True},
+        "reason": {"type": "str"},
+        "best_source": {"type": "str"},
+        "answer_values": {"type": "numbers", "length": 5},
+    },
+}
@@ -0,0 +1,292 @@
+"""
+Record models for questions and generation-log runs, and their file layout.
+
+The pipeline builds its records as these slotted dataclasses, which fix
+each record's fields:
+
+    Question         an entry of questions.json
+    Run              one generation-log run, with its attempts
+    Attempt          one topic attempt, with its verification iterations
+    VerifyIteration  one verification iteration of an attempt, filled in
+                     through attempt.iteration(n)
+
+Records also take dict-style access (record["status"] = ..., .get(),
+.setdefault(), .pop()) to their fields; any other key lands in .extra, which
+the caller reports as drift.  from_dict() accepts everything the files have
+ever held, so nothing is lost: the files' flat per-iteration keys
+(verification_search_iter<n>, cross_check_iter<n>...) are routed into the
+attempt's VerifyIterations there and only there.  to_dict() gives back the
+flat layout of the files.
+
+dumps_records() is the files' serializer: one compact record per line.  It
+uses the C JSON encoder (pretty-printing forces the pure-Python one), is
+much smaller than indented JSON, and still diffs one record per line.  Plain
+json.load reads both it and the older indented files.
+
+Usage:
+    run = Run(date="2026-10-19")
+    run["attempts"].append(Attempt(topic="Rivers"))
+    if run.unknown_fields():
+        ...
+    text = dumps_records({"runs": [run.to_dict() for run in runs]}, "runs")
+"""
+
+import json
+import re
+from dataclasses import dataclass, field, fields
+
+# The files' flat per-iteration keys, read by Attempt.from_dict()
+ITERATION_KEY = re.compile(
+    r"^(?:(verification_search|vote|cross_check|consistency|re_verify)_iter(\d+)|verify_iter(\d+)_result)$"
+)
+
+
+class _Unset:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNSET"
+
+    def __bool__(self):
+        return False
+
+
+UNSET = _Unset()   # an optional field the record does not have (unlike None, which it may store)
+
+
+def _optional():
+    return field(default=UNSET)
+
+
+_FIELD_NAMES = {}
+
+
+def field_names(cls):
+    """A model's field names, less the bookkeeping ones (extra, iterations)."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = frozenset(f.name for f in fields(cls)) - {"extra", "iterations"}
+    return names
+
+
+def plain(value):
+    """value with every record in it, however nested, as its dict."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: plain(v) for k, v in value.items()}
+    return value
+
+
+class Record:
+    """from_dict/to_dict and dict-style access shared by the models: fields
+    left UNSET are absent, unknown keys round-trip through .extra."""
+
+    __slots__ = ()
+
+    @classmethod
+    def _prepare(cls, data):
+        """Turn a dict's nested records into models (see Attempt, Run)."""
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        data = cls._prepare(data)
+        names = field_names(cls) | {"iterations"}
+        record = cls(**{k: v for k, v in data.items() if k in names})
+        record.extra = {k: v for k, v in data.items() if k not in names}
+        return record
+
+    def to_dict(self):
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name == "extra" or value is UNSET:
+                continue
+            data[f.name] = plain(value)
+        data.update(plain(self.extra))
+        return data
+
+    def unknown_fields(self):
+        return sorted(self.extra)
+
+    def __getitem__(self, key):
+        if key not in field_names(type(self)):
+            return self.extra[key]
+        value = getattr(self, key)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in field_names(type(self)):
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def pop(self, key, *default):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        if key in field_names(type(self)):
+            setattr(self, key, UNSET)
+        else:
+            del self.extra[key]
+        return value
+
+    def keys(self):
+        return self.to_dict().keys()
+
+
+@dataclass(slots=True)
+class Question(Record):
+    id: int
+    date: str
+    question: str
+    options: list
+    answers: list
+    source: str = ""
+    tags: object = _optional()   # taxonomy.tag_text() of the question
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class VerifyIteration(Record):
+    n: int
+    verification_search: object = _optional()
+    vote: object = _optional()
+    cross_check: object = _optional()
+    consistency: object = _optional()
+    re_verify: object = _optional()
+    result: object = _optional()
+    extra: dict = field(default_factory=dict)
+
+    def to_dict(self):
+        """The attempt-level keys, e.g. {"cross_check_iter0": ...}."""
+        data = {}
+        for name in ("verification_search", "vote", "cross_check", "consistency", "re_verify"):
+            value = getattr(self, name)
+            if value is not UNSET:
+                data[f"{name}_iter{self.n}"] = value
+        if self.result is not UNSET:
+            data[f"verify_iter{self.n}_result"] = self.result
+        return data
+
+
+@dataclass(slots=True)
+class Attempt(Record):
+    topic: str = ""
+    suggested_question: object = _optional()
+    connection: object = _optional()
+    status: str = "pending"
+    reason: object = _optional()
+    verify_iterations: object = _optional()
+    is_fallback: object = _optional()
+    similarity_check: object = _optional()
+    content_filter: object = _optional()
+    generated_question: object = _optional()
+    iterations: list = field(default_factory=list)
+    budget_exhausted: object = _optional()
+    question_id: object = _optional()
+    final_answers: object = _optional()
+    final_source: object = _optional()
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def _prepare(cls, data):
+        flat, iterations = {}, {}
+        for key, value in data.items():
+            match = ITERATION_KEY.match(key)
+            if not match:
+                flat[key] = value
+                continue
+            name, n, result_n = match.groups()
+            iteration = iterations.setdefault(int(n or result_n), VerifyIteration(int(n or result_n)))
+            setattr(iteration, name or "result", value)
+        flat["iterations"] = [iterations[n] for n in sorted(iterations)]
+        return flat
+
+    def iteration(self, n):
+        """The VerifyIteration for verification iteration n, added if new."""
+        for iteration in self.iterations:
+            if iteration.n == n:
+                return iteration
+        iteration = VerifyIteration(n)
+        self.iterations.append(iteration)
+        self.iterations.sort(key=lambda it: it.n)
+        return iteration
+
+    def to_dict(self):
+        data = {}
+        for key, value in Record.to_dict(self).items():
+            if key == "iterations":
+                for iteration in value:
+                    data.update(iteration)
+            else:
+                data[key] = value
+        return data
+
+
+@dataclass(slots=True)
+class Run(Record):
+    date: str
+    topics_discovered: list = field(default_factory=list)
+    attempts: list = field(default_factory=list)
+    result: str = "pending"
+    step1_topic_discovery: object = _optional()
+    step1b_topic_dedup: object = _optional()
+    step1c_topic_ranking: object = _optional()
+    fallback_used: object = _optional()
+    reserve_used: object = _optional()
+    reserve_topup: object = _optional()
+    deadline_reached: object = _optional()
+    question_id: object = _optional()
+    budget: object = _optional()
+    breakers: object = _optional()
+    hedging: object = _optional()
+    trace_summary: object = _optional()
+    tracks: object = _optional()
+    topic_pool: object = _optional()
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def _prepare(cls, data):
+        return {**data, "attempts": [Attempt.from_dict(a) for a in data.get("attempts", [])]}
+
+    def unknown_fields(self):
+        return sorted({*self.extra, *(k for a in self.attempts for k in a.extra)})
+
+
+def dumps_records(data, key):
+    """data as JSON with the records under data[key] one compact record per line."""
+    def compact(value):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    head = "".join(f"{json.dumps(k)}: {compact(v)}, " for k, v in data.items() if k != key)
+    body = ",\n".join(compact(r) for r in data.get(key, []))
+    return f"{{{head}{json.dumps(key)}: [\n{body}\n]}}\n"
@@ -0,0 +1,251 @@
+"""
+Full-page fetcher for verification sources.
+
+Search snippets are short and often stop before the ranked table the
+question is about.  PageFetcher downloads the source pages themselves on one
+keep-alive http_clients.HTTPPool, with a cap on concurrent requests per host, and
+keeps an on-disk cache that is revalidated with ETag / Last-Modified
+conditional GETs (a 304 costs one round trip and no body).
+
+extract_ranked_region() then cuts each page down to the table or list that
+best matches the question, so the prompt gets the ranking itself rather
+than the page's navigation and prose.
+
+Usage:
+    fetcher = PageFetcher(cache_dir)
+    pages = fetcher.fetch_many(["https://en.wikipedia.org/wiki/..."])
+    region = extract_ranked_region(pages[url], "longest rivers", max_chars=2500)
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from http_clients import APIError, HTTPPool
+
+TERM_RE = re.compile(r"[^\W_]+", re.UNICODE)
+SKIPPED_TAGS = {"script", "style", "noscript", "svg", "nav", "footer", "header"}
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+
+
+class PageFetcher:
+    """Pooled, per-host-limited page downloads with a conditional-GET cache.
+
+    Args:
+        cache_dir:  directory for cached pages (one JSON file per URL)
+        per_host:   max concurrent requests to the same host
+        timeout:    default connect and read timeout in seconds
+        max_bytes:  pages larger than this are truncated
+        pool:       HTTPPool to share (a private one if None)
+    """
+
+    def __init__(self, cache_dir, per_host=2, timeout=15, max_bytes=2_000_000,
+                 user_agent="FactleVerifier/1.0 (+https://seandeloddere.github.io/factle)", pool=None):
+        self.cache_dir = cache_dir
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.http = pool or HTTPPool(connect_timeout=timeout, read_timeout=timeout)
+        self.user_agent = user_agent
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self.stats = {"fetched": 0, "revalidated": 0, "errors": 0}
+
+    def _slot(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _cache_path(self, url):
+        return self.cache_dir / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _load_cached(self, url):
+        path = self._cache_path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, url, response, text):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "text": text,
+        }
+        with open(self._cache_path(url), "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+    def fetch(self, url, timeout=None):
+        """Return the page's HTML, or None if it could not be fetched.
+
+        A cached copy is revalidated with If-None-Match / If-Modified-Since;
+        on 304 the cached body is returned.  Non-HTML responses yield None.
+        """
+        cached = self._load_cached(url)
+        headers = {"User-Agent": self.user_agent}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with self._slot(url):
+            try:
+                response = self.http.request(
+                    "GET", url, headers=headers, timeout=timeout or self.timeout, max_redirects=5
+                )
+                if response.status == 304 and cached:
+                    response.close()
+                    with self._lock:
+                        self.stats["revalidated"] += 1
+                    return cached["text"]
+                if response.status >= 400:
+                    response.close()
+                    raise APIError(f"HTTP {response.status}")
+                content_type = response.headers.get("Content-Type", "")
+                if not content_type.startswith(HTML_TYPES):
+                    response.close()
+                    return None
+                text = response.text(self.max_bytes)
+                response.close()
+            except (APIError, OSError):
+                with self._lock:
+                    self.stats["errors"] += 1
+                # A stale copy beats nothing when the site is down
+                return cached["text"] if cached else None
+
+        self._store(url, response, text)
+        with self._lock:
+            self.stats["fetched"] += 1
+        return text
+
+    def fetch_many(self, urls, workers=4, timeout=None):
+        """Fetch urls concurrently; returns {url: html or None}."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as pool:
+            pages = pool.map(lambda u: self.fetch(u, timeout=timeout), urls)
+            return dict(zip(urls, pages))
+
+    def close(self):
+        self.http.close()
+
+
+# ---------------------------------------------------------------------------
+# Table / list extraction
+# ---------------------------------------------------------------------------
+
+
+class _BlockParser(HTMLParser):
+    """Collect every <table>, <ol> and <ul> as a list of text rows."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []      # [{"kind", "caption", "rows"}]
+        self._stack = []      # open blocks (tables/lists can nest)
+        self._row = None      # cells of the current <tr> / text of the current <li>
+        self._cell = None
+        self._skip = 0
+        self._heading = ""    # last heading text, used as a caption for lists
+        self._in_heading = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip += 1
+        elif tag in ("table", "ol", "ul"):
+            self._stack.append({"kind": tag, "caption": self._heading, "rows": []})
+        elif tag == "tr" and self._stack:
+            self._row = []
+        elif tag in ("td", "th") and self._row is not None:
+            self._cell = []
+        elif tag == "li" and self._stack:
+            self._cell = []
+        elif tag in ("h1", "h2", "h3", "h4", "caption"):
+            self._in_heading = True
+            self._heading = ""
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag in ("td", "th") and self._cell is not None and self._row is not None:
+            self._row.append(" ".join(self._cell).strip())
+            self._cell = None
+        elif tag == "tr" and self._row is not None and self._stack:
+            if any(self._row):
+                self._stack[-1]["rows"].append(" | ".join(c for c in self._row))
+            self._row = None
+        elif tag == "li" and self._cell is not None and self._stack:
+            text = " ".join(self._cell).strip()
+            if text:
+                self._stack[-1]["rows"].append(text)
+            self._cell = None
+        elif tag in ("table", "ol", "ul") and self._stack:
+            block = self._stack.pop()
+            if block["rows"]:
+                self.blocks.append(block)
+        elif tag in ("h1", "h2", "h3", "h4", "caption"):
+            self._in_heading = False
+            if tag == "caption" and self._stack:
+                self._stack[-1]["caption"] = self._heading
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        text = " ".join(data.split())
+        if not text:
+            return
+        if self._in_heading:
+            self._heading = f"{self._heading} {text}".strip()
+        if self._cell is not None:
+            self._cell.append(text)
+
+
+def extract_ranked_region(html, query, max_chars=2500):
+    """Return the table or list in html that best matches query, as text.
+
+    Blocks are scored by how many distinct query terms appear in their
+    caption and rows, with a bonus for blocks that look like rankings (at
+    least five rows).  Returns "" when the page has no usable block.
+    """
+    parser = _BlockParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        return ""
+
+    terms = {t for t in TERM_RE.findall(query.lower()) if len(t) > 2}
+    best, best_score = None, 0.0
+    for block in parser.blocks:
+        text = f"{block['caption']} " + " ".join(block["rows"][:50])
+        found = {t for t in TERM_RE.findall(text.lower()) if t in terms}
+        score = len(found) + (1.0 if len(block["rows"]) >= 5 else 0.0)
+        if score > best_score:
+            best, best_score = block, score
+    if best is None:
+        return ""
+
+    lines = [best["caption"]] if best["caption"] else []
+    lines += best["rows"]
+    out = []
+    used = 0
+    for line in lines:
+        if used + len(line) + 1 > max_chars:
+            break
+        out.append(line)
+        used += len(line) + 1
+    return "\n".join(out)
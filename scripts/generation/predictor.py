@@ -0,0 +1,200 @@
+"""
+Offline verifiability predictor for candidate Factle topics.
+
+Fit on the generation log: every attempt that reached verification is a
+training example, labeled by whether it ended in success and by how many
+verify iterations it used.  Features come only from what is known before a
+topic is attempted — its topic line and suggested question — so candidates
+can be scored straight after discovery:
+
+    - wording cues that historically matter for verifiability ("all-time",
+      "as of", "per capita", "latest", survey/index sources, exact dates...)
+    - the question's domain: its confident taxonomy categories
+    - word unigrams from the question (stemmed; stopwords and rare words
+      dropped)
+
+Two small models are trained with plain gradient descent (no numpy, no
+network, milliseconds on the full log): L2-regularized logistic regression
+for P(success) and ridge regression for the expected verify iterations.
+evaluate() cross-validates P(success) against always predicting the base
+rate; the pipeline only trusts the ranking when it clearly wins.
+"""
+
+import math
+import re
+
+from content_filter import stem, tokenize
+from search_backend import STOPWORDS
+from taxonomy import confident_categories, tag_text
+
+VERIFIABILITY_CUES = {
+    "all_time": re.compile(r"\ball[- ]time\b|\bin history\b|\bever\b", re.I),
+    "as_of": re.compile(r"\bas of\b|\bthrough the (latest|end)\b|\bcurrent(ly)?\b", re.I),
+    "latest": re.compile(r"\blatest\b|\bmost recent\b|\bthis (year|season)\b", re.I),
+    "per_capita": re.compile(r"\bper[- ]capita\b|\bper (person|100|1,?000)\b|\brate\b", re.I),
+    "survey_or_index": re.compile(r"\bsurvey\b|\bindex\b|\bnielsen\b|\bsimilarweb\b|\bcensus\b|\bacs\b", re.I),
+    "tie_break": re.compile(r"\bties?\b|\bbreaking ties\b", re.I),
+    "money": re.compile(r"\brevenue\b|\bgross(ing)?\b|\bsales\b|\bbox office\b|\bgdp\b|\$", re.I),
+    "attendance": re.compile(r"\battendance\b|\bvisitors?\b|\bviewership\b|\bvisits\b", re.I),
+    "count_of_wins": re.compile(r"\bwins\b|\btitles\b|\bchampionships\b|\bmedals\b|\bvictories\b", re.I),
+    "physical": re.compile(r"\btallest\b|\blongest\b|\blargest\b|\bdeepest\b|\bhighest\b|\bheaviest\b", re.I),
+    "dated": re.compile(r"\b(19|20)\d\d\b"),
+}
+MIN_TOKEN_COUNT = 3  # unigram features must occur in at least this many training examples
+# Function words carry no signal of their own but are frequent enough to
+# soak up weight: the search stopwords plus the questions' auxiliaries.
+# Numbers are left to the "dated" cue.
+UNIGRAM_STOPWORDS = {stem(w) for w in STOPWORDS | {
+    "are", "was", "were", "has", "have", "had", "its", "their", "this", "that", "than", "into", "be",
+    "been", "do", "does",
+}}
+
+TRAINING_STATUSES = {"success", "verification_exhausted", "validation_failed", "correction_rejected"}
+
+
+def attempt_text(topic_info):
+    return f"{topic_info.get('topic', '')} {topic_info.get('suggested_question', '')}"
+
+
+def extract_features(text):
+    """Names of the binary features present in one candidate's text."""
+    features = ["bias"]
+    for name, pattern in VERIFIABILITY_CUES.items():
+        if pattern.search(text):
+            features.append(f"cue:{name}")
+    for category in confident_categories(tag_text(text)):
+        features.append(f"domain:{category}")
+    for tok in sorted(set(tokenize(text)) - UNIGRAM_STOPWORDS):
+        if not tok.isdigit():
+            features.append(f"word:{tok}")
+    return features
+
+
+def training_examples(log):
+    """Yield (text, succeeded, verify_iterations) for every labeled attempt."""
+    for run in log.get("runs", []):
+        for attempt in run.get("attempts", []):
+            if attempt.get("status") not in TRAINING_STATUSES:
+                continue
+            yield (
+                attempt_text(attempt),
+                attempt["status"] == "success",
+                attempt.get("verify_iterations") or 1,
+            )
+
+
+def _sigmoid(z):
+    if z < -30:
+        return 0.0
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def _fit(rows, targets, n_features, predict, l2, lr, epochs, bias=0.0):
+    """Batch gradient descent over binary feature-index rows.
+
+    Log loss with a sigmoid link and squared loss with an identity link
+    share the same gradient form, so one loop fits both models.  Index 0
+    is the unpenalized bias, started at bias.
+    """
+    weights = [0.0] * n_features
+    weights[0] = bias
+    n = len(rows)
+    for _ in range(epochs):
+        grad = [0.0] * n_features
+        for row, y in zip(rows, targets):
+            err = predict(sum(map(weights.__getitem__, row))) - y
+            for j in row:
+                grad[j] += err
+        for j in range(n_features):
+            penalty = l2 * weights[j] if j else 0.0
+            weights[j] -= lr * (grad[j] / n + penalty)
+    return weights
+
+
+class VerifiabilityModel:
+    """P(success) and expected verify iterations for a candidate topic."""
+
+    def __init__(self, l2=0.05, lr=1.0, epochs=50):
+        self.l2 = l2
+        self.lr = lr
+        self.epochs = epochs
+        self.index = {}
+        self.success_weights = []
+        self.iteration_weights = []
+        self.examples = 0
+        self.base_rate = None
+
+    def fit(self, examples):
+        examples = list(examples)
+        self.examples = len(examples)
+        if not examples:
+            return self
+
+        extracted = [extract_features(text) for text, _, _ in examples]
+        counts = {}
+        for features in extracted:
+            for key in features:
+                if key.startswith(("word:", "domain:")):
+                    counts[key] = counts.get(key, 0) + 1
+        vocabulary = {k for k, c in counts.items() if c >= MIN_TOKEN_COUNT}
+        names = ["bias"] + [f"cue:{name}" for name in VERIFIABILITY_CUES] + sorted(vocabulary)
+        self.index = {name: i for i, name in enumerate(names)}
+
+        rows = [[self.index[f] for f in features if f in self.index] for features in extracted]
+        successes = [1.0 if ok else 0.0 for _, ok, _ in examples]
+        iterations = [float(it) for _, _, it in examples]
+        self.base_rate = sum(successes) / len(successes)
+
+        self.success_weights = _fit(rows, successes, len(names), _sigmoid, self.l2, self.lr, self.epochs)
+        # Squared loss has no sigmoid damping: scale the step by the row
+        # length to keep it stable, and start from the mean so it converges
+        widest = max(len(r) for r in rows)
+        self.iteration_weights = _fit(
+            rows, iterations, len(names), lambda z: z, self.l2, self.lr / widest, self.epochs,
+            bias=sum(iterations) / len(iterations),
+        )
+        return self
+
+    def _row(self, text):
+        return [self.index[f] for f in extract_features(text) if f in self.index]
+
+    def predict(self, text):
+        """Return (p_success, expected_iterations) for a candidate's text."""
+        if not self.examples:
+            return 0.5, 1.0
+        row = self._row(text)
+        p = _sigmoid(sum(self.success_weights[j] for j in row))
+        iterations = sum(self.iteration_weights[j] for j in row)
+        return p, iterations
+
+    def top_features(self, n=10):
+        """Strongest success features, as (feature, weight), for inspection."""
+        ranked = sorted(
+            ((k, self.success_weights[i]) for k, i in self.index.items() if i),
+            key=lambda kv: -abs(kv[1]),
+        )
+        return [(k, round(w, 3)) for k, w in ranked[:n]]
+
+
+def evaluate(examples, folds=5, **model_kwargs):
+    """k-fold cross-validated Brier score of P(success) vs. the base rate.
+
+    Returns {"brier", "baseline_brier", "examples"}; lower is better.
+    """
+    examples = list(examples)
+    if len(examples) < folds:
+        return {"brier": None, "baseline_brier": None, "examples": len(examples)}
+    sq_err = base_err = 0.0
+    for fold in range(folds):
+        train = [e for i, e in enumerate(examples) if i % folds != fold]
+        test = [e for i, e in enumerate(examples) if i % folds == fold]
+        model = VerifiabilityModel(**model_kwargs).fit(train)
+        for text, ok, _ in test:
+            y = 1.0 if ok else 0.0
+            sq_err += (model.predict(text)[0] - y) ** 2
+            base_err += (model.base_rate - y) ** 2
+    return {
+        "brier": round(sq_err / len(examples), 4),
+        "baseline_brier": round(base_err / len(examples), 4),
+        "examples": len(examples),
+    }
@@ -0,0 +1,134 @@
+"""
+Local calendar of events that recur every year.
+
+National days, international observances, festivals, season-bound sports
+events and notable birthdays fall on the same dates year after year, so
+discovery looks them up here instead of spending live searches (and prompt
+space) on them.  Live searches are kept for genuinely current news.
+
+The dataset (recurring_events.json) is a list of events, each with a
+"name", a "kind" and one date rule:
+
+    "date": "03-14"                                 fixed month-day
+    "start": "06-29", "end": "07-12"                span of days (may wrap the year)
+    "month": 11, "weekday": 3, "nth": 4             nth weekday of a month
+                                                    (weekday 0 = Monday, nth -1 = last)
+    "easter": -47                                   days from Western Easter Sunday
+    "dates": {"2026": "02-17", "2027": "06-28..07-11"}
+                                                    per-year dates (lunar holidays,
+                                                    sports events that move)
+
+Floating and Easter-based dates are resolved per year; the resulting
+month-day index makes a lookup a dictionary access.  Per-year "dates" have
+to be added by hand as years go by: undated(year) lists the events that have
+none for a year, and `generate_question.py validate` warns about them for the
+current and the next year.
+
+Usage:
+    calendar = RecurringCalendar.load(path)
+    for day, event in calendar.upcoming(date.today(), days=7):
+        ...
+"""
+
+import json
+from datetime import date, timedelta
+
+
+def easter(year):
+    """Western (Gregorian) Easter Sunday, by the anonymous Gregorian algorithm."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nth_weekday(year, month, weekday, nth):
+    """The nth (1-based; -1 = last) given weekday of a month."""
+    if nth > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (nth - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-nth - 1))
+
+
+def _month_day(text, year):
+    month, day = (int(part) for part in text.split("-"))
+    if (month, day) == (2, 29) and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        day = 28
+    return date(year, month, day)
+
+
+def _span(start, end):
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+def occurrences(event, year):
+    """The dates an event falls on in a year."""
+    if "date" in event:
+        return [_month_day(event["date"], year)]
+    if "start" in event:
+        start, end = _month_day(event["start"], year), _month_day(event["end"], year)
+        if end < start:  # wraps the new year: its tail at the start of this year, its head at the end
+            return _span(date(year, 1, 1), end) + _span(start, date(year, 12, 31))
+        return _span(start, end)
+    if "dates" in event:
+        spec = event["dates"].get(str(year))
+        if not spec:
+            return []
+        first, _, last = spec.partition("..")
+        return _span(_month_day(first, year), _month_day(last or first, year))
+    if "easter" in event:
+        return [easter(year) + timedelta(days=event["easter"])]
+    return [nth_weekday(year, event["month"], event["weekday"], event["nth"])]
+
+
+class RecurringCalendar:
+    """Recurring events indexed by date, one year at a time on first use."""
+
+    def __init__(self, events):
+        self.events = events
+        self._years = {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _index(self, year):
+        if year not in self._years:
+            index = {}
+            for event in self.events:
+                for day in occurrences(event, year):
+                    index.setdefault(day, []).append(event)
+            self._years[year] = index
+        return self._years[year]
+
+    def undated(self, year):
+        """Events with per-year "dates" but no entry for year."""
+        return [event for event in self.events if "dates" in event and str(year) not in event["dates"]]
+
+    def on(self, day):
+        """Events falling on day."""
+        return self._index(day.year).get(day, [])
+
+    def upcoming(self, start, days=7):
+        """(day, event) pairs for the days start .. start + days - 1.
+
+        A multi-day event is listed once, on its first day in the window.
+        """
+        seen = set()
+        found = []
+        for n in range(days):
+            day = start + timedelta(days=n)
+            for event in self.on(day):
+                if event["name"] not in seen:
+                    seen.add(event["name"])
+                    found.append((day, event))
+        return found
@@ -0,0 +1,152 @@
+"""
+Search backends for verification: a local full-text corpus in front of Tavily.
+
+LocalCorpus is a SQLite FTS5 index of every source the pipeline has been
+shown (title, URL, content snippet), ranked with BM25.  TieredSearch puts it
+in front of a remote client with the same search(query, max_results)
+interface as TavilyClient: the corpus answers when its recall looks
+sufficient, otherwise the remote is called and its results are indexed so
+the next query on the same facts is served locally.
+
+Evergreen verification queries (rivers, mountains, World Cup titles) then
+take milliseconds, and the pipeline can verify fully offline when no remote
+is configured.
+
+Usage:
+    corpus = LocalCorpus(path)
+    search = TieredSearch(corpus, TavilyClient(api_key=...))
+    search.search(query="longest rivers in the world", max_results=5)
+"""
+
+import re
+import sqlite3
+import threading
+import time
+
+from breaker import CircuitOpenError
+
+QUERY_TERM_RE = re.compile(r"[^\W_]+", re.UNICODE)
+# Words that carry no recall signal in ranking questions
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "is", "of",
+    "on", "or", "the", "to", "which", "what", "who", "with", "top", "rank", "most",
+}
+
+
+def query_terms(query):
+    """Distinct lowercase content words of a query, in order."""
+    seen = []
+    for term in QUERY_TERM_RE.findall(query.lower()):
+        if term not in STOPWORDS and len(term) > 1 and term not in seen:
+            seen.append(term)
+    return seen
+
+
+class LocalCorpus:
+    """SQLite FTS5 index of source documents, one row per URL.
+
+    Args:
+        path:         database file (":memory:" for a throwaway index)
+        max_age_days: documents indexed longer ago than this are ignored by
+                      search(), so stale rankings age out
+    """
+
+    def __init__(self, path, max_age_days=None):
+        self.path = str(path)
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS sources USING fts5("
+            "title, content, url UNINDEXED, added_at UNINDEXED, tokenize='porter unicode61')"
+        )
+
+    def add(self, results):
+        """Index Tavily-style result dicts, replacing earlier copies of a URL.
+
+        Returns the number of documents written.
+        """
+        now = time.time()
+        rows = [
+            (r.get("title", ""), r.get("content", ""), r["url"], now)
+            for r in results
+            if r.get("url") and (r.get("content") or r.get("title"))
+        ]
+        with self._lock, self._db:
+            for _, _, url, _ in rows:
+                self._db.execute("DELETE FROM sources WHERE url = ?", (url,))
+            self._db.executemany(
+                "INSERT INTO sources (title, content, url, added_at) VALUES (?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def search(self, query, max_results=5):
+        """BM25-ranked matches for any query term.
+
+        Returns:
+            (results, coverage): Tavily-style result dicts (best first, with a
+            "score" where higher is better) and the fraction of the query's
+            terms found in the best result.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return [], 0.0
+        match = " OR ".join('"' + t.replace('"', '""') + '"' for t in terms)
+        sql = (
+            "SELECT title, content, url, bm25(sources, 2.0, 1.0) AS rank FROM sources "
+            "WHERE sources MATCH ?"
+        )
+        params = [match]
+        if self.max_age_days is not None:
+            sql += " AND added_at >= ?"
+            params.append(time.time() - self.max_age_days * 86400)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(max_results)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+
+        results = [
+            {"title": title, "content": content, "url": url, "score": round(-rank, 3)}
+            for title, content, url, rank in rows
+        ]
+        if not results:
+            return [], 0.0
+        best = f"{results[0]['title']} {results[0]['content']}".lower()
+        covered = sum(1 for t in terms if t in best)
+        return results, covered / len(terms)
+
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM sources").fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+
+class TieredSearch:
+    """search() on the local corpus first, the remote client only on low recall.
+
+    Local results are used when at least min_results documents match and the
+    best one covers min_coverage of the query's terms.  Every remote result
+    is indexed.  Responses carry "backend": "local" or "remote".  While the
+    remote's circuit breaker is open, whatever the corpus has is returned
+    (marked "degraded") instead of failing.
+    """
+
+    def __init__(self, corpus, remote=None, min_results=3, min_coverage=0.6):
+        self.corpus = corpus
+        self.remote = remote
+        self.min_results = min_results
+        self.min_coverage = min_coverage
+
+    def search(self, query, max_results=5, **kwargs):
+        results, coverage = self.corpus.search(query, max_results=max_results)
+        if self.remote is None or (len(results) >= self.min_results and coverage >= self.min_coverage):
+            return {"results": results, "backend": "local", "coverage": round(coverage, 2)}
+
+        try:
+            response = self.remote.search(query=query, max_results=max_results, **kwargs)
+        except CircuitOpenError:
+            return {"results": results, "backend": "local", "coverage": round(coverage, 2), "degraded": True}
+        self.corpus.add(response.get("results", []))
+        return {**response, "backend": "remote"}
@@ -0,0 +1,137 @@
+"""
+Locked, atomic read-modify-write for the pipeline's JSON files.
+
+Generation jobs can overlap: the daily cron and a manual dispatch, or
+backfills for several dates run side by side.  Each job plans from the
+snapshot it loaded at start-up; when it commits, JsonStore.transaction()
+takes an exclusive lock on the file, re-reads the current contents and
+hands them to the job to apply its change on top (append its question with
+a freshly assigned id, append its run to the log...).  The result replaces
+the file atomically, so nothing a concurrent job wrote meanwhile is lost and
+plain readers never see a half-written file.
+
+Usage:
+    store = JsonStore(path, default=lambda: {"runs": []})
+    with store.transaction() as log:
+        log["runs"].append(run_log)
+    if store.merged:
+        ...  # another writer changed the file since this process read it
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _try_lock(fd):
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class JsonStore:
+    """One JSON file with locked transactions and atomic replacement.
+
+    Args:
+        path:         the JSON file
+        default:      callable returning the contents of a missing file
+        lock_timeout: seconds to wait for another writer before TimeoutError
+        indent:       json.dump indent used when writing
+        dumps:        optional callable(data) -> text used instead of json.dump
+    """
+
+    def __init__(self, path, default, lock_timeout=60, indent=4, dumps=None):
+        self.path = path
+        self.default = default
+        self.lock_timeout = lock_timeout
+        self.indent = indent
+        self.dumps = dumps
+        self.lock_path = path.with_name(path.name + ".lock")
+        self.seen = None       # file version this process last read or wrote
+        self.merged = False    # whether the last transaction found someone else's writes
+        self.merges = 0
+
+    def _version(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _load(self):
+        version = self._version()
+        if version is None:
+            return self.default(), None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f), version
+
+    def read(self):
+        """The current contents (no lock needed: writes are atomic)."""
+        data, self.seen = self._load()
+        return data
+
+    @contextmanager
+    def lock(self):
+        """Hold the file's exclusive writer lock (a sidecar .lock file)."""
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            deadline = time.monotonic() + self.lock_timeout
+            while not _try_lock(fd):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{self.path.name} is locked by another writer")
+                time.sleep(0.05)
+            try:
+                yield
+            finally:
+                _unlock(fd)
+        finally:
+            os.close(fd)
+
+    def serialize(self, data):
+        """data as the text _write() puts on disk."""
+        if self.dumps:
+            return self.dumps(data)
+        return json.dumps(data, indent=self.indent, ensure_ascii=False)
+
+    def _write(self, data):
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.serialize(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    @contextmanager
+    def transaction(self):
+        """Yield the freshly re-read contents under the lock; write them back
+        on a clean exit if they changed."""
+        with self.lock():
+            data, version = self._load()
+            self.merged = self.seen is not None and version != self.seen
+            self.merges += self.merged
+            before = json.dumps(data, sort_keys=True)
+            yield data
+            if json.dumps(data, sort_keys=True) != before:
+                self._write(data)
+            self.seen = self._version()
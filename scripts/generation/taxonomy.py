@@ -0,0 +1,281 @@
+"""
+Rule-based taxonomy tags for questions and candidate topics.
+
+Topic diversity used to be judged by the LLM alone, rereading question text
+every time.  A small lexicon tags a text with categories (football, cinema,
+geography...) and entities (Champions League, Grammy Awards...), so most
+diversity checks become set lookups:
+
+    - sharing an entity (the same competition, award, franchise) means the
+      same subject
+    - sharing no category means different subjects
+    - sharing only a category (Winter vs Summer Olympics, Grammys vs
+      Billboard), or an untagged text, is ambiguous: that is left to the LLM
+
+Short, many-sense keywords (WEAK_KEYWORDS: "art", "car", "king", "sea"...)
+still tag a text, but a category resting on a single one of them is listed
+under "weak" and does not count as knowing the text's subject: such a text
+is treated as untagged, so a misread word never settles a check.
+
+Keywords match whole words, case- and accent-insensitively, with an
+optional plural "s"/"es".  Where aliases overlap the longest one wins
+("rugby world cup" before "world cup").
+
+Usage:
+    tags = tag_text("Top 5 clubs by Champions League titles")
+    # {"categories": ["football"], "entities": ["Champions League"]}
+    tag_text("Largest king penguin colonies")
+    # {"categories": ["history"], "entities": [], "weak": ["history"]}
+    verdict, matches = coverage(tags, [q["tags"] for q in recent])
+"""
+
+import re
+import unicodedata
+
+CATEGORIES = {
+    "football": ["football", "soccer", "footballer", "fifa", "uefa", "goalscorer", "striker", "goalkeeper"],
+    "american_football": ["american football", "quarterback", "touchdown"],
+    "basketball": ["basketball"],
+    "baseball": ["baseball", "home run"],
+    "hockey": ["hockey", "ice hockey"],
+    "tennis": ["tennis", "atp", "wta", "singles title"],
+    "golf": ["golf", "golfer", "pga"],
+    "cricket": ["cricket", "cricketer", "wicket", "test match"],
+    "rugby": ["rugby"],
+    "motorsport": ["motorsport", "grand prix", "racing driver", "driver championship"],
+    "cycling": ["cycling", "cyclist"],
+    "athletics": ["athletics", "marathon", "sprinter", "track and field", "pole vault", "pole vaulter",
+                  "high jump", "long jump", "decathlon"],
+    "olympics": ["olympic", "olympics", "olympian"],
+    "winter_sports": ["ski", "skiing", "skier", "snowboard", "snowboarding", "figure skating", "biathlon",
+                      "curling", "bobsleigh", "ski jumping", "speed skating"],
+    "combat_sports": ["boxing", "boxer", "mma", "heavyweight"],
+    "swimming": ["swimming", "swimmer"],
+    "horse_racing": ["horse racing", "racehorse", "jockey"],
+    "cinema": ["film", "movie", "box office", "actor", "actress", "cinema", "hollywood", "bollywood",
+               "blockbuster", "animated film"],
+    "television": ["television", "tv", "sitcom", "tv series", "tv show", "episode", "viewership", "nielsen"],
+    "music": ["music", "album", "song", "singer", "rapper", "musician", "concert", "band", "hit single",
+              "number one single", "no. 1 single", "official charts"],
+    "video_games": ["video game", "videogame", "gaming", "console", "esports", "nintendo", "playstation"],
+    "literature": ["book", "novel", "novelist", "author", "bestseller", "best-selling book", "poet", "poetry",
+                   "literature", "manga", "comic", "translation"],
+    "art": ["painting", "painter", "museum", "art", "artwork", "sculpture", "gallery", "galleries"],
+    "food_drink": ["food", "dish", "dishes", "cuisine", "coffee", "tea", "beer", "wine", "chocolate", "cheese",
+                   "restaurant", "pasta", "pizza", "spice", "fruit", "vegetable", "rice", "drink", "beverage",
+                   "meat", "crop", "fao", "agricultural", "harvest"],
+    "holidays_festivals": ["christmas", "halloween", "valentine", "valentine's", "easter", "carnival", "new year",
+                           "thanksgiving", "diwali", "lunar new year", "holiday", "festival", "st. patrick's day",
+                           "st patrick's day"],
+    "language": ["language", "spoken", "speakers", "alphabet", "dictionary"],
+    "geography": ["geography", "land area", "by area", "city", "cities", "capital", "mountain", "river", "lake",
+                  "island", "desert", "ocean", "sea", "volcano", "volcanoes", "waterfall", "continent",
+                  "coastline", "glacier", "national park", "forest", "rainforest", "time zone", "province",
+                  "u.s. states", "us states"],
+    "demographics": ["population", "populous", "populated", "ancestry", "residents", "census", "immigrant",
+                     "diaspora", "life expectancy"],
+    "weather": ["weather", "sunshine", "sunniest", "rainfall", "wettest", "driest", "temperature", "snowfall",
+                "climate", "hottest", "coldest"],
+    "energy": ["energy", "electricity", "renewable", "solar power", "wind power", "nuclear power", "oil",
+               "natural gas", "coal"],
+    "travel": ["tourist", "tourism", "tourist destination", "travel", "hotel", "visited"],
+    "transport": ["airport", "airline", "railway", "train", "high-speed rail", "metro system", "subway", "car",
+                  "automaker", "car manufacturer", "electric vehicle", "ship", "cruise"],
+    "architecture": ["building", "skyscraper", "tower", "bridge", "stadium", "venue", "cathedral", "castle",
+                     "palace", "architecture", "convention center", "convention centre", "exhibit space"],
+    "space": ["space", "planet", "moon", "astronaut", "cosmonaut", "rocket", "satellite", "galaxy", "galaxies",
+              "solar system", "asteroid", "spaceflight", "telescope", "spacecraft", "space probe", "night sky",
+              "brightest star", "apparent magnitude", "human-made object"],
+    "science": ["science", "scientist", "element", "chemical", "physics", "chemistry", "biology",
+                "periodic table", "invention", "inventor"],
+    "nature": ["animal", "species", "bird", "mammal", "fish", "shark", "dinosaur", "tree", "plant", "flower",
+               "wildlife", "elephant", "lion", "tiger", "dog breed", "breed", "endangered", "zoo", "insect",
+               "reptile", "whale", "bee"],
+    "health": ["health", "disease", "calorie", "vaccine", "obesity"],
+    "technology": ["technology", "tech", "smartphone", "app", "internet", "website", "social media", "software",
+                   "ai", "artificial intelligence", "computer", "chip", "semiconductor", "programming language",
+                   "robot", "similarweb"],
+    "business": ["company", "companies", "brand", "revenue", "market cap", "market capitalization",
+                 "market value", "billionaire", "richest", "gdp", "economy", "economies", "export", "import",
+                 "stock", "retailer", "sales", "profit", "bank", "luxury", "trade", "startup", "unicorn",
+                 "currency", "currencies", "foreign-exchange", "imf"],
+    "history": ["history", "historic", "historical", "ancient", "empire", "dynasty", "dynasties", "king", "queen",
+                "monarch", "pope", "medieval", "pharaoh", "prime minister", "reign", "longest-reigning",
+                "archaeological"],
+}
+
+# Keywords too short or with too many senses to identify a subject alone
+# ("state of the art", "king penguin", "sea level", "a band of brothers")
+WEAK_KEYWORDS = {
+    "art", "car", "app", "ai", "tv", "tea", "band", "space", "king", "queen", "oil", "sea",
+    "moon", "ship", "tower", "bridge", "stock", "trade", "brand", "bank", "chip", "element",
+    "plant", "tree", "fish", "bee", "lion", "tiger", "capital", "console", "comic", "drink",
+    "venue", "cruise", "train", "tech", "crop", "rice", "meat", "spice", "fruit", "dish",
+    "spoken", "visited", "historic",
+}
+
+# name: (category, aliases).  A shared entity settles a coverage check without
+# an LLM, so aliases must name the entity alone: "apple inc", not "apple"
+ENTITIES = {
+    "Champions League": ("football", ["champions league", "european cup", "ucl"]),
+    "FIFA World Cup": ("football", ["fifa world cup", "world cup"]),
+    "Premier League": ("football", ["premier league", "epl"]),
+    "La Liga": ("football", ["la liga"]),
+    "Serie A": ("football", ["serie a"]),
+    "Bundesliga": ("football", ["bundesliga"]),
+    "Ballon d'Or": ("football", ["ballon d'or"]),
+    "UEFA European Championship": ("football", ["european championship", "the euros", "euro 2024", "euro 2028"]),
+    "Copa America": ("football", ["copa america"]),
+    "Africa Cup of Nations": ("football", ["africa cup of nations", "afcon"]),
+    "Europa League": ("football", ["europa league"]),
+    "Super Bowl": ("american_football", ["super bowl"]),
+    "NFL": ("american_football", ["nfl"]),
+    "NBA": ("basketball", ["nba"]),
+    "NCAA Tournament": ("basketball", ["march madness", "ncaa tournament", "ncaa men's basketball tournament"]),
+    "MLB": ("baseball", ["mlb", "major league baseball"]),
+    "World Series": ("baseball", ["world series"]),
+    "NHL": ("hockey", ["nhl"]),
+    "Stanley Cup": ("hockey", ["stanley cup"]),
+    "Hockey World Cup": ("hockey", ["hockey world cup"]),
+    "Wimbledon": ("tennis", ["wimbledon"]),
+    "Australian Open": ("tennis", ["australian open"]),
+    "French Open": ("tennis", ["french open", "roland garros", "roland-garros"]),
+    "Davis Cup": ("tennis", ["davis cup"]),
+    "Indian Wells": ("tennis", ["indian wells", "bnp paribas open"]),
+    "Miami Open": ("tennis", ["miami open"]),
+    "The Masters": ("golf", ["masters tournament", "the masters golf", "green jacket", "augusta national"]),
+    "Ryder Cup": ("golf", ["ryder cup"]),
+    "LPGA Tour": ("golf", ["lpga"]),
+    "Cricket World Cup": ("cricket", ["cricket world cup"]),
+    "IPL": ("cricket", ["ipl", "indian premier league"]),
+    "The Ashes": ("cricket", ["the ashes", "ashes series"]),
+    "Six Nations": ("rugby", ["six nations", "five nations", "five/six nations"]),
+    "Rugby World Cup": ("rugby", ["rugby world cup"]),
+    "Formula 1": ("motorsport", ["formula 1", "formula one", "f1"]),
+    "24 Hours of Le Mans": ("motorsport", ["le mans"]),
+    "Indianapolis 500": ("motorsport", ["indianapolis 500", "indy 500"]),
+    "NASCAR": ("motorsport", ["nascar", "daytona 500"]),
+    "MotoGP": ("motorsport", ["motogp"]),
+    "Tour de France": ("cycling", ["tour de france"]),
+    "Giro d'Italia": ("cycling", ["giro d'italia"]),
+    "Vuelta a Espana": ("cycling", ["vuelta a espana", "la vuelta"]),
+    "World Marathon Majors": ("athletics", ["world marathon majors"]),
+    "Winter Olympics": ("olympics", ["winter olympics", "winter olympic", "winter games"]),
+    "Summer Olympics": ("olympics", ["summer olympics", "summer olympic", "summer games"]),
+    "Paralympics": ("olympics", ["paralympics", "paralympic"]),
+    "Alpine Ski World Cup": ("winter_sports", ["ski world cup", "skiing world cup"]),
+    "UFC": ("combat_sports", ["ufc"]),
+    "Kentucky Derby": ("horse_racing", ["kentucky derby"]),
+    "Grand National": ("horse_racing", ["grand national"]),
+    "Academy Awards": ("cinema", ["oscar", "academy award"]),
+    "Golden Globes": ("cinema", ["golden globe"]),
+    "Cannes Film Festival": ("cinema", ["cannes film festival", "cannes festival", "palme d'or"]),
+    "BAFTA": ("cinema", ["bafta"]),
+    "Marvel Cinematic Universe": ("cinema", ["marvel", "mcu"]),
+    "Star Wars": ("cinema", ["star wars"]),
+    "James Bond": ("cinema", ["james bond", "007", "bond film"]),
+    "Emmy Awards": ("television", ["emmy", "emmys"]),
+    "Netflix": ("television", ["netflix"]),
+    "Grammy Awards": ("music", ["grammy", "grammys", "grammy award"]),
+    "Eurovision": ("music", ["eurovision"]),
+    "Billboard charts": ("music", ["billboard", "hot 100", "billboard 200"]),
+    "Spotify": ("music", ["spotify"]),
+    "Coachella": ("music", ["coachella"]),
+    "Harry Potter": ("literature", ["harry potter"]),
+    "Booker Prize": ("literature", ["booker prize"]),
+    "Michelin Guide": ("food_drink", ["michelin"]),
+    "UNESCO World Heritage": ("travel", ["world heritage"]),
+    "NASA": ("space", ["nasa"]),
+    "International Space Station": ("space", ["international space station"]),
+    "Apollo program": ("space", ["apollo program", "apollo mission", "apollo 11", "apollo moon landing"]),
+    "Nobel Prize": ("science", ["nobel", "nobel prize"]),
+    "YouTube": ("technology", ["youtube"]),
+    "Apple": ("technology", ["apple inc", "iphone", "ipad", "macbook"]),
+    "Google": ("technology", ["google"]),
+    "TIOBE Index": ("technology", ["tiobe"]),
+    "Fortune 500": ("business", ["fortune 500", "fortune global 500"]),
+    "Forbes": ("business", ["forbes"]),
+}
+
+
+def _normalize(text):
+    text = str(text).replace("\u2019", "'")
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def _build_lexicon():
+    labels = {}
+    for category, keywords in CATEGORIES.items():
+        for keyword in keywords:
+            labels.setdefault(_normalize(keyword), (category, None))
+    for entity, (category, aliases) in ENTITIES.items():
+        for alias in aliases:
+            labels[_normalize(alias)] = (category, entity)   # an entity alias wins over a keyword
+    alternation = "|".join(re.escape(k) for k in sorted(labels, key=len, reverse=True))
+    return labels, re.compile(rf"(?<![\w'])(?:{alternation})(?:e?s)?(?![\w'])")
+
+
+LABELS, LEXICON_RE = _build_lexicon()
+
+
+def tag_text(text):
+    """{"categories": [...], "entities": [...]} for text (sorted, possibly
+    empty), plus "weak": [...] if some categories rest on a single weak
+    keyword."""
+    evidence, entities = {}, set()
+    for match in LEXICON_RE.finditer(_normalize(text)):
+        word = match.group(0)
+        key = next((k for k in (word, word[:-1], word[:-2]) if k in LABELS), None)
+        if key is None:
+            continue
+        category, entity = LABELS[key]
+        evidence.setdefault(category, set()).add(key if entity is None and key in WEAK_KEYWORDS else None)
+        if entity:
+            entities.add(entity)
+    tags = {"categories": sorted(evidence), "entities": sorted(entities)}
+    weak = sorted(c for c, keys in evidence.items() if len(keys) == 1 and None not in keys)
+    if weak:
+        tags["weak"] = weak
+    return tags
+
+
+def confident_categories(tags):
+    """The categories of tags that do not rest on a single weak keyword."""
+    weak = set(tags.get("weak", []))
+    return [c for c in tags.get("categories", []) if c not in weak]
+
+
+def overlap(tags, other):
+    """(shared entities, shared categories) of two tag dicts."""
+    return (
+        sorted(set(tags.get("entities", [])) & set(other.get("entities", []))),
+        sorted(set(tags.get("categories", [])) & set(other.get("categories", []))),
+    )
+
+
+def coverage(tags, others):
+    """How a text's tags relate to a list of other texts' tags.
+
+    Returns (verdict, matches), matches being indices into others:
+        "covered"    some share an entity with tags (matches: those)
+        "clear"      tags has confident categories and none of others
+                     shares a category
+        "ambiguous"  the rest: only categories are shared, or one side is
+                     untagged or only weakly tagged (matches: the others an
+                     LLM should compare)
+    """
+    if not confident_categories(tags):
+        same_entity = [i for i, other in enumerate(others) if overlap(tags, other)[0]]
+        if same_entity:
+            return "covered", same_entity
+        return "ambiguous", list(range(len(others)))
+    same_entity, related = [], []
+    for i, other in enumerate(others):
+        entities, categories = overlap(tags, other)
+        if entities:
+            same_entity.append(i)
+        elif categories or not confident_categories(other):
+            related.append(i)
+    if same_entity:
+        return "covered", same_entity
+    return ("ambiguous", related) if related else ("clear", [])
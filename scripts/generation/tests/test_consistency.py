@@ -0,0 +1,62 @@
+"""Tests for the local consistency check on corrected answer values (consistency.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consistency import check_consistency, numbers_near, parse_numbers  # noqa: E402
+
+ANSWERS = ["Nile", "Amazon", "Yangtze", "Mississippi", "Yenisei"]
+TABLE = [{"content": (
+    "Longest rivers in the world\n"
+    "1 | Nile | 6,650 | 2005\n"
+    "2 | Amazon | 6,400 | 2007\n"
+    "3 | Yangtze | 6,300 | 2010\n"
+    "4 | Mississippi | 6,275 | 2011\n"
+    "5 | Yenisei | 5,539 | 1999"
+)}]
+
+
+class ParseTest(unittest.TestCase):
+    def test_unit_words_allow_both_readings(self):
+        self.assertEqual(parse_numbers("revenue of 6.4 billion"), [[6.4e9, 6.4]])
+        self.assertEqual(parse_numbers("12,500 fans"), [[12500.0]])
+
+    def test_years_are_skipped(self):
+        self.assertEqual(parse_numbers("in 2024 it ran 1,900 km"), [[1900.0]])
+
+    def test_rank_and_name_cells_are_skipped(self):
+        self.assertEqual(numbers_near("Amazon", TABLE), [[6400.0]])
+
+
+class CheckConsistencyTest(unittest.TestCase):
+    def test_values_backed_by_the_table(self):
+        report = check_consistency("Longest rivers?", ANSWERS, [6650, 6400, 6300, 6275, 5539], TABLE)
+        self.assertTrue(report["consistent"])
+        self.assertEqual(report["backed"], [True] * 5)
+
+    def test_rank_column_does_not_back_scaled_values(self):
+        report = check_consistency("Longest rivers?", ANSWERS, [5000, 4000, 3000, 2000, 1000], TABLE)
+        self.assertEqual(report["backed"], [False] * 5)
+        self.assertFalse(report["consistent"])
+
+    def test_year_column_does_not_back_values(self):
+        report = check_consistency("Longest rivers?", ANSWERS, [2011, 2010, 2007, 2005, 1999], TABLE)
+        self.assertFalse(any(report["backed"]))
+
+    def test_bare_numbers_are_not_rescaled(self):
+        sources = [{"content": "Nile 6.65 thousand km. Amazon 6.4. Yangtze 6.3. Mississippi 6.275. Yenisei 5.539."}]
+        report = check_consistency("Longest rivers?", ANSWERS, [6650, 6400, 6300, 6275, 5539], sources)
+        self.assertEqual(report["backed"], [True, False, False, False, False])
+
+    def test_order_violation_is_disputed(self):
+        report = check_consistency("Longest rivers?", ANSWERS, [6650, 6300, 6400, 6275, 5539], TABLE)
+        self.assertEqual(report["order_violations"], [["Amazon", "Yangtze"]])
+        self.assertEqual(report["disputed"], ["Amazon", "Yangtze"])
+        self.assertFalse(report["consistent"])
+
+
+if __name__ == "__main__":
+    unittest.main()
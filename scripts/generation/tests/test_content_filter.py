@@ -0,0 +1,62 @@
+"""Tests for the compiled topic filter (content_filter.py + generate_question's rules)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from content_filter import ContentFilter  # noqa: E402
+from generate_question import ALLOWED_TOPIC_PHRASES, BLOCKED_TOPICS  # noqa: E402
+
+FILTER = ContentFilter(BLOCKED_TOPICS, ALLOWED_TOPIC_PHRASES)
+
+
+class BlockedTest(unittest.TestCase):
+    def test_inflected_forms_are_blocked(self):
+        for text in [
+            "Most murdered journalists by country",
+            "Famous murderers of the 19th century",
+            "Countries where children are abused",
+            "Most assaulted public figures",
+            "Women raped in wartime",
+            "Deadliest school shootings",
+            "Largest terrorist attacks",
+        ]:
+            with self.subTest(text=text):
+                self.assertIsNotNone(FILTER.check(text))
+
+    def test_race_as_ethnicity_is_blocked(self):
+        for text in ["US population by race", "Racial makeup of cities", "Racist laws by country"]:
+            with self.subTest(text=text):
+                self.assertIsNotNone(FILTER.check(text))
+
+    def test_scan_reports_rule_and_match(self):
+        self.assertEqual(FILTER.scan("A murderer on trial"), [{"rule": "murderer", "match": "murderer"}])
+
+
+class AllowedTest(unittest.TestCase):
+    def test_racing_topics_pass(self):
+        for text in [
+            "Most F1 races won by a driver",
+            "Tour de France stage races",
+            "Marathon race times",
+            "Most Formula One race wins",
+            "Racing drivers with the most titles",
+            "Horse races with the largest purse",
+            "The space race",
+        ]:
+            with self.subTest(text=text):
+                self.assertIsNone(FILTER.check(text))
+
+    def test_whole_words_only(self):
+        for text in ["Largest grape producers", "Most embraced trends", "Countries by grace period"]:
+            with self.subTest(text=text):
+                self.assertIsNone(FILTER.check(text))
+
+    def test_allowlist_only_covers_its_own_span(self):
+        self.assertIsNotNone(FILTER.check("Stage races and racial profiling"))
+
+
+if __name__ == "__main__":
+    unittest.main()
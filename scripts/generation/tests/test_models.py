@@ -0,0 +1,86 @@
+"""Tests for the slotted record models and their file layout (models.py)."""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import UNSET, Attempt, Question, Run, dumps_records  # noqa: E402
+
+LOGGED_ATTEMPT = {
+    "topic": "Rivers",
+    "status": "success",
+    "verify_iterations": 2,
+    "verification_search_iter0": {"query": "longest rivers"},
+    "cross_check_iter0": {"status": "CORRECTED"},
+    "verify_iter0_result": "corrected",
+    "cross_check_iter1": {"status": "VERIFIED"},
+}
+
+
+class RecordAccessTest(unittest.TestCase):
+    def test_known_keys_fill_slots(self):
+        attempt = Attempt(topic="Rivers")
+        attempt["status"] = "success"
+        attempt.iteration(1).cross_check = {"status": "VERIFIED"}
+        self.assertEqual(attempt.status, "success")
+        self.assertIs(attempt.iteration(1), attempt.iterations[0])
+        self.assertEqual(attempt.to_dict()["cross_check_iter1"], {"status": "VERIFIED"})
+        self.assertEqual(attempt.unknown_fields(), [])
+
+    def test_flat_iteration_keys_are_drift_outside_the_loader(self):
+        attempt = Attempt()
+        attempt["cross_check_iter1"] = {"status": "VERIFIED"}
+        self.assertEqual(attempt.iterations, [])
+        self.assertEqual(attempt.unknown_fields(), ["cross_check_iter1"])
+
+    def test_unset_and_unknown_keys(self):
+        attempt = Attempt()
+        self.assertNotIn("question_id", attempt)
+        self.assertNotIn("cross_check_iter3", attempt)
+        self.assertEqual(attempt.get("question_id", 7), 7)
+        attempt["new_step"] = 1
+        self.assertEqual(attempt.unknown_fields(), ["new_step"])
+
+    def test_setdefault_and_pop(self):
+        run = Run(date="2026-10-19")
+        ranking = run.setdefault("step1c_topic_ranking", {"ranked": []})
+        self.assertIs(run.step1c_topic_ranking, ranking)
+        run["question_id"] = 12
+        self.assertEqual(run.pop("question_id"), 12)
+        self.assertIs(run.question_id, UNSET)
+        self.assertIsNone(run.pop("question_id", None))
+        with self.assertRaises(KeyError):
+            run.pop("question_id")
+
+    def test_question_unpacks_like_a_dict(self):
+        question = Question(id=1, date="2026-10-19", question="q", options=[], answers=[])
+        self.assertEqual({**question}["date"], "2026-10-19")
+
+
+class LayoutTest(unittest.TestCase):
+    def test_attempt_round_trips_the_flat_layout(self):
+        attempt = Attempt.from_dict(LOGGED_ATTEMPT)
+        self.assertEqual([it.n for it in attempt.iterations], [0, 1])
+        self.assertEqual(attempt.iteration(0).result, "corrected")
+        self.assertEqual(attempt.unknown_fields(), [])
+        self.assertEqual(attempt.to_dict(), LOGGED_ATTEMPT)
+
+    def test_nested_records_serialize(self):
+        run = Run(date="2026-10-19")
+        run["attempts"].append(Attempt.from_dict(LOGGED_ATTEMPT))
+        run["tracks"] = {"sports": {"result": "failed", "attempts": [Attempt(topic="Golf")]}}
+        data = json.loads(dumps_records({"runs": [run.to_dict()]}, "runs"))
+        self.assertEqual(data["runs"][0]["attempts"][0], LOGGED_ATTEMPT)
+        self.assertEqual(data["runs"][0]["tracks"]["sports"]["attempts"][0]["topic"], "Golf")
+
+    def test_dumps_records_one_record_per_line(self):
+        text = dumps_records({"version": 1, "runs": [{"a": 1}, {"b": 2}]}, "runs")
+        self.assertEqual(text.splitlines()[1:3], ['{"a":1},', '{"b":2}'])
+        self.assertEqual(json.loads(text), {"version": 1, "runs": [{"a": 1}, {"b": 2}]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""Tests for page_fetcher.py against a local http.server stand-in."""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_fetcher import PageFetcher, extract_ranked_region  # noqa: E402
+
+RANKED_PAGE = """<html><head><title>Rivers</title><script>var x = "<table>";</script></head><body>
+<nav><ul><li>Home</li><li>Random article</li></ul></nav>
+<h2>See also</h2><ul><li>Lakes</li><li>Mountains</li></ul>
+<table><caption>Longest rivers in the world</caption>
+<tr><th>Rank</th><th>River</th><th>Length (km)</th></tr>
+<tr><td>1</td><td>Nile</td><td>6,650</td></tr>
+<tr><td>2</td><td>Amazon</td><td>6,400</td></tr>
+<tr><td>3</td><td>Yangtze</td><td>6,300</td></tr>
+<tr><td>4</td><td>Mississippi</td><td>6,275</td></tr>
+<tr><td>5</td><td>Yenisei</td><td>5,539</td></tr>
+</table>
+<h3>Highest waterfalls</h3><ol><li>Angel Falls</li><li>Tugela Falls</li></ol>
+</body></html>"""
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Routes: /etag and /modified revalidate, /slow tracks concurrency,
+    /hang outlasts the client timeout, /error is a 500, /data is JSON."""
+
+    def log_message(self, *args):
+        pass
+
+    def send_page(self, body, content_type="text/html; charset=utf-8", headers=()):
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def not_modified(self):
+        self.server.not_modified += 1
+        self.send_response(304)
+        self.end_headers()
+
+    def do_GET(self):
+        server = self.server
+        server.hits[self.path] = server.hits.get(self.path, 0) + 1
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                return self.not_modified()
+            return self.send_page(RANKED_PAGE, headers=[("ETag", '"v1"')])
+        if self.path == "/modified":
+            stamp = "Mon, 19 Oct 2026 00:00:00 GMT"
+            if self.headers.get("If-Modified-Since") == stamp:
+                return self.not_modified()
+            return self.send_page(RANKED_PAGE, headers=[("Last-Modified", stamp)])
+        if self.path.startswith("/slow"):
+            with server.lock:
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            time.sleep(0.15)
+            with server.lock:
+                server.in_flight -= 1
+            return self.send_page("<p>slow</p>")
+        if self.path == "/hang":
+            time.sleep(1.5)
+            return self.send_page("<p>late</p>")
+        if self.path == "/flaky":
+            if server.hits[self.path] > 1:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            return self.send_page(RANKED_PAGE)
+        if self.path == "/data":
+            return self.send_page('{"rivers": []}', content_type="application/json")
+        self.send_response(500)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class PageFetcherTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits = {}
+        self.server.not_modified = 0
+        self.server.lock = threading.Lock()
+        self.server.in_flight = self.server.max_in_flight = 0
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+
+    def fetcher(self, **kwargs):
+        fetcher = PageFetcher(self.cache_dir, **kwargs)
+        self.addCleanup(fetcher.close)
+        return fetcher
+
+    def test_etag_revalidation_serves_cache_on_304(self):
+        fetcher = self.fetcher()
+        first = fetcher.fetch(f"{self.base}/etag")
+        second = fetcher.fetch(f"{self.base}/etag")
+        self.assertEqual(first, second)
+        self.assertIn("Nile", second)
+        self.assertEqual(self.server.not_modified, 1)
+        self.assertEqual(fetcher.stats, {"fetched": 1, "revalidated": 1, "errors": 0})
+
+    def test_last_modified_revalidation_across_fetchers(self):
+        self.fetcher().fetch(f"{self.base}/modified")
+        fetcher = self.fetcher()
+        self.assertIn("Nile", fetcher.fetch(f"{self.base}/modified"))
+        self.assertEqual(fetcher.stats["revalidated"], 1)
+
+    def test_per_host_cap(self):
+        fetcher = self.fetcher(per_host=2)
+        urls = [f"{self.base}/slow/{i}" for i in range(6)]
+        pages = fetcher.fetch_many(urls, workers=6)
+        self.assertEqual(len(pages), 6)
+        self.assertTrue(all(pages.values()))
+        self.assertEqual(self.server.max_in_flight, 2)
+
+    def test_timeout_counts_as_error(self):
+        fetcher = self.fetcher(timeout=0.3)
+        self.assertIsNone(fetcher.fetch(f"{self.base}/hang"))
+        self.assertEqual(fetcher.stats["errors"], 1)
+
+    def test_error_status_returns_none(self):
+        fetcher = self.fetcher()
+        self.assertIsNone(fetcher.fetch(f"{self.base}/error"))
+        self.assertEqual(fetcher.stats["errors"], 1)
+
+    def test_error_falls_back_to_stale_copy(self):
+        fetcher = self.fetcher()
+        fresh = fetcher.fetch(f"{self.base}/flaky")
+        self.assertEqual(fetcher.fetch(f"{self.base}/flaky"), fresh)
+        self.assertEqual(fetcher.stats["errors"], 1)
+
+    def test_non_html_is_skipped(self):
+        self.assertIsNone(self.fetcher().fetch(f"{self.base}/data"))
+
+    def test_connection_refused(self):
+        fetcher = self.fetcher(timeout=1)
+        self.assertIsNone(fetcher.fetch("http://127.0.0.1:9/nothing"))
+        self.assertEqual(fetcher.stats["errors"], 1)
+
+
+class ExtractRankedRegionTest(unittest.TestCase):
+    def test_picks_the_matching_table(self):
+        region = extract_ranked_region(RANKED_PAGE, "longest rivers in the world by length")
+        lines = region.splitlines()
+        self.assertEqual(lines[0], "Longest rivers in the world")
+        self.assertEqual(lines[2], "1 | Nile | 6,650")
+        self.assertEqual(len(lines), 7)
+        self.assertNotIn("Random article", region)
+
+    def test_list_takes_the_heading_as_caption(self):
+        region = extract_ranked_region(RANKED_PAGE, "highest waterfalls")
+        self.assertEqual(region.splitlines(), ["Highest waterfalls", "Angel Falls", "Tugela Falls"])
+
+    def test_truncates_to_max_chars(self):
+        region = extract_ranked_region(RANKED_PAGE, "longest rivers", max_chars=60)
+        self.assertLessEqual(len(region), 60)
+        self.assertTrue(region.startswith("Longest rivers in the world"))
+
+    def test_no_blocks(self):
+        self.assertEqual(extract_ranked_region("<p>Just prose about rivers.</p>", "rivers"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
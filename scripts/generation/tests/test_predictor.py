@@ -0,0 +1,35 @@
+"""Tests for the offline verifiability predictor's features (predictor.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor import VerifiabilityModel, evaluate, extract_features  # noqa: E402
+
+
+class FeatureTest(unittest.TestCase):
+    def test_stopwords_and_numbers_are_not_unigrams(self):
+        words = [f for f in extract_features("Which are the top 5 longest rivers in 2025?") if f.startswith("word:")]
+        self.assertEqual(words, ["word:longest", "word:river"])
+
+    def test_domain_and_cues(self):
+        features = extract_features("Clubs with the most Champions League titles of all time")
+        self.assertIn("domain:football", features)
+        self.assertIn("cue:all_time", features)
+        self.assertIn("cue:count_of_wins", features)
+
+
+class EvaluateTest(unittest.TestCase):
+    def test_uninformative_text_does_not_beat_the_base_rate(self):
+        examples = [(f"Question number {i}", i % 3 == 0, 1) for i in range(30)]
+        scores = evaluate(examples)
+        self.assertGreaterEqual(scores["brier"], scores["baseline_brier"] - 0.01)
+
+    def test_untrained_model_is_neutral(self):
+        self.assertEqual(VerifiabilityModel().predict("anything"), (0.5, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
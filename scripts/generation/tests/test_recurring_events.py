@@ -0,0 +1,48 @@
+"""Tests for the recurring-events calendar rules and undated-event check (recurring_events.py)."""
+
+import os
+import sys
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recurring_events import RecurringCalendar, easter, nth_weekday, occurrences  # noqa: E402
+
+EVENTS = [
+    {"name": "Pi Day", "kind": "observance", "date": "03-14"},
+    {"name": "Lunar New Year", "kind": "festival", "dates": {"2026": "02-17", "2027": "02-06"}},
+    {"name": "Tour de France", "kind": "sport", "dates": {"2026": "07-04..07-26"}},
+]
+
+
+class DateRuleTest(unittest.TestCase):
+    def test_easter(self):
+        self.assertEqual(easter(2026), date(2026, 4, 5))
+        self.assertEqual(easter(2027), date(2027, 3, 28))
+
+    def test_nth_weekday(self):
+        self.assertEqual(nth_weekday(2026, 11, 3, 4), date(2026, 11, 26))  # Thanksgiving
+        self.assertEqual(nth_weekday(2026, 5, 0, -1), date(2026, 5, 25))  # last Monday of May
+
+    def test_per_year_dates(self):
+        self.assertEqual(occurrences(EVENTS[1], 2027), [date(2027, 2, 6)])
+        self.assertEqual(len(occurrences(EVENTS[2], 2026)), 23)
+        self.assertEqual(occurrences(EVENTS[2], 2027), [])
+
+
+class UndatedTest(unittest.TestCase):
+    def setUp(self):
+        self.calendar = RecurringCalendar(EVENTS)
+
+    def test_lists_events_whose_dates_ran_out(self):
+        self.assertEqual(self.calendar.undated(2026), [])
+        self.assertEqual([e["name"] for e in self.calendar.undated(2027)], ["Tour de France"])
+        self.assertEqual(len(self.calendar.undated(2028)), 2)
+
+    def test_fixed_rules_never_run_out(self):
+        self.assertNotIn(EVENTS[0], self.calendar.undated(2100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Offline tests for the local corpus and the tiered search (search_backend.py)."""
+
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from breaker import CircuitOpenError  # noqa: E402
+from models import Attempt  # noqa: E402
+from search_backend import LocalCorpus, TieredSearch, query_terms  # noqa: E402
+import generate_question  # noqa: E402
+
+RIVERS = [
+    {"title": "List of longest rivers", "url": "https://en.wikipedia.org/wiki/List_of_river_systems_by_length",
+     "content": "Longest rivers in the world: Nile 6650 km, Amazon 6400 km, Yangtze 6300 km."},
+    {"title": "Longest rivers in Africa", "url": "https://example.org/africa-rivers",
+     "content": "The Nile is the longest river in Africa, followed by the Congo and the Niger."},
+    {"title": "World rivers by discharge", "url": "https://example.org/discharge",
+     "content": "The Amazon has the largest discharge of any river in the world."},
+]
+MOUNTAINS = [
+    {"title": "Highest mountains", "url": "https://example.org/mountains",
+     "content": "Everest 8849 m, K2 8611 m, Kangchenjunga 8586 m."},
+]
+
+
+class FakeRemote:
+    """A remote with TavilyClient's search() that records its queries."""
+
+    def __init__(self, results=(), error=None):
+        self.results = list(results)
+        self.error = error
+        self.queries = []
+
+    def search(self, query, max_results=5, **kwargs):
+        self.queries.append(query)
+        if self.error:
+            raise self.error
+        return {"results": self.results[:max_results]}
+
+
+class LocalCorpusTest(unittest.TestCase):
+    def setUp(self):
+        self.corpus = LocalCorpus(":memory:")
+        self.addCleanup(self.corpus.close)
+
+    def test_query_terms_drop_stopwords_and_duplicates(self):
+        self.assertEqual(query_terms("Which are the longest rivers of the world, rivers?"),
+                         ["longest", "rivers", "world"])
+
+    def test_search_ranks_and_reports_coverage(self):
+        self.assertEqual(self.corpus.add(RIVERS + MOUNTAINS), 4)
+        results, coverage = self.corpus.search("longest rivers in the world", max_results=5)
+        self.assertEqual(results[0]["url"], RIVERS[0]["url"])
+        self.assertNotIn(MOUNTAINS[0]["url"], [r["url"] for r in results])
+        self.assertEqual(coverage, 1.0)
+
+    def test_add_replaces_earlier_copy_of_a_url(self):
+        self.corpus.add(RIVERS[:1])
+        self.corpus.add([{**RIVERS[0], "content": "Nile 6650 km, Amazon 6992 km (revised)"}])
+        self.assertEqual(self.corpus.count(), 1)
+        results, _ = self.corpus.search("Amazon revised")
+        self.assertIn("revised", results[0]["content"])
+
+    def test_add_skips_rows_without_url_or_text(self):
+        self.assertEqual(self.corpus.add([{"title": "no url"}, {"url": "https://example.org/empty"}]), 0)
+
+    def test_old_documents_age_out(self):
+        corpus = LocalCorpus(":memory:", max_age_days=180)
+        self.addCleanup(corpus.close)
+        corpus.add(RIVERS)
+        corpus._db.execute("UPDATE sources SET added_at = ?", (time.time() - 181 * 86400,))
+        self.assertEqual(corpus.search("longest rivers"), ([], 0.0))
+
+    def test_no_terms_no_results(self):
+        self.corpus.add(RIVERS)
+        self.assertEqual(self.corpus.search("which of the"), ([], 0.0))
+
+
+class TieredSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.corpus = LocalCorpus(":memory:")
+        self.addCleanup(self.corpus.close)
+
+    def test_served_locally_when_recall_is_sufficient(self):
+        self.corpus.add(RIVERS)
+        remote = FakeRemote(MOUNTAINS)
+        response = TieredSearch(self.corpus, remote).search("longest rivers world")
+        self.assertEqual(response["backend"], "local")
+        self.assertEqual(remote.queries, [])
+
+    def test_remote_on_low_recall_and_results_are_indexed(self):
+        remote = FakeRemote(MOUNTAINS)
+        search = TieredSearch(self.corpus, remote, min_results=1)
+        self.assertEqual(search.search("highest mountains")["backend"], "remote")
+        self.assertEqual(self.corpus.count(), 1)
+        self.assertEqual(search.search("highest mountains")["backend"], "local")
+        self.assertEqual(remote.queries, ["highest mountains"])
+
+    def test_offline_without_remote(self):
+        self.corpus.add(RIVERS[:1])
+        response = TieredSearch(self.corpus).search("longest rivers")
+        self.assertEqual(response["backend"], "local")
+        self.assertEqual(len(response["results"]), 1)
+
+    def test_degraded_while_remote_circuit_is_open(self):
+        self.corpus.add(RIVERS[:1])
+        remote = FakeRemote(error=CircuitOpenError("search", 30))
+        response = TieredSearch(self.corpus, remote).search("longest rivers")
+        self.assertTrue(response["degraded"])
+        self.assertEqual(len(response["results"]), 1)
+
+
+class LiveRoutingTest(unittest.TestCase):
+    def test_live_search_unwraps_the_remote(self):
+        corpus = LocalCorpus(":memory:")
+        self.addCleanup(corpus.close)
+        remote = FakeRemote()
+        self.assertIs(generate_question.live_search(TieredSearch(corpus, remote)), remote)
+        offline = TieredSearch(corpus)
+        self.assertIs(generate_question.live_search(offline), offline)
+
+    def test_time_sensitive_questions(self):
+        today = datetime(2026, 10, 19)
+        for text in ["Current top 5 ATP players", "Most goals this season",
+                     "Highest-grossing films of 2025", "Richest people as of today"]:
+            with self.subTest(text=text):
+                self.assertTrue(generate_question.is_time_sensitive(text, today))
+        for text in ["Longest rivers in the world", "Most World Cup titles", "Tallest buildings built before 1990"]:
+            with self.subTest(text=text):
+                self.assertFalse(generate_question.is_time_sensitive(text, today))
+
+    def test_re_verify_bypasses_the_corpus(self):
+        corpus = LocalCorpus(":memory:")
+        self.addCleanup(corpus.close)
+        corpus.add(RIVERS)
+        remote = FakeRemote(RIVERS[1:])
+        gq = generate_question
+        with mock.patch.object(gq, "tavily_search_with_retries", return_value=({"results": []}, [])) as searched, \
+                mock.patch.object(gq, "verify_llm_create"), \
+                mock.patch.object(gq, "load_llm_json", return_value={"status": "CONFIRMED"}), \
+                mock.patch.object(gq, "fetch_source_pages"):
+            gq.re_verify_correction(
+                None, TieredSearch(corpus, remote), "Longest rivers?",
+                ["Nile", "Amazon", "Yangtze", "Mississippi", "Yenisei"], Attempt(),
+            )
+        self.assertIs(searched.call_args.args[0], remote)
+
+    def test_streamed_prefetch_sees_the_question(self):
+        corpus = LocalCorpus(":memory:")
+        self.addCleanup(corpus.close)
+        remote = FakeRemote()
+        gq = generate_question
+        fields = [("question", "Current top 5 ATP players by ranking points?"), ("search_query", "ATP rankings")]
+
+        def fake_stream(llm, model, on_field=None, **kwargs):
+            for key, value in fields:
+                on_field(key, value)
+            return mock.Mock(text=""), False
+
+        with mock.patch.object(gq, "tavily_search_with_retries", return_value=({"results": []}, [])) as searched, \
+                mock.patch.object(gq, "llm_stream", side_effect=fake_stream), \
+                mock.patch.object(gq, "load_llm_text", return_value=dict(fields)), \
+                mock.patch.object(gq, "fetch_source_pages"):
+            _, prefetch = gq.generate_question_streaming(None, TieredSearch(corpus, remote), "Tennis", "", Attempt())
+            prefetch["future"].result()
+        self.assertIs(searched.call_args.args[0], remote)
+        self.assertEqual(prefetch["question"], fields[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the rule-based taxonomy tagger and coverage verdicts (taxonomy.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taxonomy import CATEGORIES, WEAK_KEYWORDS, confident_categories, coverage, tag_text  # noqa: E402
+
+PENGUINS = tag_text("Which bird species has the largest population of breeding pairs?")
+STADIUMS = tag_text("Largest football stadiums by capacity")
+
+
+class TagTextTest(unittest.TestCase):
+    def test_entities_and_categories(self):
+        self.assertEqual(
+            tag_text("Top 5 clubs by Champions League titles"),
+            {"categories": ["football"], "entities": ["Champions League"]},
+        )
+
+    def test_whole_words_with_plurals(self):
+        self.assertEqual(tag_text("Countries with the most volcanoes")["categories"], ["geography"])
+        self.assertEqual(tag_text("Most-watched artistic gymnastics events")["categories"], [])
+
+    def test_single_weak_keyword_is_weak(self):
+        for text, category in [
+            ("Largest king penguin colonies", "history"),
+            ("State of the art airports", "art"),
+            ("Most popular tea varieties", "food_drink"),
+            ("Best-selling car models", "transport"),
+            ("Most downloaded app", "technology"),
+            ("Top AI labs by funding", "technology"),
+            ("Countries by space launches", "space"),
+            ("Biggest oil producers", "energy"),
+            ("Band of Brothers cast members", "music"),
+            ("Deepest sea trenches", "geography"),
+        ]:
+            with self.subTest(text=text):
+                tags = tag_text(text)
+                self.assertIn(category, tags["weak"])
+                self.assertNotIn(category, confident_categories(tags))
+
+    def test_strong_or_repeated_evidence_is_confident(self):
+        self.assertNotIn("weak", tag_text("Largest car manufacturers"))
+        self.assertNotIn("weak", tag_text("Most-watched TV series"))
+        self.assertNotIn("weak", tag_text("Countries that drink the most tea"))
+
+    def test_weak_keywords_are_in_the_lexicon(self):
+        keywords = {k for words in CATEGORIES.values() for k in words}
+        self.assertEqual(WEAK_KEYWORDS - keywords, set())
+
+
+class CoverageTest(unittest.TestCase):
+    def test_shared_entity_is_covered(self):
+        ucl = tag_text("Clubs with the most European Cup titles")
+        self.assertEqual(coverage(ucl, [STADIUMS, tag_text("Champions League top scorers")]), ("covered", [1]))
+
+    def test_ambiguous_words_name_no_entity(self):
+        for text in ["Countries producing the most apples", "Most common issues in the ISS survey",
+                     "Largest Apollo temples in Greece", "Beaches near Cannes", "Vuelta abajo tobacco farms"]:
+            with self.subTest(text=text):
+                self.assertEqual(tag_text(text).get("entities", []), [])
+        self.assertEqual(tag_text("Best-selling iPhone models")["entities"], ["Apple"])
+        self.assertEqual(tag_text("Longest Apollo missions")["entities"], ["Apollo program"])
+
+    def test_disjoint_confident_categories_are_clear(self):
+        self.assertEqual(coverage(PENGUINS, [STADIUMS]), ("clear", []))
+
+    def test_weak_tags_never_settle_clear(self):
+        king_penguins = tag_text("Largest king penguin colonies")
+        self.assertEqual(coverage(king_penguins, [PENGUINS, STADIUMS]), ("ambiguous", [0, 1]))
+
+    def test_weakly_tagged_others_stay_in_play(self):
+        self.assertEqual(coverage(PENGUINS, [STADIUMS, tag_text("Most popular tea varieties")]),
+                         ("ambiguous", [1]))
+
+    def test_untagged_is_ambiguous(self):
+        self.assertEqual(coverage(tag_text("Tallest humans ever"), [STADIUMS]), ("ambiguous", [0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Lightweight span tracing for the Factle generator.
+
+Spans nest automatically (run → attempt → verify iteration → search/LLM
+call), including across threads and asyncio tasks, because the current span
+lives in a contextvar.  A finished trace can be exported as Chrome
+trace-event JSON (open it in https://ui.perfetto.dev or chrome://tracing)
+or folded into a compact per-name summary for the run log.
+
+Usage:
+    with TRACER.span("search", query=query) as span:
+        ...
+        span["attrs"]["retries"] = 2
+
+    @traced("cross_check")
+    def cross_check(...): ...
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+CO_COROUTINE = 0x80  # inspect.CO_COROUTINE, without importing inspect at startup
+
+
+class Tracer:
+    """Collects finished spans and named counters for one process."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.counters = Counter()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Time a block as a child of the current span."""
+        parent = _current_span.get()
+        with self._lock:
+            self._next_id += 1
+            span_id = self._next_id
+        record = {
+            "id": span_id,
+            "parent": parent["id"] if parent else None,
+            "name": name,
+            "tid": threading.get_ident(),
+            "start": time.perf_counter(),
+            "end": None,
+            "attrs": attrs,
+        }
+        token = _current_span.set(record)
+        try:
+            yield record
+        except BaseException as exc:
+            record["attrs"]["error"] = type(exc).__name__
+            raise
+        finally:
+            record["end"] = time.perf_counter()
+            _current_span.reset(token)
+            with self._lock:
+                self.spans.append(record)
+
+    def annotate(self, **attrs):
+        """Attach attributes to the innermost open span, if any."""
+        record = _current_span.get()
+        if record is not None:
+            record["attrs"].update(attrs)
+
+    def count(self, name, value=1):
+        """Bump a run-wide counter (retries, sleep seconds, downgrades...)."""
+        with self._lock:
+            self.counters[name] += value
+
+    def durations(self, name):
+        """Seconds taken by each finished span called name."""
+        with self._lock:
+            return [s["end"] - s["start"] for s in self.spans if s["name"] == name]
+
+    def to_chrome_trace(self):
+        """Return the spans as a Chrome trace-event document."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                "name": s["name"],
+                "ph": "X",
+                "ts": round((s["start"] - self.origin) * 1e6),
+                "dur": round((s["end"] - s["start"]) * 1e6),
+                "pid": pid,
+                "tid": s["tid"],
+                "args": {k: _jsonable(v) for k, v in s["attrs"].items()},
+            }
+            for s in sorted(spans, key=lambda s: s["start"])
+        ]
+        events += [
+            {"name": name, "ph": "C", "ts": 0, "pid": pid, "args": {name: value}}
+            for name, value in self.counters.items()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """Write the Chrome trace-event JSON to path."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def summary(self):
+        """Aggregate finished spans by name, plus counters and elapsed time."""
+        by_name = {}
+        with self._lock:
+            spans = list(self.spans)
+            counters = dict(self.counters)
+        for s in spans:
+            duration = s["end"] - s["start"]
+            agg = by_name.setdefault(s["name"], {"count": 0, "total_s": 0.0, "max_s": 0.0})
+            agg["count"] += 1
+            agg["total_s"] += duration
+            agg["max_s"] = max(agg["max_s"], duration)
+        for agg in by_name.values():
+            agg["total_s"] = round(agg["total_s"], 3)
+            agg["max_s"] = round(agg["max_s"], 3)
+        return {
+            "elapsed_s": round(time.perf_counter() - self.origin, 3),
+            "spans": dict(sorted(by_name.items(), key=lambda kv: -kv[1]["total_s"])),
+            "counters": {k: round(v, 3) for k, v in counters.items()},
+        }
+
+
+def _jsonable(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+TRACER = Tracer()
+
+
+def traced(name):
+    """Decorator that wraps each call of a sync or async function in a span."""
+    def decorate(func):
+        if func.__code__.co_flags & CO_COROUTINE:
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with TRACER.span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
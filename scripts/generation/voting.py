@@ -0,0 +1,128 @@
+"""
+Rank aggregation over several independent cross-check verdicts.
+
+A single cross-check verdict on an ambiguous ranking can flip between
+rounds.  Instead of re-asking one judge in sequence, the pipeline can ask
+several at once (sampled completions of the same cross-check prompt) and
+aggregate their rankings here:
+
+    - a VERIFIED verdict votes for the proposed order, a CORRECTED one for
+      its corrected order; UNVERIFIABLE or malformed verdicts abstain
+    - the consensus is the Kemeny ranking (the order that agrees with the
+      most pairwise preferences over all ballots), found exhaustively over
+      the top KEMENY_MAX_ITEMS candidates by Borda count
+    - confidence is the share of pairwise orderings in the consensus top 5
+      that the votes agree with, abstentions counting as disagreement
+
+Usage:
+    vote = aggregate_votes(verdicts, proposed_answers)
+    if vote["order"] and vote["confidence"] >= 0.7:
+        answers, values = vote["order"], vote["values"]
+"""
+
+from itertools import combinations, permutations
+from statistics import median
+
+KEMENY_MAX_ITEMS = 7   # 7! = 5040 orderings; more candidates are cut by Borda count first
+
+
+def _key(name):
+    return " ".join(str(name).split()).casefold()
+
+
+def ballot_from_verdict(verdict, answers, size=5):
+    """(ranking, values) a cross-check verdict votes for, or None to abstain."""
+    status = str((verdict or {}).get("status", "")).strip().upper()
+    if status == "VERIFIED":
+        return list(answers), verdict.get("answer_values")
+    if status == "CORRECTED":
+        corrected = verdict.get("corrected_answers") or []
+        if len(corrected) == size:
+            return list(corrected), verdict.get("corrected_values")
+    return None
+
+
+def _prefers(ranks, a, b):
+    """Whether a ballot ({key: position}) ranks a above b; unranked items
+    sit below every ranked one."""
+    if a in ranks:
+        return b not in ranks or ranks[a] < ranks[b]
+    return False
+
+
+def borda(ballots, keys):
+    """Borda score per key: one point for each candidate ranked below it."""
+    scores = dict.fromkeys(keys, 0)
+    for ranks in ballots:
+        for a in keys:
+            scores[a] += sum(1 for b in keys if b != a and _prefers(ranks, a, b))
+    return scores
+
+
+def kemeny(ballots, keys):
+    """The ordering of keys that agrees with the most ballot pairwise
+    preferences (ties broken by Borda order)."""
+    wins = {(a, b): sum(1 for ranks in ballots if _prefers(ranks, a, b)) for a in keys for b in keys if a != b}
+    best, best_score = list(keys), -1
+    for order in permutations(keys):
+        score = sum(wins[a, b] for a, b in combinations(order, 2))
+        if score > best_score:
+            best, best_score = list(order), score
+    return best
+
+
+def aggregate_votes(verdicts, answers, size=5):
+    """Aggregate cross-check verdicts into one ranking with a confidence.
+
+    Returns a dict:
+        order:      consensus top `size` answers (None if every vote abstained)
+        values:     per answer in order, the median value the votes reported
+        confidence: 0..1 pairwise agreement of all votes with order
+        votes, abstained, agreeing (votes for exactly this order), borda
+    """
+    names = {}
+    for name in answers:
+        names.setdefault(_key(name), name)
+    ballots, reported = [], {}
+    for verdict in verdicts:
+        ballot = ballot_from_verdict(verdict, answers, size)
+        if ballot is None:
+            continue
+        ranking, values = ballot
+        ranks = {}
+        for i, name in enumerate(ranking):
+            key = _key(name)
+            names.setdefault(key, name)
+            ranks.setdefault(key, i)
+            value = values[i] if isinstance(values, list) and i < len(values) else None
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                reported.setdefault(key, []).append(value)
+        ballots.append(ranks)
+
+    report = {
+        "order": None,
+        "values": None,
+        "confidence": 0.0,
+        "votes": len(verdicts),
+        "abstained": len(verdicts) - len(ballots),
+        "agreeing": 0,
+        "borda": {},
+    }
+    if not ballots:
+        return report
+
+    keys = [k for k in names if any(k in ranks for ranks in ballots)]
+    scores = borda(ballots, keys)
+    keys.sort(key=lambda k: -scores[k])
+    order = kemeny(ballots, keys[:KEMENY_MAX_ITEMS])[:size]
+
+    pairs = list(combinations(order, 2))
+    agreement = sum(sum(1 for a, b in pairs if _prefers(ranks, a, b)) / len(pairs) for ranks in ballots)
+    report.update(
+        order=[names[k] for k in order],
+        values=[median(reported[k]) if k in reported else None for k in order],
+        confidence=round(agreement / len(verdicts), 3),
+        agreeing=sum(1 for ranks in ballots if sorted(ranks, key=ranks.get)[:size] == order),
+        borda={names[k]: scores[k] for k in keys},
+    )
+    return report